@@ -185,6 +185,23 @@ def neptune_graph_only(func):
     return check_neptune_graph
 
 
+def cached_parser(func):
+    """
+    Caches the argument parser built by a magic's parser method on the magic instance, by the arguments of the method,
+    so that magics run repeatedly, such as in a loop or a batch job, do not rebuild their parser and its help text on
+    every cell. The parsers must not be modified after they are built.
+    """
+    @functools.wraps(func)
+    def get_cached_parser(self, *args):
+        key = (func.__name__,) + args
+        parser = self._parsers.get(key)
+        if parser is None:
+            parser = self._parsers[key] = func(self, *args)
+        return parser
+
+    return get_cached_parser
+
+
 def http_ex_to_html(http_ex: HTTPError):
     try:
         error = json.loads(http_ex.response.content.decode('utf-8'))
@@ -0,0 +1,46 @@
+"""
+Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import importlib
+import importlib.util
+import sys
+import threading
+import types
+
+
+class LazyModule(types.ModuleType):
+    """
+    Stands in for a module which is only imported when one of its attributes is first used. The attributes of the
+    module are then copied onto this one, so that later lookups cost the same as they would on the module itself.
+    """
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self._lazy_import_lock = threading.Lock()
+
+    def __getattr__(self, attr):
+        # only called for attributes that have not been copied from the module yet
+        with self._lazy_import_lock:
+            module = importlib.import_module(self.__name__)
+            self.__dict__.update(module.__dict__)
+        return getattr(module, attr)
+
+    def __repr__(self):
+        return f"<lazy module '{self.__name__}'>"
+
+
+def lazy_import(name: str) -> types.ModuleType:
+    """
+    Returns the module with the given name if it has already been imported, or else a LazyModule which imports it on
+    first use. Used for the dependencies which only some magics need, and which take a large share of the time to load
+    the magics when imported eagerly.
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    # fail on import as before if the module is not installed, rather than on first use
+    if importlib.util.find_spec(name) is None:
+        raise ModuleNotFoundError(f"No module named '{name}'", name=name)
+    return LazyModule(name)
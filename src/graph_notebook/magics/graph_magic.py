@@ -4,6 +4,7 @@ SPDX-License-Identifier: Apache-2.0
 """
 
 from __future__ import print_function  # Python 2/3 compatibility
+from __future__ import annotations  # annotations such as pd.DataFrame must not import pandas
 
 import argparse
 import base64
@@ -19,8 +20,6 @@ import sys
 import math
 
 import numpy as np
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 from pygments import highlight
 from pygments.lexers import JsonLexer
 from pygments.formatters import HtmlFormatter
@@ -32,15 +31,10 @@ from enum import Enum
 from copy import copy
 from sys import maxsize
 from json import JSONDecodeError
-from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from graph_notebook.network.opencypher.OCNetwork import OCNetwork
 
 import ipywidgets as widgets
-import pandas as pd
-import itables.options as opt
-from itables import show, JavascriptFunction, init_notebook_mode
-from SPARQLWrapper import SPARQLWrapper
-from botocore.session import get_session
 from gremlin_python.driver.protocol import GremlinServerError
 from gremlin_python.structure.graph import Path
 from gremlin_python.structure.io.graphsonV3d0 import GraphSONReader
@@ -51,10 +45,11 @@ from requests import HTTPError
 from json_repair import repair_json
 
 import graph_notebook
+from graph_notebook.lazy_import import lazy_import
 from graph_notebook.configuration.generate_config import generate_default_config, DEFAULT_CONFIG_LOCATION, \
     AuthModeEnum, Configuration
 from graph_notebook.decorators.decorators import display_exceptions, magic_variables, \
-    neptune_db_only, neptune_graph_only
+    neptune_db_only, neptune_graph_only, cached_parser
 from graph_notebook.magics.ml import neptune_ml_magic_handler, generate_neptune_ml_parser
 from graph_notebook.magics.streams import StreamViewer
 from graph_notebook.neptune.client import (ClientBuilder, Client, PARALLELISM_OPTIONS, PARALLELISM_HIGH, \
@@ -69,17 +64,33 @@ from graph_notebook.neptune.client import (ClientBuilder, Client, PARALLELISM_OP
     GREMLIN_PROTOCOL_FORMATS, DEFAULT_HTTP_PROTOCOL, DEFAULT_WS_PROTOCOL, GRAPHSONV4_UNTYPED, \
     GREMLIN_SERIALIZERS_WS, get_gremlin_serializer_mime, normalize_protocol_name, generate_snapshot_name)
 from graph_notebook.network import SPARQLNetwork
+from graph_notebook.network.clustering import NetworkClusters
+from graph_notebook.network.layout import apply_precomputed_layout
 from graph_notebook.neptune.utils import serialize_query_params
+from graph_notebook.neptune.sparql_results import SPARQLResultsReader, SPARQL_RESULTS_CHUNK_SIZE
+from graph_notebook.neptune.jolt import read_jolt_results, is_jolt_response, JOLT_CHUNK_SIZE
 from graph_notebook.network.gremlin.GremlinNetwork import parse_pattern_list_str, GremlinNetwork
 from graph_notebook.visualization.rows_and_columns import sparql_get_rows_and_columns, opencypher_get_rows_and_columns
+from graph_notebook.visualization.result_export import export_rows, get_streaming_export_format
+from graph_notebook.visualization.result_table import build_gremlin_results_df, build_results_df, escape_html_values, \
+    unescape_html_df
 from graph_notebook.visualization.template_retriever import retrieve_template
 from graph_notebook.configuration.get_config import get_config, get_config_from_dict
-from graph_notebook.seed.load_query import get_data_sets, get_queries, normalize_model_name, normalize_language_name
-from graph_notebook.widgets import Force
-from graph_notebook.options import OPTIONS_DEFAULT_DIRECTED, vis_options_merge
+from graph_notebook.seed.load_query import get_data_sets, get_queries, normalize_model_name, normalize_language_name, \
+    remove_seed_files
+from graph_notebook.seed.seed_runner import SeedRunner, DEFAULT_SEED_CONCURRENCY, DEFAULT_SEED_BATCH_SIZE, \
+    classify_gremlin_line, gremlin_batch_key, combine_gremlin_lines, classify_opencypher_line, opencypher_batch_key, \
+    combine_opencypher_lines
+from graph_notebook.widgets import Force, PaginatedTable
+from graph_notebook.options import OPTIONS_DEFAULT_DIRECTED, OPTIONS_PRECOMPUTED_LAYOUT, vis_options_merge
 from graph_notebook.magics.metadata import build_sparql_metadata_from_query, build_gremlin_metadata_from_query, \
     build_opencypher_metadata_from_query
 
+# dependencies which only some magics use, and which are imported when first used rather than with the magics
+pd = lazy_import('pandas')
+go = lazy_import('plotly.graph_objects')
+itables = lazy_import('itables')
+
 _JSON_LEXER = JsonLexer()
 _JSON_FORMATTER = HtmlFormatter(noclasses=True, nobackground=True, style='default')
 
@@ -115,9 +126,6 @@ UNRESTRICTED_LAYOUT = widgets.Layout()
 
 DEFAULT_PAGINATION_OPTIONS = [10, 25, 50, 100, -1]
 DEFAULT_PAGINATION_MENU = [10, 25, 50, 100, "All"]
-opt.order = []
-opt.maxBytes = 0
-opt.classes = ["display", "hover", "nowrap"]
 index_col_js = """
             function (td, cellData, rowData, row, col) {
                 $(td).css('font-weight', 'bold');
@@ -146,8 +154,11 @@ RESULTS_EXPORT_OPTIONS = {
 
 JSON_FORMAT = "json"
 PANDAS_FORMATS = ["pd", "pandas", "df", "dataframe"]
+
+LAYOUT_PHYSICS = 'physics'
+LAYOUT_PRECOMPUTED = 'precomputed'
+LAYOUT_OPTIONS = [LAYOUT_PHYSICS, LAYOUT_PRECOMPUTED]
 QUERY_STORE_TO_FORMATS = PANDAS_FORMATS + [JSON_FORMAT]
-DT_HTML_CHAR_MAP = {"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#39;"}
 
 logging.basicConfig()
 root_logger = logging.getLogger()
@@ -187,6 +198,9 @@ DEFAULT_BASE_URI = "http://aws.amazon.com/neptune/default"
 RDF_LOAD_FORMATS = [FORMAT_NTRIPLE, FORMAT_NQUADS, FORMAT_RDFXML, FORMAT_TURTLE, FORMAT_PARQUET]
 BASE_URI_FORMATS = [FORMAT_RDFXML, FORMAT_TURTLE]
 DEFAULT_LOAD_CONCURRENCY = 1
+DEFAULT_LOAD_STATUS_CONCURRENCY = 8
+LOAD_STATUS_CACHE_TTL = 30  # seconds
+LOAD_STATUS_RENDER_INTERVAL = 0.5  # seconds
 
 MEDIA_TYPE_SPARQL_JSON = "application/sparql-results+json"
 MEDIA_TYPE_SPARQL_XML = "application/sparql-results+xml"
@@ -247,6 +261,24 @@ def validate_arg_with_warning(args, arg_name, condition, warning_msg, default_va
         return False
     return True
  
+def seed_error_content(exception):
+    if isinstance(exception, GremlinServerError):
+        try:
+            error = json.loads(exception.args[0][5:])  # remove the leading error code.
+            return json.dumps(error, indent=2)
+        except Exception:
+            pass
+    elif isinstance(exception, HTTPError):
+        try:
+            error = json.loads(exception.response.content.decode('utf-8'))
+            return json.dumps(error, indent=2)
+        except Exception:
+            pass
+    return {
+        'error': str(exception)
+    }
+
+
 def generate_seed_error_msg(error_content, file_name, line_index=None):
     error_message = f"Terminated seed due to error in file {file_name}"
     if line_index:
@@ -298,6 +330,8 @@ ACTION_TO_QUERY_TYPE = {
 
 
 def get_query_type(query):
+    from SPARQLWrapper import SPARQLWrapper
+
     s = SPARQLWrapper('')
     s.setQuery(query)
     return s.queryType
@@ -315,15 +349,7 @@ def query_type_to_action(query_type):
 def oc_results_df(oc_res, oc_res_format: str = None):
     rows_and_columns = opencypher_get_rows_and_columns(oc_res, oc_res_format)
     if rows_and_columns:
-        results_df = pd.DataFrame(rows_and_columns['rows']).convert_dtypes()
-        results_df = results_df.astype(str)
-        results_df = results_df.map(lambda x: encode_html_chars(x))
-        col_0_value = range(1, len(results_df) + 1)
-        results_df.insert(0, "#", col_0_value)
-        for col_index, col_name in enumerate(rows_and_columns['columns']):
-            results_df.rename({results_df.columns[col_index + 1]: col_name},
-                              axis='columns',
-                              inplace=True)
+        results_df = build_results_df(rows_and_columns['rows'], rows_and_columns['columns'])
         has_results = True
     else:
         results_df = None
@@ -331,6 +357,17 @@ def oc_results_df(oc_res, oc_res_format: str = None):
     return results_df, has_results
 
 
+def init_itables(connected: bool = False):
+    """
+    Sets the options of the itables results tables and loads its resources. itables, which imports pandas, is loaded by
+    the first call of this.
+    """
+    itables.options.order = []
+    itables.options.maxBytes = 0
+    itables.options.classes = ["display", "hover", "nowrap"]
+    itables.init_notebook_mode(connected=connected)
+
+
 def results_per_page_check(results_per_page):
     if results_per_page < 1:
         return 1
@@ -355,24 +392,17 @@ def generate_pagination_vars(visible_results: int):
 
 
 def encode_html_chars(result):
-    fixed_result = str(result)
-
-    for k, v in iter(DT_HTML_CHAR_MAP.items()):
-        fixed_result = fixed_result.replace(k, v)
-
-    return fixed_result
+    return escape_html_values([result])[0]
 
 
 def decode_html_chars(results_df: pd.DataFrame = None) -> pd.DataFrame:
-    for k, v in iter(DT_HTML_CHAR_MAP.items()):
-        results_df = results_df.map(lambda x: x.replace(v, k))
-
-    return results_df
+    return unescape_html_df(results_df)
 
 
 def process_df_for_store(language: str = None, results_df: pd.DataFrame = None) -> pd.DataFrame:
     if language == 'sparql':
-        results_df_final = results_df.drop("#", axis=1)
+        results_df = results_df.drop("#", axis=1)
+        results_df_final = decode_html_chars(results_df)
     elif language == 'gremlin':
         results_df.index = results_df.index - 1
         results_df.columns.name = None
@@ -407,6 +437,33 @@ def export_csv_results(export_path: str = "results.csv", results_df: pd.DataFram
     return
 
 
+def export_streamed_results(export_path: str, columns, rows):
+    if export_path == '' or get_streaming_export_format(export_path) is None:
+        return
+
+    try:
+        export_rows(export_path, columns, rows)
+    except ImportError:
+        print("Parquet export requires the pyarrow package. Please install it, or export to .jsonl or .csv.gz.")
+    except OSError:
+        print("Export failed. Please check that the path provided to --export-to is valid.")
+    except (TypeError, ValueError, OverflowError) as e:
+        print(f"Export failed, the query results could not be written to {export_path}: {e}")
+
+
+def build_paginated_table(results_df: pd.DataFrame, results_per_page: int, hide_index: bool = False) -> PaginatedTable:
+    visible_results, final_pagination_options, final_pagination_menu = generate_pagination_vars(results_per_page)
+    return PaginatedTable(results_df,
+                          page_size=visible_results,
+                          page_size_options=final_pagination_options,
+                          page_size_labels=final_pagination_menu,
+                          hide_index=hide_index)
+
+
+def display_paginated_table(results_df: pd.DataFrame, results_per_page: int, hide_index: bool = False):
+    display(build_paginated_table(results_df, results_per_page, hide_index))
+
+
 def get_load_ids(neptune_client):
     load_status = neptune_client.load_status()
     load_status.raise_for_status()
@@ -417,6 +474,41 @@ def get_load_ids(neptune_client):
     return ids, res
 
 
+def fetch_load_statuses(neptune_client, load_ids: list, max_workers: int = DEFAULT_LOAD_STATUS_CONCURRENCY,
+                        cache: dict = None, cache_ttl: float = LOAD_STATUS_CACHE_TTL):
+    """
+    Yields (index, load_id, status) for each of load_ids, in the order the responses arrive. Statuses are fetched
+    on a bounded thread pool, and served from cache instead if they were fetched less than cache_ttl seconds ago.
+    """
+    now = time.monotonic()
+    pending = []
+    for index, load_id in enumerate(load_ids):
+        cached = cache.get(load_id) if cache is not None else None
+        if cached is not None and now - cached[0] < cache_ttl:
+            yield index, load_id, cached[1]
+        else:
+            pending.append((index, load_id))
+    if not pending:
+        return
+
+    def fetch(load_id):
+        load_status_res = neptune_client.load_status(load_id)
+        load_status_res.raise_for_status()
+        return load_status_res.json()
+
+    executor = ThreadPoolExecutor(max_workers=max(1, max_workers))
+    try:
+        futures = {executor.submit(fetch, load_id): (index, load_id) for index, load_id in pending}
+        for future in as_completed(futures):
+            index, load_id = futures[future]
+            status = future.result()
+            if cache is not None:
+                cache[load_id] = (time.monotonic(), status)
+            yield index, load_id, status
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
 def process_statistics_400(response, is_summary: bool = False, is_analytics: bool = False):
     bad_request_res = json.loads(response.text)
     res_code = bad_request_res['code']
@@ -463,6 +555,9 @@ class Graph(Magics):
         # You must call the parent constructor
         super(Graph, self).__init__(shell)
 
+        # argument parsers of the magics, built on first use by the methods decorated with @cached_parser
+        self._parsers = {}
+
         self.neptune_cfg_allowlist = copy(NEPTUNE_CONFIG_HOST_IDENTIFIERS)
         self.neptune_client_endpoint_url = None
         self.graph_notebook_config = generate_default_config()
@@ -484,6 +579,7 @@ class Graph(Magics):
     def _generate_client_from_config(self, config: Configuration):
         if self.client:
             self.client.close()
+        self._load_status_cache = {}
 
         is_neptune_host = is_allowed_neptune_host(hostname=config.host, host_allowlist=self.neptune_cfg_allowlist)
 
@@ -500,6 +596,7 @@ class Graph(Magics):
                 .with_sparql_path(config.sparql.path) \
                 .with_gremlin_serializer(config.gremlin.message_serializer)
             if config.auth_mode == AuthModeEnum.IAM:
+                from botocore.session import get_session
                 builder = builder.with_iam(get_session())
             if self.neptune_cfg_allowlist != NEPTUNE_CONFIG_HOST_IDENTIFIERS:
                 builder = builder.with_custom_neptune_hosts(self.neptune_cfg_allowlist)
@@ -520,11 +617,8 @@ class Graph(Magics):
 
         self.client = builder.build()
 
-    @magic_variables
-    @line_cell_magic
-    @needs_local_scope
-    @display_exceptions
-    def graph_notebook_config(self, line='', cell='', local_ns: dict = None):
+    @cached_parser
+    def _graph_notebook_config_parser(self) -> argparse.ArgumentParser:
         parser = argparse.ArgumentParser()
         parser.add_argument('mode', nargs='?', default='show',
                             help='mode (default=show) [show|reset|silent]')
@@ -532,6 +626,14 @@ class Graph(Magics):
                             help='Export the configuration JSON object to the provided file path.')
         parser.add_argument('--store-to', type=str, default='', help='store query result to this variable')
         parser.add_argument('--silent', action='store_true', default=False, help="Display no output.")
+        return parser
+
+    @magic_variables
+    @line_cell_magic
+    @needs_local_scope
+    @display_exceptions
+    def graph_notebook_config(self, line='', cell='', local_ns: dict = None):
+        parser = self._graph_notebook_config_parser()
         args = parser.parse_args(line.split())
 
         if cell != '':
@@ -567,11 +669,16 @@ class Graph(Magics):
 
         return self.graph_notebook_config
 
-    @line_cell_magic
-    def neptune_config_allowlist(self, line='', cell=''):
+    @cached_parser
+    def _neptune_config_allowlist_parser(self) -> argparse.ArgumentParser:
         parser = argparse.ArgumentParser()
         parser.add_argument('mode', nargs='?', default='add',
                             help='mode (default=add) [add|remove|overwrite|reset]')
+        return parser
+
+    @line_cell_magic
+    def neptune_config_allowlist(self, line='', cell=''):
+        parser = self._neptune_config_allowlist_parser()
         args = parser.parse_args(line.split())
 
         try:
@@ -628,16 +735,20 @@ class Graph(Magics):
         self._generate_client_from_config(self.graph_notebook_config)
 
 
-    @line_magic
-    @neptune_db_only
-    def stream_viewer(self, line):
+    @cached_parser
+    def _stream_viewer_parser(self) -> argparse.ArgumentParser:
         parser = argparse.ArgumentParser()
         parser.add_argument('language', nargs='?', default=STREAM_PG,
                             help=f'language  (default={STREAM_PG}) [{STREAM_PG}|{STREAM_RDF}]',
                             choices=[STREAM_PG, STREAM_RDF])
 
         parser.add_argument('--limit', type=int, default=10, help='Maximum number of rows to display at a time')
+        return parser
 
+    @line_magic
+    @neptune_db_only
+    def stream_viewer(self, line):
+        parser = self._stream_viewer_parser()
         args = parser.parse_args(line.split())
 
         language = args.language
@@ -646,11 +757,8 @@ class Graph(Magics):
         viewer = StreamViewer(self.client, uri, language, limit=limit)
         viewer.show()
 
-    @line_magic
-    @needs_local_scope
-    @display_exceptions
-    @neptune_db_only
-    def statistics(self, line, local_ns: dict = None):
+    @cached_parser
+    def _statistics_parser(self) -> argparse.ArgumentParser:
         parser = argparse.ArgumentParser()
         parser.add_argument('language', nargs='?', type=str.lower, default="propertygraph",
                             help=f'The language endpoint to use. Valid inputs: {STATISTICS_LANGUAGE_INPUTS}. '
@@ -662,7 +770,14 @@ class Graph(Magics):
         parser.add_argument('--summary', action='store_true', default=False, help="Retrieves the graph summary.")
         parser.add_argument('--silent', action='store_true', default=False, help="Display no output.")
         parser.add_argument('--store-to', type=str, default='')
+        return parser
 
+    @line_magic
+    @needs_local_scope
+    @display_exceptions
+    @neptune_db_only
+    def statistics(self, line, local_ns: dict = None):
+        parser = self._statistics_parser()
         args = parser.parse_args(line.split())
         mode = args.mode
 
@@ -692,10 +807,8 @@ class Graph(Magics):
 
         store_to_ns(args.store_to, statistics_res_json, local_ns)
 
-    @line_magic
-    @needs_local_scope
-    @display_exceptions
-    def summary(self, line, local_ns: dict = None):
+    @cached_parser
+    def _summary_parser(self) -> argparse.ArgumentParser:
         parser = argparse.ArgumentParser()
         parser.add_argument('language', nargs='?', type=str.lower, default="propertygraph",
                             help=f'The language endpoint to use. Valid inputs: {STATISTICS_LANGUAGE_INPUTS}. '
@@ -706,7 +819,13 @@ class Graph(Magics):
                                  "we will default to the basic summary display mode.")
         parser.add_argument('--silent', action='store_true', default=False, help="Display no output.")
         parser.add_argument('--store-to', type=str, default='')
+        return parser
 
+    @line_magic
+    @needs_local_scope
+    @display_exceptions
+    def summary(self, line, local_ns: dict = None):
+        parser = self._summary_parser()
         args = parser.parse_args(line.split())
         if args.detailed:
             mode = "detailed"
@@ -735,18 +854,22 @@ class Graph(Magics):
 
         store_to_ns(args.store_to, summary_res_json, local_ns)
 
-    @line_magic
-    @needs_local_scope
-    @display_exceptions
-    @neptune_graph_only
-    def graph_pg_info(self, line='', local_ns: dict = None):
+    @cached_parser
+    def _graph_pg_info_parser(self) -> argparse.ArgumentParser:
         parser = argparse.ArgumentParser()
         parser.add_argument('-m', '--metric', type=str, default='',
                             help=f'Metric to display the count of. If not specified, all available metrics and their '
                                  f'counts will be returned.  Valid inputs: {GRAPH_PG_INFO_METRICS}')
         parser.add_argument('--silent', action='store_true', default=False, help="Display no output.")
         parser.add_argument('--store-to', type=str, default='')
+        return parser
 
+    @line_magic
+    @needs_local_scope
+    @display_exceptions
+    @neptune_graph_only
+    def graph_pg_info(self, line='', local_ns: dict = None):
+        parser = self._graph_pg_info_parser()
         args = parser.parse_args(line.split())
 
         if args.metric in GRAPH_PG_INFO_METRICS:
@@ -780,12 +903,8 @@ class Graph(Magics):
         self._generate_client_from_config(self.graph_notebook_config)
         print(f'set service name to {self.graph_notebook_config.neptune_service}')
 
-    @magic_variables
-    @cell_magic
-    @needs_local_scope
-    @display_exceptions
-    @neptune_db_only
-    def sparql(self, line='', cell='', local_ns: dict = None):
+    @cached_parser
+    def _sparql_parser(self) -> argparse.ArgumentParser:
         parser = argparse.ArgumentParser()
         parser.add_argument('query_mode', nargs='?', default='query',
                             help='query mode (default=query) [query|explain]')
@@ -825,12 +944,23 @@ class Graph(Magics):
                             help=f'Configures export type when using --store-to with base query mode. '
                                  f'Valid inputs: {QUERY_STORE_TO_FORMATS}. Default is JSON')
         parser.add_argument('--export-to', type=str, default='',
-                            help='Export the base query mode CSV result to the provided file path.')
+                            help='Export the base query mode CSV result to the provided file path. Paths ending in '
+                                 '.parquet, .jsonl or .csv.gz are instead written in that format directly from the '
+                                 'query results, in chunks, even with --silent.')
         parser.add_argument('--ignore-groups', action='store_true', default=False, help="Ignore all grouping options")
         parser.add_argument('-sp', '--stop-physics', action='store_true', default=False,
                             help="Disable visualization physics after the initial simulation stabilizes.")
         parser.add_argument('-sd', '--simulation-duration', type=int, default=1500,
                             help='Specifies maximum duration of visualization physics simulation. Default is 1500ms')
+        parser.add_argument('--layout', type=str.lower, choices=LAYOUT_OPTIONS, default=LAYOUT_PHYSICS,
+                            help=f'How to lay out the nodes of the graph visualization. {LAYOUT_PHYSICS} runs the '
+                                 f'physics simulation in the browser. {LAYOUT_PRECOMPUTED} computes the node positions '
+                                 f'in the kernel and disables physics, which renders large graphs much faster. '
+                                 f'Default is {LAYOUT_PHYSICS}.')
+        parser.add_argument('--max-nodes', type=int, default=0,
+                            help='Maximum number of nodes to draw in the graph visualization. Larger graphs are '
+                                 'collapsed into one node per group, which can be expanded by double-clicking it. '
+                                 'Default is 0, for no limit.')
         parser.add_argument('--silent', action='store_true', default=False, help="Display no query output.")
         parser.add_argument('-ct', '--connected-table', action='store_true', default=False,
                             help=f'Dynamically load jQuery and DataTables resources for iTables. For more information, see: '
@@ -841,6 +971,21 @@ class Graph(Magics):
                             help="Display the entire output without a scroll bar.")
         parser.add_argument('--hide-index', action='store_true', default=False,
                             help="Hide the index column numbers when displaying the results.")
+        parser.add_argument('--server-pagination', action='store_true', default=False,
+                            help="Keep the results in the kernel, and only send the page of results being viewed to "
+                                 "the browser. Recommended for large result sets.")
+        parser.add_argument('--limit-rows', type=int, default=0,
+                            help=f'Stop reading {MEDIA_TYPE_SPARQL_JSON} results after this many rows, and close the '
+                                 f'response without downloading the rest. Default is 0, for no limit.')
+        return parser
+
+    @magic_variables
+    @cell_magic
+    @needs_local_scope
+    @display_exceptions
+    @neptune_db_only
+    def sparql(self, line='', cell='', local_ns: dict = None):
+        parser = self._sparql_parser()
         args = parser.parse_args(line.split())
         mode = str_to_query_mode(args.query_mode)
 
@@ -866,6 +1011,7 @@ class Graph(Magics):
         path = args.path if args.path != '' else self.graph_notebook_config.sparql.path
         logger.debug(f'using mode={mode}')
         results_df = None
+        rows_and_columns = None
         if mode == QueryMode.EXPLAIN:
             res = self.client.sparql_explain(cell, args.explain_type, args.explain_format, path=path)
             res.raise_for_status()
@@ -908,21 +1054,34 @@ class Graph(Magics):
             else:
                 headers = {'Accept': result_type}
 
-            query_res = self.client.sparql(cell, path=path, headers=headers)
+            query_res = self.client.sparql(cell, path=path, headers=headers, stream=True)
 
             try:
                 query_res.raise_for_status()
             except HTTPError:
                 # Catching all 400 response errors here to try and fix possible invalid media type for db in headers.
                 # Retry query once with RDF spec default media type.
+                query_res.close()
                 result_type = MEDIA_TYPE_SPARQL_JSON if query_type == 'SELECT' else MEDIA_TYPE_NTRIPLES
-                query_res = self.client.sparql(cell, path=path, headers={'Accept': result_type})
+                query_res = self.client.sparql(cell, path=path, headers={'Accept': result_type}, stream=True)
                 query_res.raise_for_status()
 
-            try:
-                results = query_res.json()
-            except Exception:
-                results = query_res.content.decode('utf-8')
+            resp_size = None
+            if result_type == MEDIA_TYPE_SPARQL_JSON and args.limit_rows > 0:
+                # stop downloading the response once enough bindings have been read
+                reader = SPARQLResultsReader(query_res.iter_content(SPARQL_RESULTS_CHUNK_SIZE), args.limit_rows)
+                results = reader.read()
+                resp_size = reader.bytes_read
+                if reader.truncated:
+                    query_res.close()
+                    if not args.silent:
+                        print(f'Only the first {args.limit_rows} rows of the results were read (--limit-rows).')
+            else:
+                try:
+                    results = query_res.json()
+                except Exception:
+                    results = query_res.content.decode('utf-8')
+            rows_and_columns = sparql_get_rows_and_columns(results)
 
             if not args.silent:
                 # Assign an empty value so we can always display to table output.
@@ -963,27 +1122,15 @@ class Graph(Magics):
 
                             logger.debug(f'number of nodes is {len(sn.graph.nodes)}')
                             if len(sn.graph.nodes) > 0:
-                                self.graph_notebook_vis_options['physics']['disablePhysicsAfterInitialSimulation'] \
-                                    = args.stop_physics
-                                self.graph_notebook_vis_options['physics']['simulationDuration'] = args.simulation_duration
-                                f = Force(network=sn, options=self.graph_notebook_vis_options)
+                                f = self.build_force_widget(sn, args)
                                 titles.append('Graph')
                                 children.append(f)
                                 logger.debug('added sparql network to tabs')
 
-                            rows_and_columns = sparql_get_rows_and_columns(results)
                             if rows_and_columns is not None:
-                                results_df = pd.DataFrame(rows_and_columns['rows']).convert_dtypes()
-                                results_df = results_df.astype(str)
-                                results_df = results_df.map(lambda x: encode_html_chars(x))
-                                results_df.insert(0, "#", range(1, len(results_df) + 1))
-                                for col_index, col_name in enumerate(rows_and_columns['columns']):
-                                    try:
-                                        results_df.rename({results_df.columns[col_index + 1]: col_name},
-                                                        axis='columns',
-                                                        inplace=True)
-                                    except IndexError:
-                                        results_df.insert(col_index + 1, col_name, [])
+                                # binding values are always strings, so there are no dtypes to convert
+                                results_df = build_results_df(rows_and_columns['rows'], rows_and_columns['columns'],
+                                                              convert_types=False)
 
                             # Handling CONSTRUCT and DESCRIBE on their own because we want to maintain the previous result
                             # pattern of showing a tsv with each line being a result binding in addition to new ones.
@@ -1005,7 +1152,8 @@ class Graph(Magics):
                     children.append(json_output)
                     titles.append('JSON')
 
-                sparql_metadata = build_sparql_metadata_from_query(query_type='query', res=query_res, results=results)
+                sparql_metadata = build_sparql_metadata_from_query(query_type='query', res=query_res, results=results,
+                                                                   resp_size=resp_size)
 
         if not args.silent:
             metadata_output = widgets.Output(layout=sparql_layout)
@@ -1027,51 +1175,54 @@ class Graph(Magics):
 
             if results_df is not None:
                 with first_tab_output:
-                    visible_results, final_pagination_options, final_pagination_menu = generate_pagination_vars(
-                        args.results_per_page)
-                    sparql_columndefs = [
-                        {"type": "string", "targets": "_all"},
-                        {"width": "5%", "targets": 0},
-                        {"visible": True, "targets": 0},
-                        {"searchable": False, "targets": 0},
-                        {"className": "nowrap dt-left", "targets": "_all"},
-                        {"createdCell": JavascriptFunction(index_col_js), "targets": 0},
-                        {"createdCell": JavascriptFunction(cell_style_js), "targets": "_all"}
-                    ]
-                    if args.hide_index:
-                        sparql_columndefs[1]["visible"] = False
-                    init_notebook_mode(connected=args.connected_table)
-                    show(results_df,
-                         connected=args.connected_table,
-                         scrollX=True,
-                         scrollY=sparql_scrollY,
-                         columnDefs=sparql_columndefs,
-                         paging=sparql_paging,
-                         scrollCollapse=sparql_scrollCollapse,
-                         lengthMenu=[final_pagination_options, final_pagination_menu],
-                         pageLength=visible_results,
-                         buttons=[
-                             "pageLength",
-                             {
-                                 "extend": "copyHtml5",
-                                 "text": "Copy",
-                                 "exportOptions": RESULTS_EXPORT_OPTIONS
-                             },
-                             {
-                                 "extend": "csvHtml5",
-                                 "title": SPARQL_RESULTS_FILENAME,
-                                 "text": "Download CSV",
-                                 "exportOptions": RESULTS_EXPORT_OPTIONS
-                             },
-                             {
-                                 "extend": "excelHtml5",
-                                 "filename": SPARQL_RESULTS_FILENAME,
-                                 "title": None,
-                                 "text": "Download XLSX",
-                                 "exportOptions": RESULTS_EXPORT_OPTIONS
-                             }
-                         ]
-                         )
+                    if args.server_pagination:
+                        display_paginated_table(results_df, args.results_per_page, args.hide_index)
+                    else:
+                        visible_results, final_pagination_options, final_pagination_menu = generate_pagination_vars(
+                            args.results_per_page)
+                        sparql_columndefs = [
+                            {"type": "string", "targets": "_all"},
+                            {"width": "5%", "targets": 0},
+                            {"visible": True, "targets": 0},
+                            {"searchable": False, "targets": 0},
+                            {"className": "nowrap dt-left", "targets": "_all"},
+                            {"createdCell": itables.JavascriptFunction(index_col_js), "targets": 0},
+                            {"createdCell": itables.JavascriptFunction(cell_style_js), "targets": "_all"}
+                        ]
+                        if args.hide_index:
+                            sparql_columndefs[1]["visible"] = False
+                        init_itables(connected=args.connected_table)
+                        itables.show(results_df,
+                                     connected=args.connected_table,
+                                     scrollX=True,
+                                     scrollY=sparql_scrollY,
+                                     columnDefs=sparql_columndefs,
+                                     paging=sparql_paging,
+                                     scrollCollapse=sparql_scrollCollapse,
+                                     lengthMenu=[final_pagination_options, final_pagination_menu],
+                                     pageLength=visible_results,
+                                     buttons=[
+                                         "pageLength",
+                                         {
+                                             "extend": "copyHtml5",
+                                             "text": "Copy",
+                                             "exportOptions": RESULTS_EXPORT_OPTIONS
+                                         },
+                                         {
+                                             "extend": "csvHtml5",
+                                             "title": SPARQL_RESULTS_FILENAME,
+                                             "text": "Download CSV",
+                                             "exportOptions": RESULTS_EXPORT_OPTIONS
+                                         },
+                                         {
+                                             "extend": "excelHtml5",
+                                             "filename": SPARQL_RESULTS_FILENAME,
+                                             "title": None,
+                                             "text": "Download XLSX",
+                                             "exportOptions": RESULTS_EXPORT_OPTIONS
+                                         }
+                                     ]
+                                     )
             elif first_tab_html != "":
                 with first_tab_output:
                     display(HTML(first_tab_html))
@@ -1082,8 +1233,9 @@ class Graph(Magics):
             json_results = results
             res_store_type = args.store_format
             res_export_path = args.export_to
+            csv_export = res_export_path != '' and get_streaming_export_format(res_export_path) is None
 
-            if res_store_type in PANDAS_FORMATS or res_export_path != '':
+            if res_store_type in PANDAS_FORMATS or csv_export:
                 results_df = process_df_for_store(language='sparql',
                                                   results_df=results_df)
 
@@ -1091,18 +1243,20 @@ class Graph(Magics):
                                                    pandas_results=results_df,
                                                    json_results=json_results)
 
-            export_csv_results(export_path=res_export_path,
-                               results_df=results_df)
+            if csv_export:
+                export_csv_results(export_path=res_export_path,
+                                   results_df=results_df)
         else:
             stored_results = results
 
+        if args.query_mode != 'explain' and args.export_to != '':
+            if rows_and_columns is not None:
+                export_streamed_results(args.export_to, rows_and_columns['columns'], rows_and_columns['rows'])
+
         store_to_ns(args.store_to, stored_results, local_ns)
 
-    @line_magic
-    @needs_local_scope
-    @display_exceptions
-    @neptune_db_only
-    def sparql_status(self, line='', local_ns: dict = None):
+    @cached_parser
+    def _sparql_status_parser(self) -> argparse.ArgumentParser:
         parser = argparse.ArgumentParser()
         parser.add_argument('-q', '--queryId', default='',
                             help='The ID of a running SPARQL query. Only displays the status of the specified query.')
@@ -1114,6 +1268,14 @@ class Graph(Magics):
                                  'the query is cancelled with an HTTP 500 status code.')
         parser.add_argument('--silent', action='store_true', default=False, help="Display no output.")
         parser.add_argument('--store-to', type=str, default='', help='store query result to this variable')
+        return parser
+
+    @line_magic
+    @needs_local_scope
+    @display_exceptions
+    @neptune_db_only
+    def sparql_status(self, line='', local_ns: dict = None):
+        parser = self._sparql_status_parser()
         args = parser.parse_args(line.split())
 
         if not args.cancelQuery:
@@ -1134,11 +1296,8 @@ class Graph(Magics):
         if not args.silent:
             display_json(res)
 
-    @magic_variables
-    @cell_magic
-    @needs_local_scope
-    @display_exceptions
-    def gremlin(self, line, cell, local_ns: dict = None):
+    @cached_parser
+    def _gremlin_parser(self) -> argparse.ArgumentParser:
         parser = argparse.ArgumentParser()
         parser.add_argument('query_mode', nargs='?', default='query',
                             help='query mode (default=query) [query|explain|profile]')
@@ -1180,7 +1339,9 @@ class Graph(Magics):
                             help=f'Configures export type when using --store-to with base query mode. '
                                  f'Valid inputs: {QUERY_STORE_TO_FORMATS}. Default is JSON')
         parser.add_argument('--export-to', type=str, default='',
-                            help='Export the base query mode CSV result to the provided file path.')
+                            help='Export the base query mode CSV result to the provided file path. Paths ending in '
+                                 '.parquet, .jsonl or .csv.gz are instead written in that format directly from the '
+                                 'query results, in chunks, even with --silent.')
         parser.add_argument('--ignore-groups', action='store_true', default=False, help="Ignore all grouping options")
         parser.add_argument('--profile-no-results', action='store_false', default=True,
                             help='Display only the result count. If not used, all query results will be displayed in '
@@ -1203,6 +1364,15 @@ class Graph(Magics):
                             help="Disable visualization physics after the initial simulation stabilizes.")
         parser.add_argument('-sd', '--simulation-duration', type=int, default=1500,
                             help='Specifies maximum duration of visualization physics simulation. Default is 1500ms')
+        parser.add_argument('--layout', type=str.lower, choices=LAYOUT_OPTIONS, default=LAYOUT_PHYSICS,
+                            help=f'How to lay out the nodes of the graph visualization. {LAYOUT_PHYSICS} runs the '
+                                 f'physics simulation in the browser. {LAYOUT_PRECOMPUTED} computes the node positions '
+                                 f'in the kernel and disables physics, which renders large graphs much faster. '
+                                 f'Default is {LAYOUT_PHYSICS}.')
+        parser.add_argument('--max-nodes', type=int, default=0,
+                            help='Maximum number of nodes to draw in the graph visualization. Larger graphs are '
+                                 'collapsed into one node per group, which can be expanded by double-clicking it. '
+                                 'Default is 0, for no limit.')
         parser.add_argument('--silent', action='store_true', default=False, help="Display no query output.")
         parser.add_argument('-ct', '--connected-table', action='store_true', default=False,
                             help=f'Dynamically load jQuery and DataTables resources for iTables. For more information, see: '
@@ -1213,15 +1383,34 @@ class Graph(Magics):
                             help="Display the entire output without a scroll bar.")
         parser.add_argument('--hide-index', action='store_true', default=False,
                             help="Hide the index column numbers when displaying the results.")
+        parser.add_argument('--server-pagination', action='store_true', default=False,
+                            help="Keep the results in the kernel, and only send the page of results being viewed to "
+                                 "the browser. Recommended for large result sets.")
         parser.add_argument('-mcl', '--max-content-length', type=str, default='',
                             help="Specifies maximum size (in bytes) of results that can be returned to the "
                                  "GremlinPython client. Abbreviated memory units (ex.'50MB') are accepted. "
                                  "Default is 10MB")
+        parser.add_argument('--stream', action='store_true', default=False,
+                            help="WebSockets only. Read results in the batches sent by the server and add them to the "
+                                 "output as they arrive, instead of waiting for the full result set.")
+        parser.add_argument('--max-results', type=int, default=0,
+                            help="WebSockets only. Stop reading results once this many have been received, and cancel "
+                                 "the rest of the traversal on Neptune. Implies --stream. Default is 0 (no limit).")
+        return parser
 
+    @magic_variables
+    @cell_magic
+    @needs_local_scope
+    @display_exceptions
+    def gremlin(self, line, cell, local_ns: dict = None):
+        parser = self._gremlin_parser()
         args = parser.parse_args(line.split())
         mode = str_to_query_mode(args.query_mode)
         logger.debug(f'Arguments {args}')
         results_df = None
+        stream_results = args.stream or args.max_results > 0
+        streamed_network = None
+        streamed_table = None
 
         query_params = None
         if args.query_parameters:
@@ -1350,6 +1539,9 @@ class Graph(Magics):
                         connection_protocol = DEFAULT_HTTP_PROTOCOL
                 else:
                     connection_protocol = self.graph_notebook_config.gremlin.connection_protocol
+                if stream_results and connection_protocol == DEFAULT_HTTP_PROTOCOL:
+                    print("--stream and --max-results are only supported over WebSockets, ignoring.")
+                    stream_results = False
                 try:
                     if connection_protocol == DEFAULT_HTTP_PROTOCOL:
                         using_http = True
@@ -1383,14 +1575,22 @@ class Graph(Magics):
                                 logger.debug('Received unexpected response format, outputting as single entry.')
                             query_res = [query_res_http_json]
                     else:
-                        query_res = self.client.gremlin_query(cell, transport_args=transport_args)
+                        if stream_results:
+                            query_res, streamed_network, streamed_table = \
+                                self.stream_gremlin_query(cell, transport_args, args)
+                        else:
+                            query_res = self.client.gremlin_query(cell, transport_args=transport_args)
                 except Exception as e:
                     if self.client.is_analytics_domain():
                         print("%%gremlin is incompatible with Neptune Analytics.")
                     raise e
             else:
                 try:
-                    query_res = self.client.gremlin_query(cell, transport_args=transport_args)
+                    if stream_results:
+                        query_res, streamed_network, streamed_table = \
+                            self.stream_gremlin_query(cell, transport_args, args)
+                    else:
+                        query_res = self.client.gremlin_query(cell, transport_args=transport_args)
                 except Exception as e:
                     store_to_ns(args.store_to, {'error': str(e)[5:]}, local_ns)  # remove the leading error code.
                     raise e
@@ -1401,25 +1601,12 @@ class Graph(Magics):
                 titles.append('Console')
 
                 gremlin_network = None
-                if self.show_graph_tab:
+                if stream_results:
+                    # the network was built batch by batch while the results were streamed in
+                    gremlin_network = streamed_network
+                elif self.show_graph_tab:
                     try:
-                        logger.debug(f'groupby: {args.group_by}')
-                        logger.debug(f'display_property: {args.display_property}')
-                        logger.debug(f'edge_display_property: {args.edge_display_property}')
-                        logger.debug(f'label_max_length: {args.label_max_length}')
-                        logger.debug(f'ignore_groups: {args.ignore_groups}')
-                        gn = GremlinNetwork(group_by_property=args.group_by,
-                                            display_property=args.display_property,
-                                            group_by_raw=args.group_by_raw,
-                                            group_by_depth=args.group_by_depth,
-                                            edge_display_property=args.edge_display_property,
-                                            tooltip_property=args.tooltip_property,
-                                            edge_tooltip_property=args.edge_tooltip_property,
-                                            label_max_length=args.label_max_length,
-                                            edge_label_max_length=args.edge_label_max_length,
-                                            ignore_groups=args.ignore_groups,
-                                            using_http=using_http,
-                                            vis_group_keys=list(self.graph_notebook_vis_options.get('groups', {}).keys()))
+                        gn = self.build_gremlin_network(args, using_http=using_http)
 
                         if using_http and 'path()' in cell and query_res and isinstance(query_res, list):
                             first_path = query_res[0]
@@ -1442,55 +1629,17 @@ class Graph(Magics):
                         logger.debug(
                             f'Unable to create graph network from result due to error: {value_error}. '
                             f'Skipping from result set.')
-                    if gremlin_network and len(gremlin_network.graph.nodes) > 0:
-                        try:
-                            self.graph_notebook_vis_options['physics']['disablePhysicsAfterInitialSimulation'] \
-                                = args.stop_physics
-                            self.graph_notebook_vis_options['physics']['simulationDuration'] = args.simulation_duration
-                            f = Force(network=gremlin_network, options=self.graph_notebook_vis_options)
-                            titles.append('Graph')
-                            children.append(f)
-                            logger.debug('added gremlin network to tabs')
-                        except Exception as force_error:
-                            logger.debug(
-                                f'Unable to render visualization from graph network due to error: {force_error}. Skipping.')
-
-                # Check if we can access the CDNs required by itables library.
-                # If not, then render our own HTML template.
-
-                mixed_results = False
-                if query_res:
-                    # If the results set contains multiple datatypes, and the first result is a map or list, we need to
-                    # insert a temp string first element, or we will get an error when creating the Dataframe.
-                    first_res_type = type(query_res[0])
-                    if first_res_type in [dict, list, set] and len(query_res) > 1:
-                        if not all(isinstance(x, first_res_type) for x in query_res[1:]):
-                            mixed_results = True
-                            query_res_deque = deque(query_res)
-                            query_res_deque.appendleft('x')
-                            query_res = list(query_res_deque)
-
-                results_df = pd.DataFrame(query_res).convert_dtypes()
-                # Checking for created indices instead of the df itself here, as df.empty will still return True when
-                # only empty maps/lists are present in the data.
-                if not results_df.index.empty:
-                    query_res_reformat = []
-                    for result in query_res:
-                        fixed_result = encode_html_chars(result)
-                        query_res_reformat.append([fixed_result])
-                    query_res_reformat.append([{'__DUMMY_KEY__': ['DUMMY_VALUE']}])
-                    results_df = pd.DataFrame(query_res_reformat)
-                    if mixed_results:
-                        results_df = results_df[1:]
-                    results_df.drop(results_df.index[-1], inplace=True)
-                results_df.insert(0, "#", range(1, len(results_df) + 1))
-                if len(results_df.columns) == 2 and int(results_df.columns[1]) == 0:
-                    results_df.rename({results_df.columns[1]: 'Result'}, axis='columns', inplace=True)
-                else:
-                    results_df.insert(1, "Result", [])
-                results_df.set_index('#', inplace=True)
-                results_df.columns.name = results_df.index.name
-                results_df.index.name = None
+                if gremlin_network and len(gremlin_network.graph.nodes) > 0:
+                    try:
+                        f = self.build_force_widget(gremlin_network, args)
+                        titles.append('Graph')
+                        children.append(f)
+                        logger.debug('added gremlin network to tabs')
+                    except Exception as force_error:
+                        logger.debug(
+                            f'Unable to render visualization from graph network due to error: {force_error}. Skipping.')
+
+                results_df = build_gremlin_results_df(query_res)
 
         if not args.silent:
             metadata_output = widgets.Output(layout=gremlin_layout)
@@ -1507,52 +1656,59 @@ class Graph(Magics):
 
             with first_tab_output:
                 if mode == QueryMode.DEFAULT:
-                    visible_results, final_pagination_options, final_pagination_menu = generate_pagination_vars(
-                        args.results_per_page)
-                    gremlin_columndefs = [
-                        {"type": "string", "targets": "_all"},
-                        {"width": "5%", "targets": 0},
-                        {"visible": True, "targets": 0},
-                        {"searchable": False, "targets": 0},
-                        {"minWidth": "95%", "targets": 1},
-                        {"className": "nowrap dt-left", "targets": "_all"},
-                        {"createdCell": JavascriptFunction(index_col_js), "targets": 0},
-                        {"createdCell": JavascriptFunction(cell_style_js), "targets": "_all"},
-                    ]
-                    if args.hide_index:
-                        gremlin_columndefs[1]["visible"] = False
-                    init_notebook_mode(connected=args.connected_table)
-                    show(results_df,
-                         connected=args.connected_table,
-                         scrollX=True,
-                         scrollY=gremlin_scrollY,
-                         columnDefs=gremlin_columndefs,
-                         paging=gremlin_paging,
-                         scrollCollapse=gremlin_scrollCollapse,
-                         lengthMenu=[final_pagination_options, final_pagination_menu],
-                         pageLength=visible_results,
-                         buttons=[
-                             "pageLength",
-                             {
-                                 "extend": "copyHtml5",
-                                 "text": "Copy",
-                                 "exportOptions": RESULTS_EXPORT_OPTIONS
-                             },
-                             {
-                                 "extend": "csvHtml5",
-                                 "title": GREMLIN_RESULTS_FILENAME,
-                                 "text": "Download CSV",
-                                 "exportOptions": RESULTS_EXPORT_OPTIONS
-                             },
-                             {
-                                 "extend": "excelHtml5",
-                                 "filename": GREMLIN_RESULTS_FILENAME,
-                                 "title": None,
-                                 "text": "Download XLSX",
-                                 "exportOptions": RESULTS_EXPORT_OPTIONS
-                             }
-                         ]
-                         )
+                    if streamed_table is not None:
+                        # the table that the streamed results were added to as they arrived
+                        display(streamed_table)
+                    elif args.server_pagination:
+                        display_paginated_table(results_df.rename_axis('#').reset_index(), args.results_per_page,
+                                                args.hide_index)
+                    else:
+                        visible_results, final_pagination_options, final_pagination_menu = generate_pagination_vars(
+                            args.results_per_page)
+                        gremlin_columndefs = [
+                            {"type": "string", "targets": "_all"},
+                            {"width": "5%", "targets": 0},
+                            {"visible": True, "targets": 0},
+                            {"searchable": False, "targets": 0},
+                            {"minWidth": "95%", "targets": 1},
+                            {"className": "nowrap dt-left", "targets": "_all"},
+                            {"createdCell": itables.JavascriptFunction(index_col_js), "targets": 0},
+                            {"createdCell": itables.JavascriptFunction(cell_style_js), "targets": "_all"},
+                        ]
+                        if args.hide_index:
+                            gremlin_columndefs[1]["visible"] = False
+                        init_itables(connected=args.connected_table)
+                        itables.show(results_df,
+                                     connected=args.connected_table,
+                                     scrollX=True,
+                                     scrollY=gremlin_scrollY,
+                                     columnDefs=gremlin_columndefs,
+                                     paging=gremlin_paging,
+                                     scrollCollapse=gremlin_scrollCollapse,
+                                     lengthMenu=[final_pagination_options, final_pagination_menu],
+                                     pageLength=visible_results,
+                                     buttons=[
+                                         "pageLength",
+                                         {
+                                             "extend": "copyHtml5",
+                                             "text": "Copy",
+                                             "exportOptions": RESULTS_EXPORT_OPTIONS
+                                         },
+                                         {
+                                             "extend": "csvHtml5",
+                                             "title": GREMLIN_RESULTS_FILENAME,
+                                             "text": "Download CSV",
+                                             "exportOptions": RESULTS_EXPORT_OPTIONS
+                                         },
+                                         {
+                                             "extend": "excelHtml5",
+                                             "filename": GREMLIN_RESULTS_FILENAME,
+                                             "title": None,
+                                             "text": "Download XLSX",
+                                             "exportOptions": RESULTS_EXPORT_OPTIONS
+                                         }
+                                     ]
+                                     )
                 else:  # Explain/Profile
                     display(HTML(first_tab_html))
 
@@ -1560,8 +1716,9 @@ class Graph(Magics):
             json_results = query_res
             res_store_type = args.store_format
             res_export_path = args.export_to
+            csv_export = res_export_path != '' and get_streaming_export_format(res_export_path) is None
 
-            if res_store_type in PANDAS_FORMATS or res_export_path != '':
+            if res_store_type in PANDAS_FORMATS or csv_export:
                 results_df = process_df_for_store(language='gremlin',
                                                   results_df=results_df)
 
@@ -1569,18 +1726,117 @@ class Graph(Magics):
                                                    pandas_results=results_df,
                                                    json_results=json_results)
 
-            export_csv_results(export_path=res_export_path,
-                               results_df=results_df)
+            if csv_export:
+                export_csv_results(export_path=res_export_path,
+                                   results_df=results_df)
         else:
             stored_results = query_res
 
+        if mode == QueryMode.DEFAULT:
+            export_streamed_results(args.export_to, ['Result'], ([result] for result in query_res))
+
         store_to_ns(args.store_to, stored_results, local_ns)
 
-    @line_magic
-    @needs_local_scope
-    @display_exceptions
-    @neptune_db_only
-    def gremlin_status(self, line='', local_ns: dict = None):
+    def build_force_widget(self, network, args) -> Force:
+        self.graph_notebook_vis_options['physics']['disablePhysicsAfterInitialSimulation'] = args.stop_physics
+        self.graph_notebook_vis_options['physics']['simulationDuration'] = args.simulation_duration
+        vis_options = self.graph_notebook_vis_options
+        clusters = None
+        node_count = network.graph.number_of_nodes()
+        if 0 < args.max_nodes < node_count:
+            clusters = NetworkClusters(network.graph, args.max_nodes)
+            network = clusters.build_network()
+            print(f'The graph has {node_count} nodes, more than --max-nodes {args.max_nodes}. Showing '
+                  f'{network.graph.number_of_nodes()} groups of nodes instead, double-click a group to expand it.')
+        if args.layout == LAYOUT_PRECOMPUTED:
+            apply_precomputed_layout(network.graph)
+            vis_options = vis_options_merge(vis_options, OPTIONS_PRECOMPUTED_LAYOUT)
+        return Force(network=network, options=vis_options, clusters=clusters)
+
+    def build_gremlin_network(self, args, using_http: bool = False) -> GremlinNetwork:
+        logger.debug(f'groupby: {args.group_by}')
+        logger.debug(f'display_property: {args.display_property}')
+        logger.debug(f'edge_display_property: {args.edge_display_property}')
+        logger.debug(f'label_max_length: {args.label_max_length}')
+        logger.debug(f'ignore_groups: {args.ignore_groups}')
+        return GremlinNetwork(group_by_property=args.group_by,
+                              display_property=args.display_property,
+                              group_by_raw=args.group_by_raw,
+                              group_by_depth=args.group_by_depth,
+                              edge_display_property=args.edge_display_property,
+                              tooltip_property=args.tooltip_property,
+                              edge_tooltip_property=args.edge_tooltip_property,
+                              label_max_length=args.label_max_length,
+                              edge_label_max_length=args.edge_label_max_length,
+                              ignore_groups=args.ignore_groups,
+                              using_http=using_http,
+                              vis_group_keys=list(self.graph_notebook_vis_options.get('groups', {}).keys()))
+
+    def stream_gremlin_query(self, query: str, transport_args: dict, args):
+        """
+        Runs a %%gremlin query over WebSockets, adding each batch of results to a paginated results table and to the
+        graph network as it arrives, so that the first rows are shown as soon as they are received. Returns the
+        results read, the network, which is None if the results could not be visualized, and the table, which is None
+        with --silent.
+        """
+        gremlin_network = None
+        pattern = None
+        if not args.silent and self.show_graph_tab:
+            gremlin_network = self.build_gremlin_network(args)
+            if args.path_pattern != '':
+                pattern = parse_pattern_list_str(args.path_pattern)
+
+        progress_label = None
+        live_output = None
+        results_table = None
+        if not args.silent:
+            progress_label = widgets.Label(value='Waiting for results...')
+            live_output = widgets.Output()
+            display(progress_label, live_output)
+
+        query_res = []
+        try:
+            for batch in self.client.gremlin_query_stream(query, transport_args=transport_args,
+                                                          max_results=args.max_results):
+                if live_output is not None:
+                    batch_df = build_gremlin_results_df(batch, start=len(query_res) + 1).rename_axis('#').reset_index()
+                    if results_table is None:
+                        results_table = build_paginated_table(batch_df, args.results_per_page, args.hide_index)
+                        with live_output:
+                            display(results_table)
+                    else:
+                        results_table.append_rows(batch_df)
+                query_res.extend(batch)
+                if gremlin_network is not None:
+                    try:
+                        if pattern is None:
+                            gremlin_network.add_results(batch)
+                        else:
+                            gremlin_network.add_results_with_pattern(batch, pattern)
+                    except ValueError as value_error:
+                        logger.debug(f'Unable to create graph network from result due to error: {value_error}. '
+                                     f'Skipping from result set.')
+                        gremlin_network = None
+                if progress_label is not None:
+                    progress_label.value = f'Received {len(query_res)} results...'
+        finally:
+            if progress_label is not None:
+                progress_label.close()
+                # the table is shown again in the results tab once all of the results have been read
+                live_output.close()
+
+        if args.max_results > 0 and len(query_res) >= args.max_results and not args.silent:
+            print(f'Stopped reading results after --max-results {args.max_results}.')
+        if gremlin_network is not None:
+            logger.debug(f'number of nodes is {len(gremlin_network.graph.nodes)}')
+        if results_table is None and not args.silent:
+            # no results were received
+            results_table = build_paginated_table(build_gremlin_results_df(query_res).rename_axis('#').reset_index(),
+                                                  args.results_per_page, args.hide_index)
+        return query_res, gremlin_network, results_table
+
+    @cached_parser
+    def _gremlin_status_parser(self) -> argparse.ArgumentParser:
         parser = argparse.ArgumentParser()
         parser.add_argument('-q', '--queryId', default='',
                             help='The ID of a running Gremlin query. Only displays the status of the specified query.')
@@ -1592,6 +1848,14 @@ class Graph(Magics):
                                  'the status of all waiting queries is also returned.')
         parser.add_argument('--silent', action='store_true', default=False, help="Display no output.")
         parser.add_argument('--store-to', type=str, default='', help='store query result to this variable')
+        return parser
+
+    @line_magic
+    @needs_local_scope
+    @display_exceptions
+    @neptune_db_only
+    def gremlin_status(self, line='', local_ns: dict = None):
+        parser = self._gremlin_status_parser()
         args = parser.parse_args(line.split())
 
         if not args.cancelQuery:
@@ -1637,6 +1901,13 @@ class Graph(Magics):
     def opencypher_status(self, line='', local_ns: dict = None):
         self.handle_opencypher_status(line, local_ns)
 
+    @cached_parser
+    def _status_parser(self) -> argparse.ArgumentParser:
+        parser = argparse.ArgumentParser()
+        parser.add_argument('--silent', action='store_true', default=False, help="Display no output.")
+        parser.add_argument('--store-to', type=str, default='', help='store query result to this variable')
+        return parser
+
     @line_magic
     @needs_local_scope
     @display_exceptions
@@ -1646,9 +1917,7 @@ class Graph(Magics):
             self.get_graph(line, local_ns)
             return
         logger.info(f'calling for status on endpoint {self.graph_notebook_config.host}')
-        parser = argparse.ArgumentParser()
-        parser.add_argument('--silent', action='store_true', default=False, help="Display no output.")
-        parser.add_argument('--store-to', type=str, default='', help='store query result to this variable')
+        parser = self._status_parser()
         args = parser.parse_args(line.split())
 
         status_res = self.client.status()
@@ -1671,17 +1940,22 @@ class Graph(Magics):
                     print()
                 return status_res
 
+    @cached_parser
+    def _get_graph_parser(self) -> argparse.ArgumentParser:
+        parser = argparse.ArgumentParser()
+        parser.add_argument('--include-metadata', action='store_true', default=False,
+                            help="Display the response metadata if it is available.")
+        parser.add_argument('--silent', action='store_true', default=False, help="Display no output.")
+        parser.add_argument('--store-to', type=str, default='', help='store query result to this variable')
+        return parser
+
     @line_magic
     @needs_local_scope
     @display_exceptions
     @neptune_graph_only
     def get_graph(self, line='', local_ns: dict = None):
         logger.info(f'calling for status on endpoint {self.graph_notebook_config.host}')
-        parser = argparse.ArgumentParser()
-        parser.add_argument('--include-metadata', action='store_true', default=False,
-                            help="Display the response metadata if it is available.")
-        parser.add_argument('--silent', action='store_true', default=False, help="Display no output.")
-        parser.add_argument('--store-to', type=str, default='', help='store query result to this variable')
+        parser = self._get_graph_parser()
         args = parser.parse_args(line.split())
 
         try:
@@ -1698,11 +1972,8 @@ class Graph(Magics):
                 print(e)
             store_to_ns(args.store_to, e, local_ns)
 
-    @line_magic
-    @needs_local_scope
-    @display_exceptions
-    @neptune_graph_only
-    def create_graph_snapshot(self, line='', local_ns: dict = None):
+    @cached_parser
+    def _create_graph_snapshot_parser(self) -> argparse.ArgumentParser:
         parser = argparse.ArgumentParser()
         parser.add_argument('-s', '--snapshot-name', type=str, default='',
                             help="The name for the snapshot. Must start with a letter, contain only alphanumeric "
@@ -1717,6 +1988,14 @@ class Graph(Magics):
                             help="Display no output.")
         parser.add_argument('--store-to', type=str, default='',
                             help='Store query result to this variable')
+        return parser
+
+    @line_magic
+    @needs_local_scope
+    @display_exceptions
+    @neptune_graph_only
+    def create_graph_snapshot(self, line='', local_ns: dict = None):
+        parser = self._create_graph_snapshot_parser()
         args = parser.parse_args(line.split())
 
         graph_id = self.client.get_graph_id()
@@ -1750,11 +2029,8 @@ class Graph(Magics):
                 print(e)
             store_to_ns(args.store_to, e, local_ns)
 
-    @line_magic
-    @needs_local_scope
-    @display_exceptions
-    @neptune_graph_only
-    def get_import_task(self, line='', local_ns: dict = None):
+    @cached_parser
+    def _get_import_task_parser(self) -> argparse.ArgumentParser:
         parser = argparse.ArgumentParser()
         parser.add_argument('-ti', '--task-identifier', type=str, default='',
                             help="The unique identifier of an import task.")
@@ -1762,6 +2038,14 @@ class Graph(Magics):
                             help="Display the response metadata if it is available.")
         parser.add_argument('--silent', action='store_true', default=False, help="Display no output.")
         parser.add_argument('--store-to', type=str, default='', help='store query result to this variable')
+        return parser
+
+    @line_magic
+    @needs_local_scope
+    @display_exceptions
+    @neptune_graph_only
+    def get_import_task(self, line='', local_ns: dict = None):
+        parser = self._get_import_task_parser()
         args = parser.parse_args(line.split())
 
         task_id_regex = "t-[a-z0-9]{10}"
@@ -1788,11 +2072,8 @@ class Graph(Magics):
                     print(e)
             store_to_ns(args.store_to, e, local_ns)
 
-    @line_magic
-    @needs_local_scope
-    @display_exceptions
-    def reset(self, line, local_ns: dict = None, service: str = None):
-        logger.info(f'calling system endpoint {self.client.host}')
+    @cached_parser
+    def _reset_parser(self) -> argparse.ArgumentParser:
         parser = argparse.ArgumentParser()
         parser.add_argument('-g', '--generate-token', action='store_true',
                             help='Generate token for database reset. Database only.')
@@ -1805,6 +2086,14 @@ class Graph(Magics):
         parser.add_argument('-m', '--max-status-retries', type=int, default=10,
                             help='Specifies how many times we should attempt to check if the database reset has '
                                  'completed, in intervals of 5 seconds. Default is 10')
+        return parser
+
+    @line_magic
+    @needs_local_scope
+    @display_exceptions
+    def reset(self, line, local_ns: dict = None, service: str = None):
+        logger.info(f'calling system endpoint {self.client.host}')
+        parser = self._reset_parser()
         args = parser.parse_args(line.split())
         generate_token = args.generate_token
         skip_prompt = args.yes
@@ -2108,35 +2397,15 @@ class Graph(Magics):
     def reset_graph(self, line, local_ns: dict = None):
         self.reset(line, local_ns, service=NEPTUNE_ANALYTICS_SERVICE_NAME)
 
-    @magic_variables
-    @line_magic
-    @needs_local_scope
-    @display_exceptions
-    def load(self, line='', local_ns: dict = None):
-        if self.client.is_analytics_domain():
-            load_type = ANALYTICS_LOAD_TYPES[0]
-            load_formats = VALID_INCREMENTAL_FORMATS
-        else:
-            load_type = DB_LOAD_TYPES[0]
-            load_formats = VALID_BULK_FORMATS
-
+    @cached_parser
+    def _load_parser(self, load_formats: tuple, loader_arn: str, region: str) -> argparse.ArgumentParser:
         # TODO: change widgets to let any arbitrary inputs be added by users
         parser = argparse.ArgumentParser()
         parser.add_argument('-s', '--source', default='s3://')
-        try:
-            parser.add_argument('-l', '--loader-arn', default=self.graph_notebook_config.load_from_s3_arn)
-        except AttributeError:
-            print(f"Missing required configuration option 'load_from_s3_arn'. Please ensure that you have provided a "
-                  "valid Neptune cluster endpoint URI in the 'host' field of %graph_notebook_config.")
-            return
+        parser.add_argument('-l', '--loader-arn', default=loader_arn)
         parser.add_argument('-f', '--format', choices=load_formats, default=FORMAT_CSV)
         parser.add_argument('-p', '--parallelism', choices=PARALLELISM_OPTIONS, default=PARALLELISM_HIGH)
-        try:
-            parser.add_argument('-r', '--region', default=self.graph_notebook_config.aws_region)
-        except AttributeError:
-            print("Missing required configuration option 'aws_region'. Please ensure that you have provided a "
-                  "valid Neptune cluster endpoint URI in the 'host' field of %graph_notebook_config.")
-            return
+        parser.add_argument('-r', '--region', default=region)
         parser.add_argument('--no-fail-on-error', action='store_true', default=False)
         parser.add_argument('--update-single-cardinality', action='store_true', default=True)
         parser.add_argument('--store-to', type=str, default='', help='store query result to this variable')
@@ -2157,7 +2426,34 @@ class Graph(Magics):
         parser.add_argument('-n', '--nopoll', action='store_true', default=False)
         parser.add_argument('--edge-only-load', action='store_true', default=False, 
                             help='Assume there are only edge files present - do not scan for vertex files before loading edge files.')
+        return parser
 
+    @magic_variables
+    @line_magic
+    @needs_local_scope
+    @display_exceptions
+    def load(self, line='', local_ns: dict = None):
+        if self.client.is_analytics_domain():
+            load_type = ANALYTICS_LOAD_TYPES[0]
+            load_formats = VALID_INCREMENTAL_FORMATS
+        else:
+            load_type = DB_LOAD_TYPES[0]
+            load_formats = VALID_BULK_FORMATS
+
+        try:
+            loader_arn = self.graph_notebook_config.load_from_s3_arn
+        except AttributeError:
+            print(f"Missing required configuration option 'load_from_s3_arn'. Please ensure that you have provided a "
+                  "valid Neptune cluster endpoint URI in the 'host' field of %graph_notebook_config.")
+            return
+        try:
+            region = self.graph_notebook_config.aws_region
+        except AttributeError:
+            print("Missing required configuration option 'aws_region'. Please ensure that you have provided a "
+                  "valid Neptune cluster endpoint URI in the 'host' field of %graph_notebook_config.")
+            return
+
+        parser = self._load_parser(tuple(load_formats), loader_arn, region)
         args = parser.parse_args(line.split())
         button = widgets.Button(description="Submit")
         output = widgets.Output()
@@ -2735,22 +3031,30 @@ class Graph(Magics):
         if args.run:
             on_button_clicked(None)
 
-    @line_magic
-    @display_exceptions
-    @needs_local_scope
-    @neptune_db_only
-    def load_ids(self, line, local_ns: dict = None):
+    @cached_parser
+    def _load_ids_parser(self) -> argparse.ArgumentParser:
         parser = argparse.ArgumentParser()
         parser.add_argument('--details', action='store_true', default=False,
                             help="Display status details for each load job. Most recent jobs are listed first.")
         parser.add_argument('--limit', type=int, default=maxsize,
                             help='If --details is True, only return the x most recent load job statuses. '
                                  'Defaults to sys.maxsize.')
+        parser.add_argument('--concurrency', type=int, default=DEFAULT_LOAD_STATUS_CONCURRENCY,
+                            help='If --details is True, the maximum number of load job statuses to fetch in parallel. '
+                                 f'Default is {DEFAULT_LOAD_STATUS_CONCURRENCY}.')
         parser.add_argument('-ct', '--connected-table', action='store_true', default=False,
                             help=f'Dynamically load jQuery and DataTables resources for iTables. For more information, see: '
                                  f'https://mwouts.github.io/itables/quick_start.html#offline-mode-versus-connected-mode')
         parser.add_argument('--silent', action='store_true', default=False, help="Display no output.")
         parser.add_argument('--store-to', type=str, default='')
+        return parser
+
+    @line_magic
+    @display_exceptions
+    @needs_local_scope
+    @neptune_db_only
+    def load_ids(self, line, local_ns: dict = None):
+        parser = self._load_ids_parser()
         args = parser.parse_args(line.split())
 
         ids, res = get_load_ids(self.client)
@@ -2759,26 +3063,11 @@ class Graph(Magics):
             labels = [widgets.Label(value="No load IDs found.")]
         else:
             if args.details:
-                res = {}
-                res_table = []
-                for index, label_id in enumerate(ids):
-                    load_status_res = self.client.load_status(label_id)
-                    load_status_res.raise_for_status()
-                    this_res = load_status_res.json()
+                if args.limit > 0:
+                    ids = ids[:args.limit]
+                statuses = {}
+                res_table = [None] * len(ids)
 
-                    res[label_id] = this_res
-
-                    res_row = {}
-                    res_row["loadId"] = label_id
-                    res_row["status"] = this_res["payload"]["overallStatus"]["status"]
-                    res_row.update(this_res["payload"]["overallStatus"])
-                    if "feedCount" in this_res["payload"]:
-                        res_row["feedCount"] = this_res["payload"]["feedCount"]
-                    else:
-                        res_row["feedCount"] = "N/A"
-                    res_table.append(res_row)
-                    if index + 1 == args.limit:
-                        break
                 if not args.silent:
                     tab = widgets.Tab()
                     table_output = widgets.Output(layout=DEFAULT_LAYOUT)
@@ -2786,50 +3075,78 @@ class Graph(Magics):
                     tab.children = [table_output, raw_output]
                     tab.set_title(0, 'Table')
                     tab.set_title(1, 'Raw')
-                    display(tab)
+                    fetch_progress = widgets.Label(value=f'Fetched 0 of {len(ids)} load statuses...')
+                    display(fetch_progress, tab)
 
-                    results_df = pd.DataFrame(res_table)
+                def render_load_status_table():
+                    results_df = pd.DataFrame([row for row in res_table if row is not None])
                     results_df.insert(0, "#", range(1, len(results_df) + 1))
 
+                    table_output.clear_output(wait=True)
                     with table_output:
-                        init_notebook_mode(connected=args.connected_table)
-                        show(results_df,
-                             connected=args.connected_table,
-                             scrollX=True,
-                             scrollY="475px",
-                             columnDefs=[
-                                 {"width": "5%", "targets": 0},
-                                 {"className": "nowrap dt-left", "targets": "_all"},
-                                 {"createdCell": JavascriptFunction(index_col_js), "targets": 0},
-                                 {"createdCell": JavascriptFunction(cell_style_js), "targets": "_all"}
-                             ],
-                             paging=True,
-                             scrollCollapse=True,
-                             lengthMenu=[DEFAULT_PAGINATION_OPTIONS, DEFAULT_PAGINATION_MENU],
-                             pageLength=10,
-                             buttons=[
-                                 "pageLength",
-                                 {
-                                     "extend": "copyHtml5",
-                                     "text": "Copy",
-                                     "exportOptions": RESULTS_EXPORT_OPTIONS
-                                 },
-                                 {
-                                     "extend": "csvHtml5",
-                                     "title": LOAD_IDS_FILENAME,
-                                     "text": "Download CSV",
-                                     "exportOptions": RESULTS_EXPORT_OPTIONS
-                                 },
-                                 {
-                                     "extend": "excelHtml5",
-                                     "filename": LOAD_IDS_FILENAME,
-                                     "title": None,
-                                     "text": "Download XLSX",
-                                     "exportOptions": RESULTS_EXPORT_OPTIONS
-                                 }
-                             ]
-                             )
+                        init_itables(connected=args.connected_table)
+                        itables.show(results_df,
+                                     connected=args.connected_table,
+                                     scrollX=True,
+                                     scrollY="475px",
+                                     columnDefs=[
+                                         {"width": "5%", "targets": 0},
+                                         {"className": "nowrap dt-left", "targets": "_all"},
+                                         {"createdCell": itables.JavascriptFunction(index_col_js), "targets": 0},
+                                         {"createdCell": itables.JavascriptFunction(cell_style_js), "targets": "_all"}
+                                     ],
+                                     paging=True,
+                                     scrollCollapse=True,
+                                     lengthMenu=[DEFAULT_PAGINATION_OPTIONS, DEFAULT_PAGINATION_MENU],
+                                     pageLength=10,
+                                     buttons=[
+                                         "pageLength",
+                                         {
+                                             "extend": "copyHtml5",
+                                             "text": "Copy",
+                                             "exportOptions": RESULTS_EXPORT_OPTIONS
+                                         },
+                                         {
+                                             "extend": "csvHtml5",
+                                             "title": LOAD_IDS_FILENAME,
+                                             "text": "Download CSV",
+                                             "exportOptions": RESULTS_EXPORT_OPTIONS
+                                         },
+                                         {
+                                             "extend": "excelHtml5",
+                                             "filename": LOAD_IDS_FILENAME,
+                                             "title": None,
+                                             "text": "Download XLSX",
+                                             "exportOptions": RESULTS_EXPORT_OPTIONS
+                                         }
+                                     ]
+                                     )
+
+                last_render = time.monotonic()
+                for index, label_id, this_res in fetch_load_statuses(self.client, ids, max_workers=args.concurrency,
+                                                                      cache=self._load_status_cache):
+                    statuses[label_id] = this_res
+
+                    res_row = {}
+                    res_row["loadId"] = label_id
+                    res_row["status"] = this_res["payload"]["overallStatus"]["status"]
+                    res_row.update(this_res["payload"]["overallStatus"])
+                    if "feedCount" in this_res["payload"]:
+                        res_row["feedCount"] = this_res["payload"]["feedCount"]
+                    else:
+                        res_row["feedCount"] = "N/A"
+                    res_table[index] = res_row
+
+                    # re-render the partial table periodically so large histories show up as they arrive
+                    if not args.silent and time.monotonic() - last_render > LOAD_STATUS_RENDER_INTERVAL:
+                        fetch_progress.value = f'Fetched {len(statuses)} of {len(ids)} load statuses...'
+                        render_load_status_table()
+                        last_render = time.monotonic()
 
+                res = {label_id: statuses[label_id] for label_id in ids}
+                if not args.silent:
+                    fetch_progress.close()
+                    render_load_status_table()
                     with raw_output:
                         display_json(res)
             else:
@@ -2841,10 +3158,8 @@ class Graph(Magics):
 
         store_to_ns(args.store_to, res, local_ns)
 
-    @line_magic
-    @display_exceptions
-    @needs_local_scope
-    def load_status(self, line, local_ns: dict = None):
+    @cached_parser
+    def _load_status_parser(self) -> argparse.ArgumentParser:
         parser = argparse.ArgumentParser()
         parser.add_argument('load_id', default='', help='loader id to check status for')
         parser.add_argument('--silent', action='store_true', default=False, help="Display no output.")
@@ -2855,6 +3170,13 @@ class Graph(Magics):
                             help='The error page number. Only valid when the --errors option is set.')
         parser.add_argument('--errorsPerPage', '-e', default='10',
                             help='The number of errors per each page. Only valid when the --errors option is set.')
+        return parser
+
+    @line_magic
+    @display_exceptions
+    @needs_local_scope
+    def load_status(self, line, local_ns: dict = None):
+        parser = self._load_status_parser()
         args = parser.parse_args(line.split())
 
         payload = {
@@ -2871,17 +3193,22 @@ class Graph(Magics):
 
         store_to_ns(args.store_to, res, local_ns)
 
-    @line_magic
-    @display_exceptions
-    @needs_local_scope
-    @neptune_db_only
-    def cancel_load(self, line, local_ns: dict = None):
+    @cached_parser
+    def _cancel_load_parser(self) -> argparse.ArgumentParser:
         parser = argparse.ArgumentParser()
         parser.add_argument('load_id', nargs="?", default='', help='loader id to check status for')
         parser.add_argument('--all-in-queue', action='store_true', default=False,
                             help="Cancel all load jobs with LOAD_IN_QUEUE status.")
         parser.add_argument('--silent', action='store_true', default=False, help="Display no output.")
         parser.add_argument('--store-to', type=str, default='')
+        return parser
+
+    @line_magic
+    @display_exceptions
+    @needs_local_scope
+    @neptune_db_only
+    def cancel_load(self, line, local_ns: dict = None):
+        parser = self._cancel_load_parser()
         args = parser.parse_args(line.split())
 
         loads_to_cancel = []
@@ -2892,12 +3219,10 @@ class Graph(Magics):
             loads_to_cancel.append(args.load_id)
         elif args.all_in_queue:
             all_job_ids = get_load_ids(self.client)[0]
-            for job_id in all_job_ids:
-                load_status_res = self.client.load_status(job_id)
-                load_status_res.raise_for_status()
-                this_res = load_status_res.json()
-                if this_res["payload"]["overallStatus"]["status"] == "LOAD_IN_QUEUE":
-                    loads_to_cancel.append(job_id)
+            in_queue = [False] * len(all_job_ids)
+            for index, job_id, this_res in fetch_load_statuses(self.client, all_job_ids):
+                in_queue[index] = this_res["payload"]["overallStatus"]["status"] == "LOAD_IN_QUEUE"
+            loads_to_cancel.extend(job_id for job_id, queued in zip(all_job_ids, in_queue) if queued)
         else:
             print("Please specify either a single load_id or --all-in-queue.")
             return
@@ -2921,20 +3246,8 @@ class Graph(Magics):
 
         store_to_ns(args.store_to, raw_res, local_ns)
 
-    @line_magic
-    @display_exceptions
-    @needs_local_scope
-    def seed(self, line, local_ns: dict = None):
-        """
-        Provides a way to bulk insert data to your endpoint via Gremlin, openCypher, or SPARQL queries. Via the form
-        generated by running %seed with no arguments, you can do either of the following:
-
-        a) select a data model (property-graph or RDF), then choose from among a number of different sample data sets
-        that Neptune provides.
-
-        b) select a query language to load with, then provide a path to a local file with insert queries,
-        or a directory containing multiple of these files.
-        """
+    @cached_parser
+    def _seed_parser(self) -> argparse.ArgumentParser:
         parser = argparse.ArgumentParser()
         parser.add_argument('--model', type=str.lower, default='',
                             help='Specifies what data model you would like to load for. '
@@ -2956,6 +3269,30 @@ class Graph(Magics):
         parser.add_argument('--run', action='store_true')
         parser.add_argument('--ignore-errors', action='store_true', default=False,
                             help='Continue loading from the seed file on failure of any individual query.')
+        parser.add_argument('--concurrency', type=int, default=DEFAULT_SEED_CONCURRENCY,
+                            help='Number of independent Gremlin or openCypher seed queries to run in parallel. '
+                                 f'Default is {DEFAULT_SEED_CONCURRENCY}.')
+        parser.add_argument('--batch-size', type=int, default=DEFAULT_SEED_BATCH_SIZE,
+                            help='Maximum number of adjacent seed lines to combine into one request. Gremlin addV/addE '
+                                 'lines are sent as a multi-statement request, and openCypher node CREATE lines as an '
+                                 f'UNWIND batch. Default is {DEFAULT_SEED_BATCH_SIZE}.')
+        return parser
+
+    @line_magic
+    @display_exceptions
+    @needs_local_scope
+    def seed(self, line, local_ns: dict = None):
+        """
+        Provides a way to bulk insert data to your endpoint via Gremlin, openCypher, or SPARQL queries. Via the form
+        generated by running %seed with no arguments, you can do either of the following:
+
+        a) select a data model (property-graph or RDF), then choose from among a number of different sample data sets
+        that Neptune provides.
+
+        b) select a query language to load with, then provide a path to a local file with insert queries,
+        or a directory containing multiple of these files.
+        """
+        parser = self._seed_parser()
         args = parser.parse_args(line.split())
 
         output = widgets.Output()
@@ -3237,80 +3574,15 @@ class Graph(Magics):
             seed_file_location.disabled = True
             submit_button.close()
 
-        def process_gremlin_query_line(query_line, line_index, q):
-            # Return a state here, with indication of any other variable states that need changing.
-            #  return 0 = continue
-            #  return 1 = continue, set any_errors_flag = True, error_count += 1
-            #  return 2 = progress.close() and return, set any_errors_flag = True, error_count += 1
-            if not query_line:
-                logger.debug(f"Skipped blank query at line {line_index + 1} in seed file {q['name']}")
-                return 0
-            try:
-                self.client.gremlin_query(query_line)
-                return 0
-            except GremlinServerError as gremlinEx:
-                try:
-                    error = json.loads(gremlinEx.args[0][5:])  # remove the leading error code.
-                    content = json.dumps(error, indent=2)
-                except Exception:
-                    content = {
-                        'error': gremlinEx
-                    }
-                logger.debug(f"GremlinServerError at line {line_index + 1} in seed file {q['name']}")
-                logger.debug(content)
-                if args.ignore_errors:
-                    return 1
-                else:
-                    with output:
-                        generate_seed_error_msg(content, q['name'], line_index + 1)
-                    return 2
-            except Exception as e:
-                content = {
-                    'error': e
-                }
-                logger.debug(f"Exception at line {line_index + 1} in seed file {q['name']}")
-                logger.debug(content)
-                if args.ignore_errors:
-                    return 1
-                else:
-                    with output:
-                        generate_seed_error_msg(content, q['name'], line_index + 1)
-                    return 2
+        def run_gremlin_seed_query(query):
+            if args.concurrency > 1:
+                self.client.gremlin_query(query, pool_size=args.concurrency)
+            else:
+                self.client.gremlin_query(query)
 
-        def process_cypher_query_line(query_line, line_index, q):
-            if not query_line:
-                logger.debug(f"Skipped blank query at line {line_index + 1} in seed file {q['name']}")
-                return 0
-            try:
-                cypher_res = self.client.opencypher_http(query_line)
-                cypher_res.raise_for_status()
-                return 0
-            except HTTPError as httpEx:
-                try:
-                    error = json.loads(httpEx.response.content.decode('utf-8'))
-                    content = json.dumps(error, indent=2)
-                except Exception:
-                    content = {
-                        'error': httpEx
-                    }
-                logger.debug(content)
-                if args.ignore_errors:
-                    return 1
-                else:
-                    with output:
-                        generate_seed_error_msg(content, q['name'])
-                    return 2
-            except Exception as ex:
-                content = {
-                    'error': str(ex)
-                }
-                logger.error(content)
-                if args.ignore_errors:
-                    return 1
-                else:
-                    with output:
-                        generate_seed_error_msg(content, q['name'])
-                    return 2
+        def run_cypher_seed_query(query):
+            cypher_res = self.client.opencypher_http(query)
+            cypher_res.raise_for_status()
 
         def on_button_clicked(b=None):
             seed_file_location_text_hbox.children = (seed_file_location_text,)
@@ -3362,102 +3634,119 @@ class Graph(Magics):
                     print('Query retrieval from files terminated with errors.')
                 return
 
-            load_index = 1  # start at 1 to have a non-empty progress bar
-            progress = widgets.IntProgress(
-                value=load_index,
-                min=0,
-                max=len(queries) + 1,  # len + 1 so we can start at index 1
-                orientation='horizontal',
-                bar_style='info',
-                description='Loading:'
-            )
-
-            with progress_output:
-                display(progress)
+            try:
+                def is_full_file_query(q):
+                    return fullfile_query or (source_dropdown.value == 'samples' and 'full' in q['name'])
 
-            error_count = 0
-            any_errors_flag = False
-            for q in queries:
-                with output:
-                    print(f'{progress.value}/{len(queries)}:\t{q["name"]}')
                 if model == 'rdf':
-                    try:
-                        self.client.sparql(q['content'], path=args.path)
-                    except HTTPError as httpEx:
-                        # attempt to turn response into json
+                    total_lines = len(queries)
+                else:
+                    total_lines = sum(1 if is_full_file_query(q) else q.line_count for q in queries)
+
+                load_index = 1  # start at 1 to have a non-empty progress bar
+                progress = widgets.IntProgress(
+                    value=load_index,
+                    min=0,
+                    max=total_lines + 1,  # len + 1 so we can start at index 1
+                    orientation='horizontal',
+                    bar_style='info',
+                    description='Loading:'
+                )
+
+                with progress_output:
+                    display(progress)
+
+                def advance_progress(line_count):
+                    progress.value += line_count
+
+                if seeding_language == 'opencypher':
+                    seed_runner = SeedRunner(run_cypher_seed_query, classify=classify_opencypher_line,
+                                             batch_key=opencypher_batch_key, combine=combine_opencypher_lines,
+                                             concurrency=args.concurrency, batch_size=args.batch_size,
+                                             ignore_errors=args.ignore_errors, on_progress=advance_progress,
+                                             atomic_batches=True)
+                else:
+                    seed_runner = SeedRunner(run_gremlin_seed_query, classify=classify_gremlin_line,
+                                             batch_key=gremlin_batch_key, combine=combine_gremlin_lines,
+                                             concurrency=args.concurrency, batch_size=args.batch_size,
+                                             ignore_errors=args.ignore_errors, on_progress=advance_progress,
+                                             # Gremlin Server, unlike Neptune, does not roll back a failed request
+                                             atomic_batches=self.client.is_neptune_domain())
+
+                error_count = 0
+                any_errors_flag = False
+                for file_index, q in enumerate(queries):
+                    with output:
+                        print(f'{file_index + 1}/{len(queries)}:\t{q["name"]}')
+                    if model == 'rdf':
                         try:
-                            error = json.loads(httpEx.response.content.decode('utf-8'))
-                            content = json.dumps(error, indent=2)
-                        except Exception:
+                            self.client.sparql(q['content'], path=args.path)
+                        except HTTPError as httpEx:
+                            # attempt to turn response into json
+                            try:
+                                error = json.loads(httpEx.response.content.decode('utf-8'))
+                                content = json.dumps(error, indent=2)
+                            except Exception:
+                                any_errors_flag = True
+                                error_count += 1
+                                content = {
+                                    'error': httpEx
+                                }
+                            logger.debug(content)
+                            if args.ignore_errors:
+                                progress.value += 1
+                                continue
+                            else:
+                                with output:
+                                    generate_seed_error_msg(content, q['name'])
+                                progress.close()
+                                return
+                        except Exception as ex:
                             any_errors_flag = True
                             error_count += 1
                             content = {
-                                'error': httpEx
+                                'error': str(ex)
                             }
-                        logger.debug(content)
-                        if args.ignore_errors:
-                            progress.value += 1
-                            continue
-                        else:
-                            with output:
-                                generate_seed_error_msg(content, q['name'])
-                            progress.close()
-                            return
-                    except Exception as ex:
-                        any_errors_flag = True
-                        error_count += 1
-                        content = {
-                            'error': str(ex)
-                        }
-                        logger.error(content)
-                        if args.ignore_errors:
-                            progress.value += 1
-                            continue
-                        else:
-                            with output:
-                                generate_seed_error_msg(content, q['name'])
-                            progress.close()
-                            return
-                else:  # gremlin and cypher
-                    # treat entire file content as one query
-                    if fullfile_query or (source_dropdown.value == 'samples' and 'full' in q['name']):
-                        if seeding_language == 'opencypher':
-                            query_status = process_cypher_query_line(q['content'], 0, q)
-                        else:
-                            query_status = process_gremlin_query_line(q['content'], 0, q)
-                        if query_status == 2:
-                            progress.close()
-                            return
-                        else:
-                            if query_status == 1:
-                                any_errors_flag = True
-                                error_count += 1
+                            logger.error(content)
+                            if args.ignore_errors:
                                 progress.value += 1
                                 continue
-                    else:  # treat each line as its own query
-                        for line_index, query_line in enumerate(q['content'].splitlines()):
-                            if seeding_language == 'opencypher':
-                                query_status = process_cypher_query_line(query_line, line_index, q)
                             else:
-                                query_status = process_gremlin_query_line(query_line, line_index, q)
-                            if query_status == 2:
+                                with output:
+                                    generate_seed_error_msg(content, q['name'])
                                 progress.close()
                                 return
-                            else:
-                                if query_status == 1:
-                                    any_errors_flag = True
-                                    error_count += 1
-
-                progress.value += 1
-            # Sleep for two seconds so the user sees the progress bar complete
-            time.sleep(2)
-            progress.close()
-            with output:
-                print('Done.')
-                if any_errors_flag:
-                    print(f'\n{error_count} individual queries were skipped due to errors. For more '
-                          f'information, please rerun the query with debug logs enabled (%enable_debug).')
-            return
+                        progress.value += 1
+                    else:  # gremlin and cypher
+                        if is_full_file_query(q):
+                            # treat entire file content as one query
+                            query_lines = [q['content']]
+                        else:
+                            # treat each line as its own query, reading the lines from the file as they are seeded
+                            query_lines = q
+                        if not seed_runner.run_file(q['name'], query_lines):
+                            seed_error = seed_runner.errors[0]
+                            with output:
+                                generate_seed_error_msg(seed_error_content(seed_error.exception), seed_error.file_name,
+                                                        seed_error.line_index + 1)
+                            progress.close()
+                            return
+
+                if seed_runner.errors:
+                    any_errors_flag = True
+                    error_count += len(seed_runner.errors)
+                # Sleep for two seconds so the user sees the progress bar complete
+                time.sleep(2)
+                progress.close()
+                with output:
+                    print('Done.')
+                    if any_errors_flag:
+                        print(f'\n{error_count} individual queries were skipped due to errors. For more '
+                              f'information, please rerun the query with debug logs enabled (%enable_debug).')
+                return
+            finally:
+                # removes the files downloaded for an S3 source
+                remove_seed_files(queries)
 
         submit_button.on_click(on_button_clicked)
         source_dropdown.observe(on_source_value_change, names='value')
@@ -3563,15 +3852,20 @@ class Graph(Magics):
     def graph_notebook_version(self, line):
         print(graph_notebook.__version__)
 
+    @cached_parser
+    def _graph_notebook_vis_options_parser(self) -> argparse.ArgumentParser:
+        parser = argparse.ArgumentParser()
+        parser.add_argument('--silent', action='store_true', default=False, help="Display no output.")
+        parser.add_argument('--store-to', type=str, default='', help='store visualization settings to this variable')
+        parser.add_argument('--load-from', type=str, default='', help='load visualization settings from this variable')
+        return parser
+
     @magic_variables
     @line_cell_magic
     @display_exceptions
     @needs_local_scope
     def graph_notebook_vis_options(self, line='', cell='', local_ns: dict = None):
-        parser = argparse.ArgumentParser()
-        parser.add_argument('--silent', action='store_true', default=False, help="Display no output.")
-        parser.add_argument('--store-to', type=str, default='', help='store visualization settings to this variable')
-        parser.add_argument('--load-from', type=str, default='', help='load visualization settings from this variable')
+        parser = self._graph_notebook_vis_options_parser()
         line_args = line.split()
         if line_args:
             if line_args[0] == 'reset':
@@ -3613,13 +3907,17 @@ class Graph(Magics):
 
         store_to_ns(args.store_to, json.dumps(self.graph_notebook_vis_options, indent=2), local_ns)
 
+    @cached_parser
+    def _neptune_ml_parser(self) -> argparse.ArgumentParser:
+        return generate_neptune_ml_parser()
+
     @magic_variables
     @line_cell_magic
     @display_exceptions
     @needs_local_scope
     @neptune_db_only
     def neptune_ml(self, line, cell='', local_ns: dict = None):
-        parser = generate_neptune_ml_parser()
+        parser = self._neptune_ml_parser()
         args = parser.parse_args(line.split())
         logger.info(f'received call to neptune_ml with details: {args.__dict__}, cell={cell}, local_ns={local_ns}')
         main_output = widgets.Output()
@@ -3630,11 +3928,8 @@ class Graph(Magics):
         with main_output:
             print(message)
 
-    def handle_opencypher_query(self, line, cell, local_ns, return_tabs=False):
-        """
-        This method in its own handler so that the magics %%opencypher and %%oc can both call it.
-        return_tabs: If True, return the titles and children lists instead of displaying the tab (which are later displayed by the caller function).
-        """
+    @cached_parser
+    def _opencypher_query_parser(self) -> argparse.ArgumentParser:
         parser = argparse.ArgumentParser()
         parser.add_argument('-pc', '--plan-cache', type=str.lower, default='auto',
                             help=f'Specifies the plan cache mode to use. '
@@ -3677,12 +3972,23 @@ class Graph(Magics):
                             help=f'Configures export type when using --store-to with base query mode. '
                                  f'Valid inputs: {QUERY_STORE_TO_FORMATS}. Default is JSON')
         parser.add_argument('--export-to', type=str, default='',
-                            help='Export the base query mode CSV result to the provided file path.')
+                            help='Export the base query mode CSV result to the provided file path. Paths ending in '
+                                 '.parquet, .jsonl or .csv.gz are instead written in that format directly from the '
+                                 'query results, in chunks, even with --silent.')
         parser.add_argument('--ignore-groups', action='store_true', default=False, help="Ignore all grouping options")
         parser.add_argument('-sp', '--stop-physics', action='store_true', default=False,
                             help="Disable visualization physics after the initial simulation stabilizes.")
         parser.add_argument('-sd', '--simulation-duration', type=int, default=1500,
                             help='Specifies maximum duration of visualization physics simulation. Default is 1500ms')
+        parser.add_argument('--layout', type=str.lower, choices=LAYOUT_OPTIONS, default=LAYOUT_PHYSICS,
+                            help=f'How to lay out the nodes of the graph visualization. {LAYOUT_PHYSICS} runs the '
+                                 f'physics simulation in the browser. {LAYOUT_PRECOMPUTED} computes the node positions '
+                                 f'in the kernel and disables physics, which renders large graphs much faster. '
+                                 f'Default is {LAYOUT_PHYSICS}.')
+        parser.add_argument('--max-nodes', type=int, default=0,
+                            help='Maximum number of nodes to draw in the graph visualization. Larger graphs are '
+                                 'collapsed into one node per group, which can be expanded by double-clicking it. '
+                                 'Default is 0, for no limit.')
         parser.add_argument('--silent', action='store_true', default=False, help="Display no query output.")
         parser.add_argument('-ct', '--connected-table', action='store_true', default=False,
                             help=f'Dynamically load jQuery and DataTables resources for iTables. For more information, see: '
@@ -3693,6 +3999,17 @@ class Graph(Magics):
                             help="Display the entire output without a scroll bar.")
         parser.add_argument('--hide-index', action='store_true', default=False,
                             help="Hide the index column numbers when displaying the results.")
+        parser.add_argument('--server-pagination', action='store_true', default=False,
+                            help="Keep the results in the kernel, and only send the page of results being viewed to "
+                                 "the browser. Recommended for large result sets.")
+        return parser
+
+    def handle_opencypher_query(self, line, cell, local_ns, return_tabs=False):
+        """
+        This method in its own handler so that the magics %%opencypher and %%oc can both call it.
+        return_tabs: If True, return the titles and children lists instead of displaying the tab (which are later displayed by the caller function).
+        """
+        parser = self._opencypher_query_parser()
         args = parser.parse_args(line.split())
         logger.debug(args)
         res = None
@@ -3757,7 +4074,8 @@ class Graph(Magics):
                                                   query_params=query_params,
                                                   plan_cache=args.plan_cache,
                                                   query_timeout=args.query_timeout,
-                                                  use_port=args.use_port)
+                                                  use_port=args.use_port,
+                                                  stream=True)
             query_time = time.time() * 1000 - query_start
             if oc_http.status_code == 400 and not self.client.is_analytics_domain() and args.plan_cache != "auto":
                 try:
@@ -3770,18 +4088,14 @@ class Graph(Magics):
                     pass
             oc_http.raise_for_status()
 
-            try:
-                res = oc_http.json()
-            except JSONDecodeError:
-                # handle JOLT format
-                res_list = oc_http.text.split()
-                print(res_list)
-                res = []
-                for result in res_list:
-                    result_map = json.loads(result)
-                    if "data" in result_map:
-                        res.append(result_map["data"])
-                res_format = "jolt"
+            if is_jolt_response(oc_http):
+                # decode the records of other databases as they are downloaded, into the form of Neptune results
+                res = read_jolt_results(oc_http.iter_content(JOLT_CHUNK_SIZE))
+            else:
+                try:
+                    res = oc_http.json()
+                except JSONDecodeError:
+                    res = read_jolt_results([oc_http.content])
 
             if not args.silent:
                 oc_metadata = build_opencypher_metadata_from_query(query_type='query', results=res,
@@ -3805,10 +4119,7 @@ class Graph(Magics):
                         gn.add_results(res)
                         logger.debug(f'number of nodes is {len(gn.graph.nodes)}')
                         if len(gn.graph.nodes) > 0:
-                            self.graph_notebook_vis_options['physics']['disablePhysicsAfterInitialSimulation'] \
-                                = args.stop_physics
-                            self.graph_notebook_vis_options['physics']['simulationDuration'] = args.simulation_duration
-                            force_graph_output = Force(network=gn, options=self.graph_notebook_vis_options)
+                            force_graph_output = self.build_force_widget(gn, args)
                             titles.append('Graph')
                             children.append(force_graph_output)
                     except (TypeError, ValueError) as network_creation_error:
@@ -3850,10 +4161,7 @@ class Graph(Magics):
                         gn.add_results(transformed_res)
                         logger.debug(f'number of nodes is {len(gn.graph.nodes)}')
                         if len(gn.graph.nodes) > 0:
-                            self.graph_notebook_vis_options['physics']['disablePhysicsAfterInitialSimulation'] \
-                                = args.stop_physics
-                            self.graph_notebook_vis_options['physics']['simulationDuration'] = args.simulation_duration
-                            force_graph_output = Force(network=gn, options=self.graph_notebook_vis_options)
+                            force_graph_output = self.build_force_widget(gn, args)
                             titles.append('Graph')
                             children.append(force_graph_output)
                     except (TypeError, ValueError) as network_creation_error:
@@ -3889,51 +4197,54 @@ class Graph(Magics):
 
             if results_df is not None:
                 with first_tab_output:
-                    visible_results, final_pagination_options, final_pagination_menu = generate_pagination_vars(
-                        args.results_per_page)
-                    oc_columndefs = [
-                        {"type": "string", "targets": "_all"},
-                        {"width": "5%", "targets": 0},
-                        {"visible": True, "targets": 0},
-                        {"searchable": False, "targets": 0},
-                        {"className": "nowrap dt-left", "targets": "_all"},
-                        {"createdCell": JavascriptFunction(index_col_js), "targets": 0},
-                        {"createdCell": JavascriptFunction(cell_style_js), "targets": "_all", }
-                    ]
-                    if args.hide_index:
-                        oc_columndefs[1]["visible"] = False
-                    init_notebook_mode(connected=args.connected_table)
-                    show(results_df,
-                         connected=args.connected_table,
-                         scrollX=True,
-                         scrollY=oc_scrollY,
-                         columnDefs=oc_columndefs,
-                         paging=oc_paging,
-                         scrollCollapse=oc_scrollCollapse,
-                         lengthMenu=[final_pagination_options, final_pagination_menu],
-                         pageLength=visible_results,
-                         buttons=[
-                             "pageLength",
-                             {
-                                 "extend": "copyHtml5",
-                                 "text": "Copy",
-                                 "exportOptions": RESULTS_EXPORT_OPTIONS
-                             },
-                             {
-                                 "extend": "csvHtml5",
-                                 "title": OC_RESULTS_FILENAME,
-                                 "text": "Download CSV",
-                                 "exportOptions": RESULTS_EXPORT_OPTIONS
-                             },
-                             {
-                                 "extend": "excelHtml5",
-                                 "filename": OC_RESULTS_FILENAME,
-                                 "title": None,
-                                 "text": "Download XLSX",
-                                 "exportOptions": RESULTS_EXPORT_OPTIONS
-                             }
-                         ]
-                         )
+                    if args.server_pagination:
+                        display_paginated_table(results_df, args.results_per_page, args.hide_index)
+                    else:
+                        visible_results, final_pagination_options, final_pagination_menu = generate_pagination_vars(
+                            args.results_per_page)
+                        oc_columndefs = [
+                            {"type": "string", "targets": "_all"},
+                            {"width": "5%", "targets": 0},
+                            {"visible": True, "targets": 0},
+                            {"searchable": False, "targets": 0},
+                            {"className": "nowrap dt-left", "targets": "_all"},
+                            {"createdCell": itables.JavascriptFunction(index_col_js), "targets": 0},
+                            {"createdCell": itables.JavascriptFunction(cell_style_js), "targets": "_all", }
+                        ]
+                        if args.hide_index:
+                            oc_columndefs[1]["visible"] = False
+                        init_itables(connected=args.connected_table)
+                        itables.show(results_df,
+                                     connected=args.connected_table,
+                                     scrollX=True,
+                                     scrollY=oc_scrollY,
+                                     columnDefs=oc_columndefs,
+                                     paging=oc_paging,
+                                     scrollCollapse=oc_scrollCollapse,
+                                     lengthMenu=[final_pagination_options, final_pagination_menu],
+                                     pageLength=visible_results,
+                                     buttons=[
+                                         "pageLength",
+                                         {
+                                             "extend": "copyHtml5",
+                                             "text": "Copy",
+                                             "exportOptions": RESULTS_EXPORT_OPTIONS
+                                         },
+                                         {
+                                             "extend": "csvHtml5",
+                                             "title": OC_RESULTS_FILENAME,
+                                             "text": "Download CSV",
+                                             "exportOptions": RESULTS_EXPORT_OPTIONS
+                                         },
+                                         {
+                                             "extend": "excelHtml5",
+                                             "filename": OC_RESULTS_FILENAME,
+                                             "title": None,
+                                             "text": "Download XLSX",
+                                             "exportOptions": RESULTS_EXPORT_OPTIONS
+                                         }
+                                     ]
+                                     )
             elif first_tab_html != "":
                 with first_tab_output:
                     display(HTML(first_tab_html))
@@ -3944,8 +4255,9 @@ class Graph(Magics):
             json_results = res
             res_store_type = args.store_format
             res_export_path = args.export_to
+            csv_export = res_export_path != '' and get_streaming_export_format(res_export_path) is None
 
-            if res_store_type in PANDAS_FORMATS or res_export_path != '':
+            if res_store_type in PANDAS_FORMATS or csv_export:
                 results_df = process_df_for_store(language='oc',
                                                   results_df=results_df)
 
@@ -3953,21 +4265,24 @@ class Graph(Magics):
                                                    pandas_results=results_df,
                                                    json_results=json_results)
 
-            export_csv_results(export_path=res_export_path,
-                               results_df=results_df)
+            if csv_export:
+                export_csv_results(export_path=res_export_path,
+                                   results_df=results_df)
         else:
             stored_results = res
 
+        if args.mode in ['query', 'bolt'] and args.export_to != '':
+            rows_and_columns = opencypher_get_rows_and_columns(res, res_format)
+            if rows_and_columns:
+                export_streamed_results(args.export_to, rows_and_columns['columns'], rows_and_columns['rows'])
+
         store_to_ns(args.store_to, stored_results, local_ns)
 
         if return_tabs:
             return {'titles': titles, 'children': children}
 
-    def handle_opencypher_status(self, line, local_ns):
-        """
-        This is refactored into its own handler method so that we can invoke it from
-        %opencypher_status or from %oc_status
-        """
+    @cached_parser
+    def _opencypher_status_parser(self) -> argparse.ArgumentParser:
         parser = argparse.ArgumentParser()
         parser.add_argument('-q', '--queryId', default='',
                             help='The ID of a running OpenCypher query. '
@@ -3990,6 +4305,14 @@ class Graph(Magics):
                                  'the query is cancelled with an HTTP 500 status code.')
         parser.add_argument('--silent', action='store_true', default=False, help="Display no output.")
         parser.add_argument('--store-to', type=str, default='', help='store query result to this variable')
+        return parser
+
+    def handle_opencypher_status(self, line, local_ns):
+        """
+        This is refactored into its own handler method so that we can invoke it from
+        %opencypher_status or from %oc_status
+        """
+        parser = self._opencypher_status_parser()
         args = parser.parse_args(line.split())
 
         using_analytics = self.client.is_analytics_domain()
@@ -4040,6 +4363,31 @@ class Graph(Magics):
             if not args.silent:
                 display_json(js)
 
+    @cached_parser
+    def _degree_distribution_parser(self) -> argparse.ArgumentParser:
+        parser = argparse.ArgumentParser()
+
+        # traversalDirection: Type of the degree computed:
+        # - inbound: Counts only the incoming edges for each vertex
+        # - outbound: Counts only the outgoing edges for each vertex
+        # - both [default]: Counts both the incoming and outgoing edges for each vertex.
+        parser.add_argument('--traversalDirection', nargs='?', type=str.lower, default='both',
+                            help=f'Type of the degree for which the distribution is shown. Valid inputs: {TRAVERSAL_DIRECTIONS}. '
+                                 f'Default: both.')
+        
+        # vertexLabels: List of the vertex labels, space separated, for which the degrees are computed:
+        # - default value is empty list, which means the degrees are computed for any vertex label.
+        parser.add_argument('--vertexLabels', nargs='*', default=[],
+                            help="The vertex labels for which the induced graph is considered and the degree distribution is shown. "
+                                 "If not supplied, we will default to using all the vertex labels.")
+        
+        # edgeLabels: List of the edge labels, space separated, for which the degrees are computed:
+        # - default value is empty list, which means the degrees are computed for any edge label.
+        parser.add_argument('--edgeLabels', nargs='*', default=[],
+                            help="The edge labels for which the degree distribution is shown. If not supplied, "
+                                 "we will default to using all the edge labels.")
+        return parser
+
     # %degreeDistribution magic command.
     # It obtains the degree distribution of a graph in the form of a visual histogram in notebook. Histogram simply
     # shows the number of vertices with a given degree, where degree is shown on the x-axis and the count on y-axis.
@@ -4060,8 +4408,6 @@ class Graph(Magics):
         if not self.client.is_analytics_domain():
             print("This command is only supported for Neptune Analytics domains.")
             return
-    
-        parser = argparse.ArgumentParser()
 
         # Get the vertexLabels and edgeLabels from graph summary, to be shown in the widgets for selection.
         try:
@@ -4076,26 +4422,7 @@ class Graph(Magics):
             print(f"Error retrieving graph summary: {e}")
             return
 
-        # traversalDirection: Type of the degree computed:
-        # - inbound: Counts only the incoming edges for each vertex
-        # - outbound: Counts only the outgoing edges for each vertex
-        # - both [default]: Counts both the incoming and outgoing edges for each vertex.
-        parser.add_argument('--traversalDirection', nargs='?', type=str.lower, default='both',
-                            help=f'Type of the degree for which the distribution is shown. Valid inputs: {TRAVERSAL_DIRECTIONS}. '
-                                 f'Default: both.')
-        
-        # vertexLabels: List of the vertex labels, space separated, for which the degrees are computed:
-        # - default value is empty list, which means the degrees are computed for any vertex label.
-        parser.add_argument('--vertexLabels', nargs='*', default=[],
-                            help="The vertex labels for which the induced graph is considered and the degree distribution is shown. "
-                                 "If not supplied, we will default to using all the vertex labels.")
-        
-        # edgeLabels: List of the edge labels, space separated, for which the degrees are computed:
-        # - default value is empty list, which means the degrees are computed for any edge label.
-        parser.add_argument('--edgeLabels', nargs='*', default=[],
-                            help="The edge labels for which the degree distribution is shown. If not supplied, "
-                                 "we will default to using all the edge labels.")
-        
+        parser = self._degree_distribution_parser()
         args = parser.parse_args(line.split())
         
         #  Validate traversal direction argument
@@ -38,12 +38,13 @@ class Metadata(object):
     def set_metric_value(self, metric_name, value):
         self.metrics[metric_name].set_value(value)
 
-    def set_request_metrics(self, res: Response):
+    def set_request_metrics(self, res: Response, resp_size: int = None):
+        # the content of a streamed response is consumed as it is read, so its size is passed in instead
         raw_request_time = 1000 * res.elapsed.total_seconds()
         self.set_metric_value('request_time', round(raw_request_time, 2))
         self.set_metric_value('status', res.status_code)
         self.set_metric_value('status_ok', res.ok)
-        self.set_metric_value('resp_size', sys.getsizeof(res.content))
+        self.set_metric_value('resp_size', sys.getsizeof(res.content) if resp_size is None else resp_size)
 
     def to_dict(self):
         metadata_dict = {}
@@ -187,14 +188,15 @@ def create_sparql_metadata_obj(q_mode: str) -> Metadata:
     return metadata_obj
 
 
-def build_sparql_metadata_from_query(query_type: str, res: Response, results: any = None, scd_query: bool = False) -> Metadata:
+def build_sparql_metadata_from_query(query_type: str, res: Response, results: any = None, scd_query: bool = False,
+                                     resp_size: int = None) -> Metadata:
     if query_type == 'explain':
         sparql_metadata = create_sparql_metadata_obj('explain')
         sparql_metadata.set_request_metrics(res)
         return sparql_metadata
     else:  # default Sparql query
         sparql_metadata = create_sparql_metadata_obj('query')
-        sparql_metadata.set_request_metrics(res)
+        sparql_metadata.set_request_metrics(res, resp_size)
         if scd_query:
             sparql_metadata.set_metric_value('results', len(results['results']['bindings']))
         return sparql_metadata
@@ -223,7 +225,7 @@ def build_gremlin_metadata_from_query(query_type: str, results: any, res: Respon
 
 def build_opencypher_metadata_from_query(query_type: str, results: any, results_type: str = None, res: Response = None,
                                          query_time: float = None) -> Metadata:
-    if results_type in ['bolt', 'jolt', 'explain']:
+    if results_type in ['bolt', 'explain']:
         res_final = results
     else:
         res_final = results['results']
@@ -5,7 +5,6 @@ import logging
 import time
 
 from IPython.core.display import display
-from botocore.session import get_session
 from ipywidgets import widgets
 from requests import Response
 
@@ -381,6 +380,7 @@ def neptune_ml_export(args: argparse.Namespace, client: Client, output: widgets.
         .with_tls(client.ssl)
 
     if args.export_iam:
+        from botocore.session import get_session
         builder = builder.with_iam(get_session())
     export_client = builder.build()
 
@@ -3,33 +3,37 @@ Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 SPDX-License-Identifier: Apache-2.0
 """
 
+from __future__ import annotations  # annotations such as boto3.Session must not import boto3
+
 import json
 import logging
 import re
 import datetime
+import threading
+import time
+from contextlib import contextmanager
 
 import requests
 import urllib3
 from urllib.parse import urlparse, urlunparse
-from SPARQLWrapper import SPARQLWrapper
-from boto3 import Session
-from boto3 import client as boto3_client
-from botocore.session import Session as botocoreSession
-from botocore.auth import SigV4Auth
-from botocore.awsrequest import AWSRequest
 from botocore.exceptions import ClientError
 from gremlin_python.driver import client, serializer
 from gremlin_python.driver.protocol import GremlinServerError
-from gremlin_python.driver.aiohttp.transport import AiohttpTransport
-from neo4j import GraphDatabase, DEFAULT_DATABASE
-from neo4j.exceptions import AuthError
 from base64 import b64encode
 import nest_asyncio
 from networkx import is_valid_directed_joint_degree
 
-from graph_notebook.neptune.bolt_auth_token import NeptuneBoltAuthToken
+from graph_notebook.lazy_import import lazy_import
+from graph_notebook.neptune.jolt import JOLT_MEDIA_TYPE
+from graph_notebook.neptune.signing import RefreshingCredentialProvider, sign_prepared_request
 from graph_notebook.neptune.utils import serialize_query_params
 
+# the neo4j driver is only needed for Bolt queries, and takes longer to load than the rest of the magics together
+neo4j = lazy_import('neo4j')
+# boto3 and botocore sessions are only needed for IAM authentication and Neptune Analytics
+boto3 = lazy_import('boto3')
+botocore_session = lazy_import('botocore.session')
+
 # This patch is no longer needed when graph_notebook is using the a Gremlin Python
 # client >= 3.5.0 as the HashableDict is now part of that client driver.
 # import graph_notebook.neptune.gremlin.graphsonV3d0_MapType_objectify_patch  # noqa F401
@@ -40,7 +44,7 @@ DEFAULT_PORT = 8182
 DEFAULT_REGION = 'us-east-1'
 DEFAULT_NEO4J_USERNAME = 'neo4j'
 DEFAULT_NEO4J_PASSWORD = 'password'
-DEFAULT_NEO4J_DATABASE = DEFAULT_DATABASE
+DEFAULT_NEO4J_DATABASE = None  # neo4j.DEFAULT_DATABASE, the default database of the server
 
 NEPTUNE_DB_SERVICE_NAME = 'neptune-db'
 NEPTUNE_ANALYTICS_SERVICE_NAME = 'neptune-graph'
@@ -201,6 +205,12 @@ GRAPH_PG_INFO_METRICS = {'numVertices', 'numEdges', 'numVertexProperties', 'numE
 
 TRAVERSAL_DIRECTIONS = ['both', 'inbound', 'outbound']
 
+# The driver replays the SigV4 handshake headers whenever it (re)opens a socket, and Neptune only accepts a signature
+# for a few minutes, so IAM-signed pooled connections are recycled before that window closes.
+GREMLIN_IAM_CONNECTION_MAX_AGE = 240
+# Same constraint for the Bolt auth token, which is re-signed for new connections after this many seconds.
+BOLT_IAM_AUTH_TTL = 240
+
 def is_allowed_neptune_host(hostname: str, host_allowlist: list) -> bool:
     """
     Return True iff ``hostname`` matches one of the entries in
@@ -347,6 +357,27 @@ def generate_snapshot_name(graph_id: str):
     return snapshot_name
 
 
+class PooledGremlinConnection(object):
+    """
+    A long-lived gremlin_python client held by Client, along with the bookkeeping needed to decide when it has to be
+    recycled (credential rotation, age of the signed handshake, or the connection having been closed).
+    """
+
+    def __init__(self, connection, credentials_id=None):
+        self.connection = connection
+        self.credentials_id = credentials_id
+        self.created_at = time.monotonic()
+        self.leases = 0
+        self.retired = False
+
+    def is_stale(self, credentials_id=None, max_age: float = None) -> bool:
+        if self.retired or self.connection.is_closed():
+            return True
+        if credentials_id != self.credentials_id:
+            return True
+        return max_age is not None and time.monotonic() - self.created_at > max_age
+
+
 class Client(object):
     def __init__(self, host: str, port: int = DEFAULT_PORT,
                  neptune_service: str = NEPTUNE_DB_SERVICE_NAME,
@@ -357,7 +388,7 @@ class Client(object):
                  gremlin_serializer: str = DEFAULT_GREMLIN_SERIALIZER,
                  neo4j_username: str = DEFAULT_NEO4J_USERNAME, neo4j_password: str = DEFAULT_NEO4J_PASSWORD,
                  neo4j_auth: bool = True, neo4j_database: str = DEFAULT_NEO4J_DATABASE,
-                 auth=None, session: Session = None,
+                 auth=None, session: boto3.Session = None,
                  proxy_host: str = '', proxy_port: int = DEFAULT_PORT,
                  neptune_hosts: list = None, neptune_client_endpoint: str = None):
         self.target_host = host
@@ -379,6 +410,7 @@ class Client(object):
         self.region = region
         self._auth = auth
         self._session = session
+        self._credential_provider = None
         self.proxy_host = proxy_host
         self.proxy_port = proxy_port
         self.neptune_hosts = NEPTUNE_CONFIG_HOST_IDENTIFIERS if neptune_hosts is None else neptune_hosts
@@ -387,12 +419,25 @@ class Client(object):
         self._ws_protocol = 'wss' if self.ssl else 'ws'
 
         self._http_session = None
+        self._gremlin_connections = {}
+        self._gremlin_connections_lock = threading.Lock()
+        self._opencypher_driver = None
+        self._opencypher_driver_expires_at = None
+        self._neptune_engine_version = None
 
-        if neptune_client_endpoint is not None:
-            self.neptune_graph_client = boto3_client(service_name='neptune-graph', region_name=self.region,
-                                                     endpoint_url=neptune_client_endpoint)
-        else:
-            self.neptune_graph_client = boto3_client(service_name='neptune-graph', region_name=self.region)
+        self.neptune_client_endpoint = neptune_client_endpoint
+        self._neptune_graph_client = None
+
+    @property
+    def neptune_graph_client(self):
+        # made on first use, as loading boto3 and the service model takes a large share of the time to start the magics
+        if self._neptune_graph_client is None:
+            if self.neptune_client_endpoint is not None:
+                self._neptune_graph_client = boto3.client(service_name='neptune-graph', region_name=self.region,
+                                                          endpoint_url=self.neptune_client_endpoint)
+            else:
+                self._neptune_graph_client = boto3.client(service_name='neptune-graph', region_name=self.region)
+        return self._neptune_graph_client
 
     @property
     def host(self):
@@ -441,12 +486,13 @@ class Client(object):
         graph_id = graph_host.split('.')[0]
         return graph_id
 
-    def sparql_query(self, query: str, headers=None, explain: str = '', path: str = '') -> requests.Response:
+    def sparql_query(self, query: str, headers=None, explain: str = '', path: str = '',
+                     stream: bool = False) -> requests.Response:
         if headers is None:
             headers = {}
 
         data = {'query': query}
-        return self.do_sparql_request(data, headers, explain, path=path)
+        return self.do_sparql_request(data, headers, explain, path=path, stream=stream)
 
     def sparql_update(self, update: str, headers=None, explain: str = '', path: str = '') -> requests.Response:
         if headers is None:
@@ -455,7 +501,7 @@ class Client(object):
         data = {'update': update}
         return self.do_sparql_request(data, headers, explain, path=path)
 
-    def do_sparql_request(self, data: dict, headers=None, explain: str = '', path: str = ''):
+    def do_sparql_request(self, data: dict, headers=None, explain: str = '', path: str = '', stream: bool = False):
         if 'content-type' not in headers:
             headers['content-type'] = DEFAULT_SPARQL_CONTENT_TYPE
 
@@ -473,18 +519,25 @@ class Client(object):
 
         uri = f'{self._http_protocol}://{self.host}:{self.port}{sparql_path}'
         req = self._prepare_request('POST', uri, data=data, headers=headers)
-        res = self._http_session.send(req, verify=self.ssl_verify)
+        res = self._http_session.send(req, verify=self.ssl_verify, stream=stream)
         return res
 
-    def sparql(self, query: str, headers=None, explain: str = '', path: str = '') -> requests.Response:
+    def sparql(self, query: str, headers=None, explain: str = '', path: str = '',
+               stream: bool = False) -> requests.Response:
+        """
+        Sends a SPARQL query or update. With stream=True, the body of a query response is not downloaded until it is
+        read, so that it can be parsed incrementally with iter_content.
+        """
         if headers is None:
             headers = {}
 
+        from SPARQLWrapper import SPARQLWrapper
+
         s = SPARQLWrapper('')
         s.setQuery(query)
         query_type = s.queryType.upper()
         if query_type in ['SELECT', 'CONSTRUCT', 'ASK', 'DESCRIBE']:
-            return self.sparql_query(query, headers, explain, path=path)
+            return self.sparql_query(query, headers, explain, path=path, stream=stream)
         else:
             return self.sparql_update(query, headers, explain, path=path)
 
@@ -507,7 +560,9 @@ class Client(object):
             raise ValueError('query_id must be a non-empty string')
         return self._query_status('sparql', query_id=query_id, silent=silent, cancelQuery=True)
 
-    def get_gremlin_connection(self, transport_kwargs) -> client.Client:
+    def get_gremlin_connection(self, transport_kwargs, pool_size: int = None) -> client.Client:
+        from gremlin_python.driver.aiohttp.transport import AiohttpTransport
+
         nest_asyncio.apply()
 
         ws_url = f'{self.get_uri(use_websocket=True, use_proxy=False)}/gremlin'
@@ -522,30 +577,133 @@ class Client(object):
 
         traversal_source = 'g' if self.is_neptune_domain() else self.gremlin_traversal_source
         message_serializer = get_gremlin_serializer_driver_class(self.gremlin_serializer)
-        return client.Client(ws_url, traversal_source, transport_factory=transport_factory_args,
+        return client.Client(ws_url, traversal_source, transport_factory=transport_factory_args, pool_size=pool_size,
                              username=self.gremlin_username, password=self.gremlin_password,
                              message_serializer=message_serializer,
                              headers=dict(request.headers), **transport_kwargs)
 
-    def gremlin_query(self, query, transport_args=None, bindings=None):
-        if transport_args is None:
-            transport_args = {}
-        c = self.get_gremlin_connection(transport_args)
+    def _gremlin_connection_key(self, transport_kwargs: dict, pool_size: int = None) -> tuple:
+        traversal_source = 'g' if self.is_neptune_domain() else self.gremlin_traversal_source
+        return (self.gremlin_serializer, traversal_source, self.proxy_host, self.proxy_port,
+                tuple(sorted(transport_kwargs.items())), pool_size)
+
+    def _gremlin_credentials_id(self):
+        if not self.iam_enabled:
+            return None
         try:
-            result = c.submit(query, bindings)
-            future_results = result.all()
-            results = future_results.result()
-            c.close()
-            return results
+            frozen_creds = self.credential_provider.get_frozen_credentials()
+        except AttributeError:
+            return None
+        return frozen_creds.access_key, frozen_creds.token
+
+    @contextmanager
+    def pooled_gremlin_connection(self, transport_kwargs: dict = None, pool_size: int = None):
+        """
+        Lease a pooled WebSocket connection for the given transport settings, opening (or recycling) it if needed.
+        Connections that fail with anything other than a GremlinServerError are dropped from the pool, since that
+        usually means the server closed the socket underneath us.
+        """
+        if transport_kwargs is None:
+            transport_kwargs = {}
+        key = self._gremlin_connection_key(transport_kwargs, pool_size)
+        credentials_id = self._gremlin_credentials_id()
+        max_age = GREMLIN_IAM_CONNECTION_MAX_AGE if self.iam_enabled else None
+
+        with self._gremlin_connections_lock:
+            pooled = self._gremlin_connections.get(key)
+            if pooled is not None and pooled.is_stale(credentials_id, max_age):
+                self._retire_gremlin_connection(key, pooled)
+                pooled = None
+            if pooled is None:
+                pooled = PooledGremlinConnection(self.get_gremlin_connection(transport_kwargs, pool_size),
+                                                 credentials_id)
+                self._gremlin_connections[key] = pooled
+            pooled.leases += 1
+
+        try:
+            yield pooled.connection
+        except GremlinServerError:
+            raise
+        except Exception:
+            with self._gremlin_connections_lock:
+                self._retire_gremlin_connection(key, pooled)
+            raise
+        finally:
+            with self._gremlin_connections_lock:
+                pooled.leases -= 1
+                if pooled.retired and pooled.leases == 0:
+                    pooled.connection.close()
+
+    def _retire_gremlin_connection(self, key, pooled: PooledGremlinConnection):
+        # callers must hold _gremlin_connections_lock
+        if self._gremlin_connections.get(key) is pooled:
+            del self._gremlin_connections[key]
+        if pooled.retired:
+            return
+        pooled.retired = True
+        if pooled.leases == 0:
+            pooled.connection.close()
+
+    def close_gremlin_connections(self):
+        with self._gremlin_connections_lock:
+            for key, pooled in list(self._gremlin_connections.items()):
+                try:
+                    self._retire_gremlin_connection(key, pooled)
+                except Exception as e:
+                    logger.debug(f'Failed to close pooled Gremlin connection: {e}')
+            self._gremlin_connections = {}
+
+    def gremlin_query(self, query, transport_args=None, bindings=None, pool_size: int = None):
+        with self.pooled_gremlin_connection(transport_args, pool_size) as c:
+            try:
+                result = c.submit(query, bindings)
+                future_results = result.all()
+                return future_results.result()
+            except GremlinServerError as e:
+                self._check_gremlin_traversal_source_error(e)
+                raise e
+
+    def gremlin_query_stream(self, query, transport_args=None, bindings=None, max_results: int = None,
+                             batch_size: int = None):
+        """
+        Yields the results of a Gremlin query in the batches the server sends them in, instead of waiting for the
+        whole result set to be buffered. Once max_results have been read, the rest of the response is abandoned and,
+        on Neptune, the traversal is cancelled on the server.
+        """
+        request_options = {'batchSize': batch_size} if batch_size else None
+        with self.pooled_gremlin_connection(transport_args) as c:
+            try:
+                result_set = c.submit(query, bindings, request_options)
+                result_count = 0
+                for batch in result_set:
+                    if max_results and result_count + len(batch) >= max_results:
+                        yield batch[:max_results - result_count]
+                        if not result_set.done.done():
+                            self._cancel_streamed_gremlin_query(result_set.request_id)
+                        return
+                    result_count += len(batch)
+                    yield batch
+            except GremlinServerError as e:
+                self._check_gremlin_traversal_source_error(e)
+                raise e
+
+    def _cancel_streamed_gremlin_query(self, request_id):
+        # Neptune uses the WebSocket request id as the query id. Other servers keep sending the remaining batches,
+        # which the driver drains in the background.
+        if not self.is_neptune_domain() or self.is_analytics_domain():
+            return
+        try:
+            self.gremlin_cancel(str(request_id))
         except Exception as e:
-            if isinstance(e, GremlinServerError):
-                source_err = re.compile('The traversal source \\[.] for alias \\[.] is not configured on the server\\.')
-                if e.status_code == 499 and source_err.search(str(e)):
-                    print("Error returned by the Gremlin Server for the traversal_source specified in notebook "
-                          "configuration. Please ensure that your graph database endpoint supports re-naming of "
-                          "GraphTraversalSource from the default of 'g' in Gremlin Server.")
-            c.close()
-            raise e
+            logger.debug(f'Unable to cancel Gremlin query {request_id}: {e}')
+
+    @staticmethod
+    def _check_gremlin_traversal_source_error(e: GremlinServerError):
+        source_err = re.compile('The traversal source \\[.] for alias \\[.] is not configured on the server\\.')
+        if e.status_code == 499 and source_err.search(str(e)):
+            print("Error returned by the Gremlin Server for the traversal_source specified in notebook "
+                  "configuration. Please ensure that your graph database endpoint supports re-naming of "
+                  "GraphTraversalSource from the default of 'g' in Gremlin Server.")
 
     def gremlin_http_query(self, query, headers=None, query_params: dict = None,
                            use_port: bool = False) -> requests.Response:
@@ -623,7 +781,12 @@ class Client(object):
                         query_params: dict = None,
                         plan_cache: str = None,
                         query_timeout: int = None,
-                        use_port: bool = False) -> requests.Response:
+                        use_port: bool = False,
+                        stream: bool = False) -> requests.Response:
+        """
+        Sends an openCypher query over HTTP. Queries to hosts other than Neptune go to the Neo4j HTTP API, which
+        responds in JOLT. With stream=True, the body of the response is not downloaded until it is read.
+        """
         if headers is None:
             headers = {}
 
@@ -663,7 +826,7 @@ class Client(object):
         else:
             url += 'db/neo4j/tx/commit'
             headers['content-type'] = 'application/json'
-            headers['Accept'] = 'application/vnd.neo4j.jolt+json-seq'
+            headers['Accept'] = JOLT_MEDIA_TYPE
 
             data_dict = {
                 "statements": [
@@ -679,11 +842,11 @@ class Client(object):
                 headers['authorization'] = user_and_pass_base64
 
         req = self._prepare_request('POST', url, data=data, headers=headers)
-        res = self._http_session.send(req, verify=self.ssl_verify)
+        res = self._http_session.send(req, verify=self.ssl_verify, stream=stream)
         return res
 
     def opencyper_bolt(self, query: str, **kwargs):
-        driver = self.get_opencypher_driver()
+        driver = self._get_cached_opencypher_driver()
         with driver.session(database=self.neo4j_database) as session:
             try:
                 res = session.run(query, kwargs)
@@ -715,11 +878,11 @@ class Client(object):
                         else:
                             record_dict[key] = value
                     data.append(record_dict)
-            except AuthError:
+            except neo4j.exceptions.AuthError:
                 print("Neo4J Bolt request failed with an authentication error. Please ensure that the 'neo4j' section "
                       "of your %graph_notebook_config contains the correct credentials and auth setting.")
                 data = []
-        driver.close()
+                self._close_opencypher_driver()
         return data
 
     def opencypher_status(self, query_id: str = '', include_waiting: bool = False, state: str = '',
@@ -744,17 +907,9 @@ class Client(object):
         if self.is_neptune_domain():
             if self._session and self.iam_enabled:
                 # check engine version via status API to determine if we need the OC endpoint path
-                status_res = self.status()
-                status_res.raise_for_status()
-                status_res_json = status_res.json()
-                engine_version_raw = status_res_json["dbEngineVersion"]
-                engine_version = int(engine_version_raw.rsplit('.', 1)[0].replace('.', ''))
-                if engine_version >= 1200:
+                if self._get_neptune_engine_version() >= 1200:
                     url += "/opencypher"
-
-                credentials = self._session.get_credentials()
-                frozen_creds = credentials.get_frozen_credentials()
-                auth_final = NeptuneBoltAuthToken(frozen_creds, self.region, url)
+                auth_final = self._get_bolt_iam_auth(url)
             else:
                 user = 'username'
                 password = DEFAULT_NEO4J_PASSWORD
@@ -765,9 +920,54 @@ class Client(object):
             else:
                 auth_final = None
 
-        driver = GraphDatabase.driver(url, auth=auth_final, encrypted=self.ssl)
+        driver = neo4j.GraphDatabase.driver(url, auth=auth_final, encrypted=self.ssl)
         return driver
 
+    def _get_neptune_engine_version(self) -> int:
+        # the engine version cannot change underneath a Client, so the status round trip is only made once
+        if self._neptune_engine_version is None:
+            status_res = self.status()
+            status_res.raise_for_status()
+            status_res_json = status_res.json()
+            engine_version_raw = status_res_json["dbEngineVersion"]
+            self._neptune_engine_version = int(engine_version_raw.rsplit('.', 1)[0].replace('.', ''))
+        return self._neptune_engine_version
+
+    def _get_bolt_iam_auth(self, url: str):
+        from graph_notebook.neptune.bolt_auth_token import NeptuneBoltAuthToken
+
+        def sign():
+            frozen_creds = self.credential_provider.get_frozen_credentials()
+            return NeptuneBoltAuthToken(frozen_creds, self.region, url)
+
+        try:
+            from neo4j.auth_management import AuthManagers, ExpiringAuth
+            # expiration_based was renamed to bearer when re-auth support left preview in neo4j 5.14
+            expiring_auth_manager = getattr(AuthManagers, 'bearer', None) or AuthManagers.expiration_based
+        except (ImportError, AttributeError):  # neo4j < 5.8 has no re-auth support, so the cached driver is rebuilt
+            self._opencypher_driver_expires_at = time.monotonic() + BOLT_IAM_AUTH_TTL
+            return sign()
+        return expiring_auth_manager(lambda: ExpiringAuth(sign(), expires_at=time.time() + BOLT_IAM_AUTH_TTL))
+
+    def _get_cached_opencypher_driver(self):
+        expires_at = self._opencypher_driver_expires_at
+        if self._opencypher_driver is not None and expires_at is not None and time.monotonic() > expires_at:
+            self._close_opencypher_driver()
+        if self._opencypher_driver is None:
+            self._opencypher_driver_expires_at = None
+            self._opencypher_driver = self.get_opencypher_driver()
+        return self._opencypher_driver
+
+    def _close_opencypher_driver(self):
+        driver = self._opencypher_driver
+        self._opencypher_driver = None
+        self._opencypher_driver_expires_at = None
+        if driver is not None:
+            try:
+                driver.close()
+            except Exception as e:
+                logger.debug(f'Failed to close cached Bolt driver: {e}')
+
     def stream(self, url, **kwargs) -> requests.Response:
         params = {}
         for k, v in kwargs.items():
@@ -1193,47 +1393,52 @@ class Client(object):
             headers = {} if headers is None else headers
             headers["Host"] = self.target_host
         request = requests.Request(method=method, url=url, data=data, params=params, headers=headers, auth=self._auth)
-        if self._session is not None:
-            aws_request = self._get_aws_request(method=method, url=url, data=data, params=params, headers=headers,
-                                                service=service)
-            request.headers = dict(aws_request.headers)
+        prepared_request = request.prepare()
+        if self.iam_enabled:
+            self._sign_request(prepared_request, url, params, service)
+        return prepared_request
 
-        return request.prepare()
+    def _sign_request(self, prepared_request, url, params, service):
+        try:
+            frozen_creds = self.credential_provider.get_frozen_credentials()
+        except AttributeError:
+            print("Could not find valid IAM credentials in any the following locations:\n")
+            print("env, assume-role, assume-role-with-web-identity, sso, shared-credential-file, custom-process, "
+                  "config-file, ec2-credentials-file, boto-config, container-role, iam-role\n")
+            print("Go to https://boto3.amazonaws.com/v1/documentation/api/latest/guide/credentials.html for more "
+                  "details on configuring your IAM credentials.")
+            return prepared_request
+        return sign_prepared_request(prepared_request, frozen_creds, service, self.region, url=url, params=params)
 
-    def _get_aws_request(self, method, url, *, data=None, params=None, headers=None, service=None):
-        req = AWSRequest(method=method, url=url, data=data, params=params, headers=headers)
-        if self.iam_enabled:
-            credentials = self._session.get_credentials()
-            try:
-                frozen_creds = credentials.get_frozen_credentials()
-            except AttributeError:
-                print("Could not find valid IAM credentials in any the following locations:\n")
-                print("env, assume-role, assume-role-with-web-identity, sso, shared-credential-file, custom-process, "
-                      "config-file, ec2-credentials-file, boto-config, container-role, iam-role\n")
-                print("Go to https://boto3.amazonaws.com/v1/documentation/api/latest/guide/credentials.html for more "
-                      "details on configuring your IAM credentials.")
-                return req
-            SigV4Auth(frozen_creds, service, self.region).add_auth(req)
-            prepared_iam_req = req.prepare()
-            return prepared_iam_req
-        else:
-            return req
+    @property
+    def credential_provider(self) -> RefreshingCredentialProvider:
+        if self._credential_provider is None:
+            self._credential_provider = RefreshingCredentialProvider(self._session)
+        return self._credential_provider
 
     def _ensure_http_session(self):
         if not self._http_session:
             self._http_session = requests.Session()
 
-    def set_session(self, session: Session):
+    def set_session(self, session: boto3.Session):
         self._session = session
+        if self._credential_provider is not None:
+            self._credential_provider.close()
+            self._credential_provider = None
 
     def close(self):
+        self.close_gremlin_connections()
+        self._close_opencypher_driver()
+        if self._credential_provider is not None:
+            self._credential_provider.close()
         if self._http_session:
             self._http_session.close()
             self._http_session = None
 
     @property
     def iam_enabled(self):
-        return type(self._session) in [Session, botocoreSession]
+        # a session can only have been made if boto3 and botocore have already been loaded
+        return self._session is not None and type(self._session) in [boto3.Session, botocore_session.Session]
 
 
 class ClientBuilder(object):
@@ -1290,7 +1495,7 @@ class ClientBuilder(object):
         self.args['region'] = region
         return ClientBuilder(self.args)
 
-    def with_iam(self, session: Session):
+    def with_iam(self, session: boto3.Session):
         self.args['session'] = session
         return ClientBuilder(self.args)
 
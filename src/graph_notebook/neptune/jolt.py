@@ -0,0 +1,122 @@
+"""
+Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import json
+from typing import Iterable, Iterator
+
+JOLT_MEDIA_TYPE = 'application/vnd.neo4j.jolt+json-seq'
+JOLT_CHUNK_SIZE = 64 * 1024
+
+RECORD_SEPARATOR = b'\x1e'
+
+# entities are decoded into the same maps as the openCypher results of Neptune, so that OCNetwork can draw them
+ENTITY_TYPE_KEY = '~entityType'
+ID_KEY = '~id'
+LABELS_KEY = '~labels'
+PROPERTIES_KEY = '~properties'
+START_KEY = '~start'
+END_KEY = '~end'
+TYPE_KEY = '~type'
+
+
+def decode_jolt_value(value):
+    """
+    Decodes a JOLT value, in either sparse or strict mode, into the equivalent Python value. JOLT types values with
+    single-key objects whose key is a sigil, such as {"Z": "42"} for an integer or {"()": [id, labels, properties]} for
+    a node. See https://neo4j.com/docs/http-api/current/result-formats/#_jolt
+    """
+    if isinstance(value, list):
+        return [decode_jolt_value(item) for item in value]
+    if not isinstance(value, dict) or len(value) != 1:
+        return value
+    sigil, payload = next(iter(value.items()))
+    decode = JOLT_DECODERS.get(sigil)
+    return value if decode is None else decode(payload)
+
+
+def decode_jolt_node(payload: list) -> dict:
+    node_id, labels, properties = payload
+    return {ID_KEY: node_id, ENTITY_TYPE_KEY: 'node', LABELS_KEY: labels,
+            PROPERTIES_KEY: decode_jolt_value({'{}': properties})}
+
+
+def decode_jolt_relationship(payload: list, reverse: bool = False) -> dict:
+    rel_id, start_id, rel_type, end_id, properties = payload
+    if reverse:
+        start_id, end_id = end_id, start_id
+    return {ID_KEY: rel_id, ENTITY_TYPE_KEY: 'relationship', START_KEY: start_id, END_KEY: end_id,
+            TYPE_KEY: rel_type, PROPERTIES_KEY: decode_jolt_value({'{}': properties})}
+
+
+JOLT_DECODERS = {
+    'Z': int,
+    'R': float,
+    'U': str,
+    '?': lambda payload: payload if isinstance(payload, bool) else payload == 'true',
+    '#': bytes.fromhex,
+    '[]': lambda payload: [decode_jolt_value(item) for item in payload],
+    '{}': lambda payload: {key: decode_jolt_value(item) for key, item in payload.items()},
+    # temporal and spatial values are kept in their ISO 8601 and WKT string forms
+    'T': str,
+    '@': str,
+    '()': decode_jolt_node,
+    '->': decode_jolt_relationship,
+    '<-': lambda payload: decode_jolt_relationship(payload, reverse=True),
+    '..': lambda payload: [decode_jolt_value(item) for item in payload]
+}
+
+
+class JoltResultsReader(object):
+    """
+    Reads an application/vnd.neo4j.jolt+json-seq response of the Neo4j HTTP API incrementally from an iterable of byte
+    chunks, such as Response.iter_content of a streamed request, and yields each record as a dict of its decoded values
+    by field name, as soon as it has been received.
+
+    Each event of the response is a JSON text preceded by a record separator, which cannot appear unescaped within a
+    JSON text, so the events are split on it before being decoded.
+    """
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self.fields = []
+        self.bytes_read = 0
+        self._chunks = chunks
+
+    def _iter_events(self) -> Iterator[dict]:
+        pending = b''
+        for chunk in self._chunks:
+            if not chunk:
+                continue
+            self.bytes_read += len(chunk)
+            events = (pending + chunk).split(RECORD_SEPARATOR)
+            # the last event may be continued in the next chunk
+            pending = events.pop()
+            for event in events:
+                if event.strip():
+                    yield json.loads(event)
+        if pending.strip():
+            yield json.loads(pending)
+
+    def iter_records(self) -> Iterator[dict]:
+        for event in self._iter_events():
+            if 'data' in event:
+                yield dict(zip(self.fields, [decode_jolt_value(value) for value in event['data']]))
+            elif 'header' in event:
+                self.fields = event['header'].get('fields', [])
+            elif 'error' in event:
+                errors = event['error'].get('errors', [])
+                message = '; '.join(f"{error.get('code')}: {error.get('message')}" for error in errors)
+                raise ValueError(f'Neo4j query failed. {message}')
+
+
+def read_jolt_results(chunks: Iterable[bytes]) -> dict:
+    """
+    Returns the records of a JOLT response in the {"results": [...]} form of Neptune openCypher results. All the
+    records are collected, as the JSON tab, the table and --store-to all use the whole results.
+    """
+    return {'results': list(JoltResultsReader(chunks).iter_records())}
+
+
+def is_jolt_response(response) -> bool:
+    return response.headers.get('content-type', '').startswith(JOLT_MEDIA_TYPE)
@@ -0,0 +1,147 @@
+"""
+Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import hashlib
+import hmac
+import logging
+import threading
+import time
+
+from botocore.auth import SigV4Auth
+from botocore.awsrequest import AWSRequest
+
+logger = logging.getLogger("signing")
+
+# botocore refreshes temporary credentials synchronously, on whichever thread asks for them, once they are within
+# 15 minutes of expiring. The provider below gets there first from a background timer, and only falls back to a
+# foreground refresh if the cached credentials are about to lapse.
+CREDENTIAL_BACKGROUND_REFRESH_LEAD_TIME = 14 * 60
+CREDENTIAL_FOREGROUND_REFRESH_MARGIN = 5 * 60
+CREDENTIAL_MIN_REFRESH_INTERVAL = 30
+
+SIGNING_KEY_CACHE_MAX_SIZE = 64
+SIGNED_HEADERS = ['Authorization', 'X-Amz-Date', 'X-Amz-Security-Token']
+
+_signing_keys = {}
+_signing_keys_lock = threading.Lock()
+
+
+def get_signing_key(secret_key: str, date_stamp: str, region: str, service: str) -> bytes:
+    """
+    Returns the SigV4 signing key for the given scope, deriving it (four chained HMACs) only once per day.
+    """
+    cache_key = (secret_key, date_stamp, region, service)
+    signing_key = _signing_keys.get(cache_key)
+    if signing_key is None:
+        k_date = hmac.new(f'AWS4{secret_key}'.encode('utf-8'), date_stamp.encode('utf-8'), hashlib.sha256).digest()
+        k_region = hmac.new(k_date, region.encode('utf-8'), hashlib.sha256).digest()
+        k_service = hmac.new(k_region, service.encode('utf-8'), hashlib.sha256).digest()
+        signing_key = hmac.new(k_service, b'aws4_request', hashlib.sha256).digest()
+        with _signing_keys_lock:
+            if len(_signing_keys) >= SIGNING_KEY_CACHE_MAX_SIZE:
+                _signing_keys.clear()
+            _signing_keys[cache_key] = signing_key
+    return signing_key
+
+
+class CachingSigV4Auth(SigV4Auth):
+    """
+    SigV4Auth that reuses derived signing keys across requests instead of re-deriving them for every signature.
+    """
+
+    def signature(self, string_to_sign, request):
+        signing_key = get_signing_key(self.credentials.secret_key, request.context['timestamp'][0:8],
+                                      self._region_name, self._service_name)
+        return self._sign(signing_key, string_to_sign, hex=True)
+
+
+def sign_prepared_request(prepared_request, credentials, service: str, region: str, url: str = None,
+                          params=None):
+    """
+    Adds SigV4 authentication headers to a requests.PreparedRequest in place, signing the exact body it will send.
+
+    url and params are the values the request was built from. They are signed separately, as the query string in the
+    prepared URL has already been form-encoded by requests.
+    """
+    aws_request = AWSRequest(method=prepared_request.method,
+                             url=url if url is not None else prepared_request.url,
+                             data=prepared_request.body,
+                             params=params,
+                             headers=dict(prepared_request.headers))
+    CachingSigV4Auth(credentials, service, region).add_auth(aws_request)
+    for header in SIGNED_HEADERS:
+        if header in aws_request.headers:
+            prepared_request.headers[header] = aws_request.headers[header]
+    return prepared_request
+
+
+class RefreshingCredentialProvider(object):
+    """
+    Holds the frozen credentials of a boto session for one Client, and refreshes them from a background timer
+    before they expire so that queries never have to wait on a credential refresh.
+    """
+
+    def __init__(self, session):
+        self._session = session
+        self._lock = threading.Lock()
+        self._credentials = None
+        self._frozen_credentials = None
+        self._expiry = None
+        self._timer = None
+        self._closed = False
+
+    def get_frozen_credentials(self):
+        """
+        Raises AttributeError if the session could not find any credentials.
+        """
+        frozen_credentials = self._frozen_credentials
+        expiry = self._expiry
+        if frozen_credentials is not None \
+                and (expiry is None or time.time() < expiry - CREDENTIAL_FOREGROUND_REFRESH_MARGIN):
+            return frozen_credentials
+        return self.refresh()
+
+    def refresh(self):
+        with self._lock:
+            if self._credentials is None:
+                self._credentials = self._session.get_credentials()
+            frozen_credentials = self._credentials.get_frozen_credentials()
+            self._frozen_credentials = frozen_credentials
+            self._expiry = self._get_expiry(self._credentials)
+            self._schedule_refresh()
+            return frozen_credentials
+
+    @staticmethod
+    def _get_expiry(credentials):
+        # only RefreshableCredentials expire; static keys have no _expiry_time
+        expiry_time = getattr(credentials, '_expiry_time', None)
+        if expiry_time is None:
+            return None
+        return expiry_time.timestamp()
+
+    def _schedule_refresh(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._expiry is None or self._closed:
+            return
+        delay = max(self._expiry - CREDENTIAL_BACKGROUND_REFRESH_LEAD_TIME - time.time(),
+                    CREDENTIAL_MIN_REFRESH_INTERVAL)
+        self._timer = threading.Timer(delay, self._background_refresh)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _background_refresh(self):
+        try:
+            self.refresh()
+        except Exception as e:
+            logger.debug(f'Background credential refresh failed: {e}')
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
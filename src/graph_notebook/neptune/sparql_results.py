@@ -0,0 +1,124 @@
+"""
+Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import codecs
+import json
+import re
+from typing import Iterable
+
+SPARQL_RESULTS_CHUNK_SIZE = 64 * 1024
+
+BINDINGS_ARRAY_REGEX = re.compile(r'"bindings"\s*:\s*\[')
+HEAD_OBJECT_REGEX = re.compile(r'"head"\s*:\s*')
+BINDING_SEPARATOR_REGEX = re.compile(r'[\s,]*')
+# how far back from the end of the text already searched a split "bindings": [ may start
+BINDINGS_ARRAY_MAX_LENGTH = 64
+
+
+class SPARQLResultsReader(object):
+    """
+    Reads the first limit_rows bindings of an application/sparql-results+json response from an iterable of byte
+    chunks, such as Response.iter_content of a streamed request, without downloading the rest of the response.
+
+    truncated is set if the response had more bindings, in which case the document is rebuilt from the head and the
+    bindings that were read. Responses whose head does not come before their bindings, such as ASK results, are read
+    whole.
+    """
+
+    def __init__(self, chunks: Iterable[bytes], limit_rows: int):
+        self.limit_rows = limit_rows
+        self.truncated = False
+        self.bytes_read = 0
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder('utf-8')()
+        self._json_decoder = json.JSONDecoder()
+
+    def _read_chunk(self) -> str:
+        for chunk in self._chunks:
+            if chunk:
+                self.bytes_read += len(chunk)
+                return self._decoder.decode(chunk)
+        return None
+
+    def _read_remaining(self, text: str) -> str:
+        parts = [text]
+        chunk = self._read_chunk()
+        while chunk is not None:
+            parts.append(chunk)
+            chunk = self._read_chunk()
+        parts.append(self._decoder.decode(b'', final=True))
+        return ''.join(parts)
+
+    def _parse_head(self, prefix: str):
+        match = HEAD_OBJECT_REGEX.search(prefix)
+        if match is None:
+            return None
+        try:
+            head, _ = self._json_decoder.raw_decode(prefix, match.end())
+        except json.JSONDecodeError:
+            return None
+        return head if isinstance(head, dict) else None
+
+    def _parse_whole(self, text: str):
+        try:
+            results = json.loads(text)
+        except ValueError:
+            return text
+        if isinstance(results, dict) and isinstance(results.get('results'), dict):
+            bindings = results['results'].get('bindings', [])
+            if len(bindings) > self.limit_rows:
+                results['results']['bindings'] = bindings[:self.limit_rows]
+                self.truncated = True
+        return results
+
+    def read(self):
+        """
+        Returns the results document, or the text of the response if it is not JSON.
+        """
+        buffer = ''
+        match = None
+        while match is None:
+            search_start = max(0, len(buffer) - BINDINGS_ARRAY_MAX_LENGTH)
+            chunk = self._read_chunk()
+            if chunk is None:
+                break
+            buffer += chunk
+            match = BINDINGS_ARRAY_REGEX.search(buffer, search_start)
+
+        prefix = buffer[:match.end()] if match is not None else ''
+        head = self._parse_head(prefix)
+        if head is None:
+            return self._parse_whole(self._read_remaining(buffer))
+
+        bindings = []
+        pos = match.end()
+        while True:
+            pos = BINDING_SEPARATOR_REGEX.match(buffer, pos).end()
+            error = None
+            if pos < len(buffer):
+                if buffer[pos] == ']':
+                    break
+                if len(bindings) >= self.limit_rows:
+                    self.truncated = True
+                    return {'head': head, 'results': {'bindings': bindings}}
+                try:
+                    binding, pos = self._json_decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError as e:
+                    error = e
+                else:
+                    bindings.append(binding)
+                    continue
+            # the next binding has not been fully received yet
+            chunk = self._read_chunk()
+            if chunk is None:
+                raise error or json.JSONDecodeError('Unterminated bindings array', buffer, pos)
+            buffer = buffer[pos:] + chunk
+            pos = 0
+
+        # all the bindings were read, the rest of the document is parsed with an empty bindings array, which is then
+        # replaced with the bindings that were read
+        results = json.loads(prefix + self._read_remaining(buffer[pos:]))
+        results['results']['bindings'] = bindings
+        return results
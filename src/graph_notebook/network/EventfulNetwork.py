@@ -18,12 +18,14 @@ EVENT_ADD_NODE_DATA = 'add_node_data'
 EVENT_ADD_NODE_PROPERTY = 'add_node_property'
 EVENT_ADD_EDGE = 'add_edge'
 EVENT_ADD_EDGE_DATA = 'add_edge_data'
+EVENT_REMOVE_NODE = 'remove_node'
 DEFAULT_GRP = 'DEFAULT_GROUP'
 DEFAULT_RAW_GRP_KEY = '__RAW_RESULT__'
 DEFAULT_LABEL_MAX_LENGTH = 10
 DEPTH_GRP_KEY = 'TRAVERSAL_DEPTH'
 
-VALID_EVENTS = [EVENT_ADD_NODE, EVENT_ADD_NODE_DATA, EVENT_ADD_NODE_PROPERTY, EVENT_ADD_EDGE, EVENT_ADD_EDGE_DATA]
+VALID_EVENTS = [EVENT_ADD_NODE, EVENT_ADD_NODE_DATA, EVENT_ADD_NODE_PROPERTY, EVENT_ADD_EDGE, EVENT_ADD_EDGE_DATA,
+                EVENT_REMOVE_NODE]
 
 
 class EventfulNetwork(Network):
@@ -123,14 +125,13 @@ class EventfulNetwork(Network):
         Returns:
             [dict]: The flattened dictionary
         """
-        items = []
+        flattened = {}
         for k, v in d.items():
-            new_key = parent_key + sep + k if parent_key else k
-            if isinstance(v, collections.abc.MutableMapping):
-                items.extend(self.flatten(v).items())
+            if type(v) is dict or isinstance(v, collections.abc.MutableMapping):
+                flattened.update(self.flatten(v))
             else:
-                items.append((new_key, v))
-        return dict(items)
+                flattened[parent_key + sep + k if parent_key else k] = v
+        return flattened
 
     def register_universal_callback(self, callback):
         """
@@ -172,6 +173,13 @@ class EventfulNetwork(Network):
         }
         self.dispatch_callbacks(EVENT_ADD_NODE, payload)
 
+    def remove_node(self, node_id: str):
+        super().remove_node(node_id)
+        payload = {
+            'node_id': node_id
+        }
+        self.dispatch_callbacks(EVENT_REMOVE_NODE, payload)
+
     def add_edge(self, from_id: str, to_id: str, edge_id: str, label: str, title: str = None, data: dict = None):
         if data is None:
             data = {}
@@ -47,6 +47,14 @@ class Network:
             data = {}
         self.graph.add_node(node_id, **data)
 
+    def remove_node(self, node_id: str):
+        """
+        removes the given node, together with all of its edges, if it exists.
+        :param node_id: id of the node to remove
+        """
+        if node_id in self.graph:
+            self.graph.remove_node(node_id)
+
     def add_edge(self, from_id: str, to_id: str, edge_id: str, label: str, data: dict = None):
         if data is None:
             data = {}
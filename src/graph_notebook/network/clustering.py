@@ -0,0 +1,185 @@
+"""
+Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: Apache-2.0
+
+Level-of-detail aggregation for networks with more nodes than the browser can draw.
+
+The nodes are collapsed into one cluster node per group (the group assigned by group_by_property, group_by_depth,
+etc.), or per community found by label propagation when every node is in the same group. Edges between two clusters
+are collapsed into one edge labelled with the number of edges. The full network stays in the kernel, so that a
+cluster can be expanded into its member nodes later on.
+"""
+
+import math
+from collections import Counter, defaultdict
+
+import networkx as nx
+from networkx import MultiDiGraph
+
+from graph_notebook.network.EventfulNetwork import EventfulNetwork
+
+CLUSTER_ID_PREFIX = '__cluster__:'
+CLUSTER_EDGE_KEY = '__cluster_edge__'
+OTHER_CLUSTER = 'Other'
+# spacing in pixels between the members of an expanded cluster placed around the position of the cluster
+EXPANDED_NODE_SPACING = 100
+
+
+class NetworkClusters:
+    """
+    Kernel-side index of a network that was collapsed into clusters, which tracks the clusters that have been expanded.
+    """
+
+    def __init__(self, graph: MultiDiGraph, max_nodes: int):
+        self.graph = graph
+        self.max_nodes = max(1, max_nodes)
+        self.node_cluster = {}
+        self.members = defaultdict(list)
+        self.cluster_groups = {}
+        self.expanded = set()
+        self._assign_clusters()
+
+    def _assign_clusters(self):
+        node_groups = {node: data.get('group') for node, data in self.graph.nodes(data=True)}
+        if len(set(node_groups.values())) < 2:
+            communities = nx.community.label_propagation_communities(nx.Graph(self.graph.to_undirected()))
+            node_groups = {node: f'community {i}' for i, community in
+                           enumerate(sorted(communities, key=len, reverse=True)) for node in community}
+
+        group_sizes = Counter(node_groups.values())
+        if len(group_sizes) > self.max_nodes:
+            # keep the largest groups, and put the nodes of all the others into one cluster
+            kept_groups = {group for group, _ in group_sizes.most_common(self.max_nodes - 1)}
+            node_groups = {node: group if group in kept_groups else OTHER_CLUSTER
+                           for node, group in node_groups.items()}
+
+        for node, group in node_groups.items():
+            cluster_id = f'{CLUSTER_ID_PREFIX}{group}'
+            self.node_cluster[node] = cluster_id
+            self.members[cluster_id].append(node)
+            self.cluster_groups[cluster_id] = group
+
+    def visible_id(self, node) -> str:
+        """
+        Returns the id of the node as it is shown, which is the id of its cluster unless the cluster was expanded.
+        """
+        cluster_id = self.node_cluster[node]
+        return node if cluster_id in self.expanded else cluster_id
+
+    def cluster_data(self, cluster_id: str) -> dict:
+        group = self.cluster_groups[cluster_id]
+        member_count = len(self.members[cluster_id])
+        return {
+            'label': f'{group} ({member_count})',
+            'title': f'{group}: {member_count} nodes. Double-click to expand.',
+            'group': group,
+            'cluster': True,
+            'properties': {
+                'cluster': str(group),
+                'nodes': member_count
+            }
+        }
+
+    def build_network(self) -> EventfulNetwork:
+        """
+        Returns a network with one node per cluster, and one edge for each pair of clusters with edges between them.
+        """
+        network = EventfulNetwork()
+        for cluster_id in self.members:
+            network.add_node(cluster_id, self.cluster_data(cluster_id))
+        self._add_cluster_edges(network, self.graph.edges())
+        return network
+
+    def _add_cluster_edges(self, network: EventfulNetwork, edges):
+        edge_counts = Counter((self.visible_id(source), self.visible_id(target)) for source, target in edges)
+        for (source, target), count in edge_counts.items():
+            if source != target or source not in self.members:
+                network.add_edge(source, target, CLUSTER_EDGE_KEY, str(count),
+                                 data={'title': f'{count} edges', 'properties': {'edges': count}})
+
+    def expand(self, cluster_id: str, network: EventfulNetwork) -> bool:
+        """
+        Replaces a cluster in network by its member nodes, together with their edges to nodes which are shown and
+        to the clusters of nodes which are not. Returns False if cluster_id is not a collapsed cluster, or if it cannot
+        be expanded within max_nodes.
+
+        When the members would take network over max_nodes, only the members with the most edges are shown, and the
+        others are collapsed into a smaller cluster of the same group, which can be expanded in turn. When there is no
+        room for both a member and that cluster, the cluster is not expanded, and its title says why.
+        """
+        if cluster_id not in self.members or cluster_id in self.expanded:
+            return False
+        all_members = self.members[cluster_id]
+        # the node of the cluster itself makes room for one of its members
+        budget = self.max_nodes - network.graph.number_of_nodes() + (cluster_id in network.graph)
+        if len(all_members) > budget and budget < 2:
+            member_count = len(all_members)
+            network.add_node_data(cluster_id, {
+                'title': f'{self.cluster_groups[cluster_id]}: {member_count} nodes. Cannot be expanded, as the graph '
+                         f'already shows --max-nodes {self.max_nodes} nodes.'
+            })
+            return False
+        cluster_position = network.graph.nodes[cluster_id] if cluster_id in network.graph else {}
+        network.remove_node(cluster_id)
+        self.expanded.add(cluster_id)
+
+        member_set = set(all_members)
+        remaining_id = self._split_cluster(cluster_id, budget) if len(all_members) > budget else None
+        members = self.members[cluster_id]
+
+        positions = self._member_positions(cluster_position, len(members) + (remaining_id is not None))
+        if remaining_id is not None:
+            data = self.cluster_data(remaining_id)
+            if positions:
+                data['x'], data['y'] = positions[-1]
+            network.add_node(remaining_id, data)
+        for i, node in enumerate(members):
+            data = dict(self.graph.nodes[node])
+            if positions:
+                data['x'], data['y'] = positions[i]
+            network.add_node(node, data)
+
+        edges = [(source, target, key, data) for node in all_members
+                 for source, target, key, data in self.graph.out_edges(node, keys=True, data=True)]
+        edges.extend((source, target, key, data) for node in all_members
+                     for source, target, key, data in self.graph.in_edges(node, keys=True, data=True)
+                     if source not in member_set)
+        collapsed_edges = []
+        for source, target, key, data in edges:
+            if self.visible_id(source) == source and self.visible_id(target) == target:
+                network.add_edge(source, target, key, data.get('label', key), data=dict(data))
+            else:
+                collapsed_edges.append((source, target))
+        self._add_cluster_edges(network, collapsed_edges)
+        return True
+
+    def _split_cluster(self, cluster_id: str, budget: int) -> str:
+        """
+        Keeps the members of a cluster with the most edges in it, leaving room within budget, which is at least 2, for
+        one more cluster, which the other members are moved to. Returns the id of the new cluster.
+        """
+        members = sorted(self.members[cluster_id], key=self.graph.degree, reverse=True)
+        shown_count = budget - 1
+        group = self.cluster_groups[cluster_id]
+        remaining_id = f'{CLUSTER_ID_PREFIX}{group}/{len(self.members)}'
+        self.members[cluster_id] = members[:shown_count]
+        self.members[remaining_id] = members[shown_count:]
+        self.cluster_groups[remaining_id] = group
+        for node in self.members[remaining_id]:
+            self.node_cluster[node] = remaining_id
+        return remaining_id
+
+    @staticmethod
+    def _member_positions(cluster_data: dict, member_count: int) -> list:
+        """
+        When the cluster had a precomputed position, places its members on a spiral around it.
+        """
+        if 'x' not in cluster_data or 'y' not in cluster_data:
+            return []
+        positions = []
+        for i in range(member_count):
+            radius = EXPANDED_NODE_SPACING * math.sqrt(i)
+            angle = i * math.pi * (3 - math.sqrt(5))
+            positions.append((cluster_data['x'] + radius * math.cos(angle),
+                              cluster_data['y'] + radius * math.sin(angle)))
+        return positions
@@ -4,11 +4,11 @@ SPDX-License-Identifier: Apache-2.0
 """
 
 import hashlib
-import json
 import uuid
 import logging
 from decimal import *
 from enum import Enum
+from functools import lru_cache
 
 from graph_notebook.network.EventfulNetwork import EventfulNetwork, DEFAULT_GRP, DEPTH_GRP_KEY, DEFAULT_RAW_GRP_KEY
 from gremlin_python.process.traversal import T, Direction
@@ -27,6 +27,7 @@ INVALID_VERTEX_PATH_PATTERN_ERROR = ValueError("found vertex pattern on an Edge
 SAME_DIRECTION_ADJACENT_VERTICES = ValueError("Found two vertices with the same direction")
 
 DEFAULT_LABEL_MAX_LENGTH = 10
+GENERATED_ID_CACHE_SIZE = 4096
 TO_DISABLED = {"to": {"enabled": False}}
 UNDIRECTED_EDGE = {
     "arrows": TO_DISABLED
@@ -54,23 +55,107 @@ V_PATTERNS = [PathPattern.V, PathPattern.IN_V, PathPattern.OUT_V]
 E_PATTERNS = [PathPattern.E, PathPattern.IN_E, PathPattern.OUT_E]
 
 
+HTTP_ID_KEYS = frozenset(['id', '~id'])
+WS_ID_KEYS = frozenset([T.id])
+
+
+def is_elementmap(element: dict, id_keys: frozenset, label_key, reserved_keys: frozenset) -> bool:
+    """
+    Tells whether a dict in a path is an elementMap, rather than a valueMap or a project() result. An elementMap has
+    an id and a label, and its other values are single values instead of lists.
+
+    :param id_keys: the keys the id may be returned as
+    :param label_key: the key the label is returned as
+    :param reserved_keys: id_keys and label_key together
+    """
+    if id_keys.isdisjoint(element.keys()) or label_key not in element:
+        return False
+    for prop, value in element.items():
+        if isinstance(value, str):
+            # ID and/or Label property keys could be renamed by a project() step
+            if prop not in reserved_keys:
+                return True
+        elif isinstance(value, dict):
+            if prop in [Direction.IN, Direction.OUT]:
+                return True
+        elif isinstance(value, list):
+            return False
+        else:
+            return True
+    return False
+
+
+# keys of result maps which are T tokens, by the name used for them in display, tooltip and group by options
+TOKEN_KEYS = {T_ID: T.id, T_LABEL: T.label}
+ELEMENT_ID_KEYS = frozenset([T.id, T_ID, 'id', '~id'])
+
+
+def find_element_key(element: dict, property_name):
+    """
+    Returns the key of element named property_name, which may be a T token such as T.id, or None.
+    """
+    if property_name in element:
+        return property_name
+    token = TOKEN_KEYS.get(property_name)
+    if token is not None and token in element:
+        return token
+    return None
+
+
+def compile_element_property_resolver(custom_property):
+    """
+    Compiles a display or tooltip property option into a function which takes a result map and its label, and returns
+    the value of the property, or None. The option may be a property name, a (property name, index) tuple for the
+    value at an index of a multi-valued property, or a dict of either by label.
+    """
+    if isinstance(custom_property, dict):
+        label_resolvers = {label: compile_element_property_resolver(label_property)
+                           for label, label_property in custom_property.items()}
+
+        def resolve_by_label(element, element_label):
+            if isinstance(element_label, list):
+                element_label = str(element_label).strip("[]'")
+            label_resolver = label_resolvers.get(element_label)
+            return None if label_resolver is None else label_resolver(element, element_label)
+        return resolve_by_label
+
+    if isinstance(custom_property, tuple):
+        property_name, property_index = custom_property[0], custom_property[1]
+
+        def resolve_index(element, element_label):
+            key = find_element_key(element, property_name)
+            if key is None or not isinstance(element[key], list):
+                return None
+            try:
+                return element[key][property_index]
+            except (TypeError, IndexError):
+                logger.debug(f"Failed to index into sub-property for: {element[key]} and {custom_property}")
+                return None
+        return resolve_index
+
+    if isinstance(custom_property, str):
+        def resolve_property(element, element_label):
+            key = find_element_key(element, custom_property)
+            return None if key is None else element[key]
+        return resolve_property
+
+    return lambda element, element_label: None
+
+
+@lru_cache(maxsize=GENERATED_ID_CACHE_SIZE)
+def _generate_id_from_repr(data_repr: str) -> str:
+    hashed = hashlib.blake2b(data_repr.encode(), digest_size=16)
+    return f'graph_notebook-{hashed.hexdigest()}'
+
+
 def generate_id_from_dict(data: dict) -> str:
-    # Handle cases where user requests '~label' in valueMap step, since json can't serialize non-string keys
-    if T.label in data.keys():
-        data['label'] = data[T.label]
-        del data[T.label]
-    for k in data.keys():
-        if isinstance(data[k], dict):
-            if T.id in data[k]:
-                data[k]['id'] = data[k][T.id]
-                del data[k][T.id]
-            if T.label in data[k]:
-                data[k]['label'] = data[k][T.label]
-                del data[k][T.label]
-    data_str = json.dumps(data, default=str)
-    hashed = hashlib.md5(data_str.encode())
-    generate_id = hashed.hexdigest()
-    return f'graph_notebook-{generate_id}'
+    """
+    Generates an id from the contents of a dict which has none, so that equal dicts are reduced to the same vertex.
+    The repr of results is deterministic for the types Gremlin returns, and includes keys such as T.label which
+    json can't serialize, so data is hashed as is without being modified. Ids are memoized by repr, so that repeated
+    maps, such as the vertex on both sides of an edge, are only hashed once.
+    """
+    return _generate_id_from_repr(repr(data))
 
 
 def get_id(element):
@@ -125,6 +210,97 @@ class GremlinNetwork(EventfulNetwork):
         super().__init__(graph, callbacks, label_max_length, edge_label_max_length, group_by_property,
                          display_property, edge_display_property, tooltip_property, edge_tooltip_property,
                          ignore_groups, group_by_raw)
+        self.compile_property_resolvers()
+
+    def compile_property_resolvers(self):
+        """
+        Compiles the group by, display and tooltip options into the functions that add_vertex and add_path_edge call
+        for each element, so that the options are interpreted once rather than for every property of every element.
+        add_results calls this again, so that changes to the options apply to the next results.
+        """
+        self._vertex_group_resolver = self._compile_vertex_group_resolver()
+        self._dict_group_resolver = self._compile_dict_group_resolver()
+        self._display_resolver = compile_element_property_resolver(self.display_property)
+        self._tooltip_resolver = compile_element_property_resolver(self.tooltip_property)
+        self._edge_display_resolver = compile_element_property_resolver(self.edge_display_property)
+        self._edge_tooltip_resolver = compile_element_property_resolver(self.edge_tooltip_property)
+
+    def _compile_vertex_group_resolver(self):
+        """
+        Returns a function which takes a Vertex and its depth group, and returns the group of the Vertex.
+        """
+        def group_by(group_property):
+            if group_property == DEFAULT_RAW_GRP_KEY:
+                return lambda v, depth_group: str(v)
+            if group_property in [T_LABEL, 'label']:
+                return lambda v, depth_group: self._resolve_multilabel_group(v.label)
+            if group_property in [T_ID, 'id', '~id']:
+                return lambda v, depth_group: v.id
+            if group_property == DEPTH_GRP_KEY:
+                return lambda v, depth_group: depth_group
+            return None
+
+        if not isinstance(self.group_by_property, dict):
+            resolve_group = group_by(str(self.group_by_property))
+            return resolve_group if resolve_group else lambda v, depth_group: DEFAULT_GRP
+
+        label_resolvers = {}
+        for label, group_property in self.group_by_property.items():
+            resolve_group = group_by(group_property)
+            if resolve_group is None:
+                # any other property is looked up in the attributes of the Vertex
+                resolve_group = (lambda key: lambda v, depth_group: v.__dict__.get(key, DEFAULT_GRP))(group_property)
+            label_resolvers[label] = resolve_group
+
+        def resolve_by_label(v, depth_group):
+            # For multi-label vertices, try the full label first, then individual components
+            label_resolver = label_resolvers.get(str(v.label))
+            if label_resolver is None and '::' in v.label:
+                for component in v.label.split('::'):
+                    label_resolver = label_resolvers.get(component)
+                    if label_resolver is not None:
+                        break
+            return DEFAULT_GRP if label_resolver is None else label_resolver(v, depth_group)
+        return resolve_by_label
+
+    def _compile_dict_group_resolver(self):
+        """
+        Returns a function which takes a result map, its label and its depth group, and returns the group of the map,
+        or None if the group by option does not apply to it.
+        """
+        def group_by(group_property, resolve_multilabel):
+            if group_property == DEPTH_GRP_KEY:
+                return lambda element, depth_group: depth_group
+            if group_property == DEFAULT_RAW_GRP_KEY:
+                return lambda element, depth_group: str(element)
+            if not isinstance(group_property, str):
+                return lambda element, depth_group: None
+            resolve_multilabel = resolve_multilabel and group_property in ['label', T_LABEL]
+
+            def resolve_property(element, depth_group):
+                key = find_element_key(element, group_property)
+                if key is None:
+                    return None
+                value = element[key]
+                if resolve_multilabel and isinstance(value, str) and '::' in value:
+                    return self._resolve_multilabel_group(value)
+                return str(value)
+            return resolve_property
+
+        if not isinstance(self.group_by_property, dict):
+            resolve_group = group_by(self.group_by_property, True)
+            return lambda element, element_label, depth_group: \
+                resolve_group(element, depth_group) if element else None
+
+        label_resolvers = {label: group_by(group_property, False)
+                           for label, group_property in self.group_by_property.items()}
+
+        def resolve_by_label(element, element_label, depth_group):
+            label_resolver = label_resolvers.get(element_label)
+            if label_resolver is None or not element:
+                return None
+            return label_resolver(element, depth_group)
+        return resolve_by_label
 
     def _resolve_multilabel_group(self, label):
         """For multi-label vertices (:: separated), check if any individual label
@@ -144,37 +320,6 @@ class GremlinNetwork(EventfulNetwork):
                 return component
         return label
 
-    def get_dict_element_property_value(self, element, k, temp_label, custom_property):
-        property_value = None
-        if isinstance(temp_label, list):
-            temp_label = str(temp_label).strip("[]'")
-        if isinstance(custom_property, dict):
-            try:
-                if isinstance(custom_property[temp_label], tuple) and isinstance(element[k], list):
-                    if str(k) == custom_property[temp_label][0]:
-                        try:
-                            property_value = element[k][custom_property[temp_label][1]]
-                        except (TypeError, IndexError):
-                            logger.debug(f"Failed to index into sub-property for: {element[k]} and "
-                                         f"{custom_property[temp_label]}")
-                            return
-                elif str(k) == custom_property[temp_label]:
-                    property_value = element[k]
-            except KeyError:
-                return
-        elif isinstance(custom_property, tuple):
-            if str(k) == custom_property[0] and isinstance(element[k], list):
-                try:
-                    property_value = element[k][custom_property[1]]
-                except IndexError:
-                    logger.debug(f"Failed to index into sub-property for: {element[k]} and "
-                                 f"{custom_property[0]}")
-                    return
-        elif str(k) == custom_property:
-            property_value = element[k]
-
-        return property_value
-
     def get_explicit_vertex_property_value(self, node_id, temp_label, custom_property):
         property_value = None
         if custom_property in [T_ID, 'id']:
@@ -333,12 +478,14 @@ class GremlinNetwork(EventfulNetwork):
         if not isinstance(results, list):
             raise ValueError("results must be a list of paths")
 
+        self.compile_property_resolvers()
         if is_http:
-            gremlin_ids = ['id', '~id']
+            gremlin_ids = HTTP_ID_KEYS
             gremlin_label = 'label'
         else:
-            gremlin_ids = [T.id]
+            gremlin_ids = WS_ID_KEYS
             gremlin_label = T.label
+        reserved_keys = gremlin_ids | {gremlin_label}
 
         for path_index, path in enumerate(results):
             if isinstance(path, Path):
@@ -346,41 +493,12 @@ class GremlinNetwork(EventfulNetwork):
                     raise INVALID_PATH_ERROR
 
                 for i in range(len(path)):
-                    if isinstance(path[i], dict):
-                        is_elementmap = False
-                        gremlin_id_in_path = False
-                        for possible_id in gremlin_ids:
-                            if possible_id in path[i]:
-                                gremlin_id_in_path = True
-                                break
-                        if gremlin_id_in_path and gremlin_label in path[i]:
-                            for prop, value in path[i].items():
-                                # ID and/or Label property keys could be renamed by a project() step
-                                if isinstance(value, str) and prop not in gremlin_ids + [gremlin_label]:
-                                    is_elementmap = True
-                                    break
-                                elif isinstance(value, dict):
-                                    if prop in [Direction.IN, Direction.OUT]:
-                                        is_elementmap = True
-                                        break
-                                elif isinstance(value, list):
-                                    break
-                                elif not isinstance(value, (str, list, dict)):
-                                    is_elementmap = True
-                                    break
-                        if is_elementmap:
-                            self.insert_elementmap(path[i], check_emap=True, path_element=path, index=i)
-                        else:
-                            self.insert_path_element(path, i)
+                    if isinstance(path[i], dict) and is_elementmap(path[i], gremlin_ids, gremlin_label, reserved_keys):
+                        self.insert_elementmap(path[i], check_emap=True, path_element=path, index=i)
                     else:
                         self.insert_path_element(path, i)
             elif isinstance(path, dict):
-                gremlin_id_in_path_keys = False
-                for possible_id in gremlin_ids:
-                    if possible_id in path.keys():
-                        gremlin_id_in_path_keys = True
-                        break
-                if gremlin_id_in_path_keys and gremlin_label in path.keys():
+                if not gremlin_ids.isdisjoint(path.keys()) and gremlin_label in path:
                     self.insert_elementmap(path, index=path_index)
                 else:
                     raise ValueError("all entries in results must be paths or elementMaps")
@@ -410,47 +528,7 @@ class GremlinNetwork(EventfulNetwork):
             if self.tooltip_property and self.tooltip_property != self.display_property:
                 tooltip_display_is_set = False
                 using_custom_tooltip = True
-            vertex_dict = v.__dict__
-            if not isinstance(self.group_by_property, dict):  # Handle string format group_by
-                if str(self.group_by_property) == DEFAULT_RAW_GRP_KEY:
-                    group = str(v)
-                elif str(self.group_by_property) in [T_LABEL, 'label']:  # this handles if it's just a string
-                    # This sets the group key to the label if either "label" is passed in or
-                    # T.label is set in order to handle the default case of grouping by label
-                    # when no explicit key is specified
-                    group = self._resolve_multilabel_group(v.label)
-                elif str(self.group_by_property) in [T_ID, 'id', '~id']:
-                    group = v.id
-                elif self.group_by_property == DEPTH_GRP_KEY:
-                    group = depth_group
-                else:
-                    group = DEFAULT_GRP
-            else:  # handle dict format group_by
-                try:
-                    # For multi-label vertices, try the full label first, then individual components
-                    matched_label = None
-                    if str(v.label) in self.group_by_property:
-                        matched_label = str(v.label)
-                    elif '::' in v.label:
-                        for component in v.label.split('::'):
-                            if component in self.group_by_property:
-                                matched_label = component
-                                break
-                    if matched_label is not None:
-                        if self.group_by_property[matched_label] == DEFAULT_RAW_GRP_KEY:
-                            group = str(v)
-                        elif self.group_by_property[matched_label] in [T_LABEL, 'label']:
-                            group = self._resolve_multilabel_group(v.label)
-                        elif self.group_by_property[matched_label] in [T_ID, 'id', '~id']:
-                            group = v.id
-                        elif self.group_by_property[matched_label] == DEPTH_GRP_KEY:
-                            group = depth_group
-                        else:
-                            group = vertex_dict[self.group_by_property[matched_label]]
-                    else:
-                        group = DEFAULT_GRP
-                except KeyError:
-                    group = DEFAULT_GRP
+            group = self._vertex_group_resolver(v, depth_group)
 
             label = title if len(title) <= self.label_max_length else title[:self.label_max_length - 3] + '...'
 
@@ -482,7 +560,6 @@ class GremlinNetwork(EventfulNetwork):
             label = ''
             label_full = ''
             group = ''
-            display_is_set = False
             using_custom_tooltip = False
             tooltip_display_is_set = True
             group_is_set = False
@@ -492,8 +569,8 @@ class GremlinNetwork(EventfulNetwork):
             # Before looping though properties, we first search for T.label in vertex dict, then set title = T.label
             # Otherwise, we will hit KeyError if we don't iterate through T.label first to set the title
             # Since it is needed for checking for the vertex label's desired grouping behavior in group_by_property
-            if T.label in v.keys() or 'label' in v.keys():
-                label_key = T.label if T.label in v.keys() else 'label'
+            label_key = T.label if T.label in v else 'label' if 'label' in v else None
+            if label_key is not None:
                 label_raw = v[label_key]
                 title_plc = str(label_raw)
                 title, label = self.strip_and_truncate_label_and_title(title_plc, self.label_max_length)
@@ -505,65 +582,41 @@ class GremlinNetwork(EventfulNetwork):
             if str(self.group_by_property) == DEFAULT_RAW_GRP_KEY:
                 group = str(v)
                 group_is_set = True
-            for k in v:
-                if str(k) in [T_ID, 'id', '~id']:
-                    node_id = str(v[k])
-
-                if isinstance(v[k], dict):
-                    properties[k] = str(v[k])
-                elif isinstance(v[k], list):
-                    copy_val = v[k]
-                    for i, subvalue in enumerate(copy_val):
+            for k, value in v.items():
+                if k in ELEMENT_ID_KEYS:
+                    node_id = str(value)
+
+                if isinstance(value, dict):
+                    properties[k] = str(value)
+                elif isinstance(value, list):
+                    for i, subvalue in enumerate(value):
                         if isinstance(subvalue, Decimal):
-                            copy_val[i] = float(subvalue)
-                    properties[k] = copy_val
-                elif isinstance(v[k], Decimal):
-                    properties[k] = float(v[k])
-                elif isinstance(v[k], uuid.UUID):
-                    properties[k] = str(v[k])
+                            value[i] = float(subvalue)
+                    properties[k] = value
+                elif isinstance(value, Decimal):
+                    properties[k] = float(value)
+                elif isinstance(value, uuid.UUID):
+                    properties[k] = str(value)
                 else:
-                    properties[k] = v[k]
-
-                if not group_is_set:
-                    if isinstance(self.group_by_property, dict):
-                        try:
-                            if DEPTH_GRP_KEY == self.group_by_property[title_plc]:
-                                group = depth_group
-                                group_is_set = True
-                            elif DEFAULT_RAW_GRP_KEY == self.group_by_property[title_plc]:
-                                group = str(v)
-                                group_is_set = True
-                            elif str(k) == self.group_by_property[title_plc]:
-                                group = str(v[k])
-                                group_is_set = True
-                        except KeyError:
-                            pass
-                    else:
-                        if DEPTH_GRP_KEY == self.group_by_property:
-                            group = depth_group
-                            group_is_set = True
-                        elif str(k) == self.group_by_property:
-                            if str(self.group_by_property) in ['label', T_LABEL] and isinstance(v[k], str) and '::' in v[k]:
-                                group = self._resolve_multilabel_group(v[k])
-                            else:
-                                group = str(v[k])
-                            group_is_set = True
-                if not display_is_set:
-                    label_property_raw_value = self.get_dict_element_property_value(v, k, label_raw,
-                                                                                    self.display_property)
-                    if label_property_raw_value:
-                        label_full, label = self.strip_and_truncate_label_and_title(label_property_raw_value,
-                                                                                    self.label_max_length)
-                        if not using_custom_tooltip:
-                            title = label_full
-                        display_is_set = True
-                if not tooltip_display_is_set:
-                    tooltip_property_raw_value = self.get_dict_element_property_value(v, k, label_raw,
-                                                                                      self.tooltip_property)
-                    if tooltip_property_raw_value:
-                        title, label_plc = self.strip_and_truncate_label_and_title(tooltip_property_raw_value,
-                                                                                   self.label_max_length)
-                        tooltip_display_is_set = True
+                    properties[k] = value
+
+            if not group_is_set:
+                resolved_group = self._dict_group_resolver(v, title_plc, depth_group)
+                if resolved_group is not None:
+                    group = resolved_group
+                    group_is_set = True
+            label_property_raw_value = self._display_resolver(v, label_raw)
+            if label_property_raw_value:
+                label_full, label = self.strip_and_truncate_label_and_title(label_property_raw_value,
+                                                                            self.label_max_length)
+                if not using_custom_tooltip:
+                    title = label_full
+            if using_custom_tooltip:
+                tooltip_property_raw_value = self._tooltip_resolver(v, label_raw)
+                if tooltip_property_raw_value:
+                    title, label_plc = self.strip_and_truncate_label_and_title(tooltip_property_raw_value,
+                                                                               self.label_max_length)
+                    tooltip_display_is_set = True
 
             if not tooltip_display_is_set and label_full:
                 title = label_full
@@ -654,7 +707,6 @@ class GremlinNetwork(EventfulNetwork):
             edge_label = ''
             edge_label_full = ''
             edge_title = ''
-            display_is_set = False
             tooltip_display_is_set = True
             using_custom_tooltip = False
             if self.edge_tooltip_property and self.edge_tooltip_property != self.edge_display_property:
@@ -681,23 +733,18 @@ class GremlinNetwork(EventfulNetwork):
                 else:
                     properties[k] = edge[k]
 
-                if not display_is_set:
-                    label_property_raw_value = self.get_dict_element_property_value(edge, k, edge_label_raw,
-                                                                                    self.edge_display_property)
-                    if label_property_raw_value:
-                        edge_label_full, edge_label = self.strip_and_truncate_label_and_title(
-                            label_property_raw_value, self.edge_label_max_length)
-                        if not using_custom_tooltip:
-                            edge_title = edge_label_full
-                        display_is_set = True
-
-                if not tooltip_display_is_set:
-                    tooltip_property_raw_value = self.get_dict_element_property_value(edge, k, edge_label_raw,
-                                                                                      self.edge_tooltip_property)
-                    if tooltip_property_raw_value:
-                        edge_title, label_plc = self.strip_and_truncate_label_and_title(tooltip_property_raw_value,
-                                                                                        self.edge_label_max_length)
-                        tooltip_display_is_set = True
+            label_property_raw_value = self._edge_display_resolver(edge, edge_label_raw)
+            if label_property_raw_value:
+                edge_label_full, edge_label = self.strip_and_truncate_label_and_title(
+                    label_property_raw_value, self.edge_label_max_length)
+                if not using_custom_tooltip:
+                    edge_title = edge_label_full
+            if using_custom_tooltip:
+                tooltip_property_raw_value = self._edge_tooltip_resolver(edge, edge_label_raw)
+                if tooltip_property_raw_value:
+                    edge_title, label_plc = self.strip_and_truncate_label_and_title(tooltip_property_raw_value,
+                                                                                    self.edge_label_max_length)
+                    tooltip_display_is_set = True
 
             if not tooltip_display_is_set and edge_label_full:
                 edge_title = edge_label_full
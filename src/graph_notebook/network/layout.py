@@ -0,0 +1,115 @@
+"""
+Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: Apache-2.0
+
+Force-directed layout of a network, computed in the kernel so that the front-end can render the network
+without running its own physics simulation.
+
+The layout follows Fruchterman-Reingold: every pair of nodes repels with force k^2/d, every edge attracts with
+force d^2/k, and the distance that nodes can move in one iteration shrinks as the layout cools. For small networks the
+repulsion is computed exactly. For larger networks, where the n^2 pairs become too slow, it is approximated
+Barnes-Hut style by spreading the nodes onto a grid and computing the repulsion from all grid cells at once as a
+convolution (using FFTs), which takes O(n + g^2 log g) per iteration for a g x g grid.
+"""
+
+import numpy as np
+from networkx import MultiDiGraph
+
+DEFAULT_LAYOUT_ITERATIONS = 50
+# above this many nodes, repulsion is approximated with the grid instead of computed for every pair of nodes
+EXACT_REPULSION_MAX_NODES = 1500
+EXACT_REPULSION_CHUNK_SIZE = 256
+MAX_GRID_SIZE = 256
+# distance in pixels between connected nodes at their ideal distance. The default nodes are 70px wide.
+LAYOUT_NODE_SPACING = 150
+LAYOUT_SEED = 42
+
+
+def exact_repulsion(positions: np.ndarray, k: float) -> np.ndarray:
+    displacement = np.zeros_like(positions)
+    for start in range(0, len(positions), EXACT_REPULSION_CHUNK_SIZE):
+        chunk = positions[start:start + EXACT_REPULSION_CHUNK_SIZE]
+        delta = chunk[:, np.newaxis, :] - positions[np.newaxis, :, :]
+        distance_sq = np.maximum(np.einsum('ijk,ijk->ij', delta, delta), 1e-9)
+        displacement[start:start + len(chunk)] = np.einsum('ijk,ij->ik', delta, k * k / distance_sq)
+    return displacement
+
+
+def grid_repulsion(positions: np.ndarray, k: float, grid_size: int) -> np.ndarray:
+    """
+    Approximates the repulsion on every node by binning the nodes onto a grid_size x grid_size grid, and convolving
+    the number of nodes per cell with the repulsive force between cells.
+    """
+    low = positions.min(axis=0)
+    cell_size = max(float((positions.max(axis=0) - low).max()), 1e-9) / (grid_size - 1)
+    cells = np.clip(np.rint((positions - low) / cell_size).astype(np.int64), 0, grid_size - 1)
+    density = np.bincount(cells[:, 0] * grid_size + cells[:, 1],
+                          minlength=grid_size * grid_size).reshape(grid_size, grid_size).astype(float)
+
+    # force kernel for every offset between two cells, on a grid twice as large to avoid wrapping around
+    offsets = np.fft.fftfreq(2 * grid_size, 1 / (2 * grid_size))
+    dx, dy = np.meshgrid(offsets, offsets, indexing='ij')
+    distance_sq = dx * dx + dy * dy
+    distance_sq[0, 0] = np.inf
+    scale = k * k / (cell_size * distance_sq)
+
+    padded_shape = (2 * grid_size, 2 * grid_size)
+    density_fft = np.fft.rfft2(density, padded_shape)
+    field_x = np.fft.irfft2(density_fft * np.fft.rfft2(dx * scale), padded_shape)[:grid_size, :grid_size]
+    field_y = np.fft.irfft2(density_fft * np.fft.rfft2(dy * scale), padded_shape)[:grid_size, :grid_size]
+    return np.column_stack([field_x[cells[:, 0], cells[:, 1]], field_y[cells[:, 0], cells[:, 1]]])
+
+
+def force_directed_layout(graph: MultiDiGraph, iterations: int = DEFAULT_LAYOUT_ITERATIONS,
+                          seed: int = LAYOUT_SEED) -> dict:
+    """
+    Returns a dict of node id to (x, y) position in pixels, centered on 0.
+    """
+    nodes = list(graph.nodes)
+    node_count = len(nodes)
+    if node_count == 0:
+        return {}
+    if node_count == 1:
+        return {nodes[0]: (0.0, 0.0)}
+
+    node_positions = {node: i for i, node in enumerate(nodes)}
+    edges = np.array([(node_positions[source], node_positions[target]) for source, target in graph.edges()
+                      if source != target], dtype=np.int64).reshape(-1, 2)
+
+    rng = np.random.default_rng(seed)
+    positions = rng.random((node_count, 2))
+    k = np.sqrt(1.0 / node_count)
+    grid_size = min(MAX_GRID_SIZE, max(16, int(np.sqrt(node_count)) * 2))
+    temperature = 0.1
+    cooling = temperature / (iterations + 1)
+
+    for _ in range(iterations):
+        if node_count <= EXACT_REPULSION_MAX_NODES:
+            displacement = exact_repulsion(positions, k)
+        else:
+            displacement = grid_repulsion(positions, k, grid_size)
+
+        if len(edges):
+            delta = positions[edges[:, 0]] - positions[edges[:, 1]]
+            distance = np.sqrt(np.einsum('ij,ij->i', delta, delta))
+            attraction = delta * (distance / k)[:, np.newaxis]
+            for axis in range(2):
+                displacement[:, axis] -= np.bincount(edges[:, 0], attraction[:, axis], minlength=node_count)
+                displacement[:, axis] += np.bincount(edges[:, 1], attraction[:, axis], minlength=node_count)
+
+        length = np.maximum(np.sqrt(np.einsum('ij,ij->i', displacement, displacement)), 1e-9)
+        positions += displacement * (np.minimum(length, temperature) / length)[:, np.newaxis]
+        temperature -= cooling
+
+    positions = (positions - positions.mean(axis=0)) * (LAYOUT_NODE_SPACING / k)
+    return {node: (float(x), float(y)) for node, (x, y) in zip(nodes, positions)}
+
+
+def apply_precomputed_layout(graph: MultiDiGraph, iterations: int = DEFAULT_LAYOUT_ITERATIONS):
+    """
+    Sets the x and y of every node of graph to its position in a force-directed layout. The Force widget passes
+    them on to vis.js as the positions of the nodes.
+    """
+    for node, (x, y) in force_directed_layout(graph, iterations).items():
+        graph.nodes[node]['x'] = x
+        graph.nodes[node]['y'] = y
@@ -24,6 +24,82 @@ NODE_ENTITY_TYPE = 'node'
 REL_ENTITY_TYPE = 'relationship'
 
 
+def compile_node_property_resolver(custom_property):
+    """
+    Compiles a display or tooltip property option into a function which takes a node, its flattened properties and
+    its placeholder title, and returns the value to show for the node. The option may be a property name, a
+    (property name, index) tuple for the value at an index of a list property, or a dict of either by label.
+    """
+    def resolve_index(property_name, property_index):
+        def resolve(node, props, title):
+            value = props.get(property_name)
+            if isinstance(value, list) and len(value) >= 2:
+                try:
+                    return value[property_index]
+                except IndexError as e:
+                    logger.debug(e)
+            return title
+        return resolve
+
+    if isinstance(custom_property, dict):
+        label_resolvers = {}
+        for label, label_property in custom_property.items():
+            if isinstance(label_property, tuple):
+                label_resolvers[label] = resolve_index(label_property[0], label_property[1])
+            else:
+                label_resolvers[label] = (lambda property_name: lambda node, props, title:
+                                          props[property_name] if property_name in props
+                                          else props[LABEL_KEY] if LABEL_KEY in props else props)(label_property)
+
+        def resolve_by_label(node, props, title):
+            label_resolver = label_resolvers.get(title)
+            return title if label_resolver is None else label_resolver(node, props, title)
+        return resolve_by_label
+
+    if isinstance(custom_property, tuple):
+        return resolve_index(custom_property[0], custom_property[1])
+
+    if custom_property in [ID_KEY, LABEL_KEY, VERTEX_TYPE_KEY]:
+        return lambda node, props, title: node.get(custom_property, title)
+
+    return lambda node, props, title: props.get(custom_property, title)
+
+
+def compile_node_group_resolver(group_by_property):
+    """
+    Compiles the group by option into a function which takes a node and its depth group, and returns its group.
+    """
+    def group_by(group_property):
+        if group_property == DEPTH_GRP_KEY:
+            return lambda node, depth_group: depth_group
+        if group_property == DEFAULT_RAW_GRP_KEY:
+            return lambda node, depth_group: str(node)
+        if group_property == ID_KEY:
+            return lambda node, depth_group: node.get(ID_KEY, DEFAULT_GRP)
+
+        def resolve_property(node, depth_group):
+            properties = node.get(PROPERTIES_KEY)
+            if properties is None or group_property not in properties:
+                return DEFAULT_GRP
+            return properties[group_property]
+
+        if group_property == LABEL_KEY:
+            return lambda node, depth_group: node[LABEL_KEY][0] if node.get(LABEL_KEY) \
+                else resolve_property(node, depth_group)
+        return resolve_property
+
+    if not isinstance(group_by_property, dict):
+        return group_by(group_by_property)
+
+    label_resolvers = {str(label): group_by(group_property) for label, group_property in group_by_property.items()}
+
+    def resolve_by_label(node, depth_group):
+        labels = node.get(LABEL_KEY)
+        label_resolver = label_resolvers.get(str(labels[0])) if labels else None
+        return DEFAULT_GRP if label_resolver is None else label_resolver(node, depth_group)
+    return resolve_by_label
+
+
 class OCNetwork(EventfulNetwork):
     """OCNetwork extends the EventfulNetwork class and uses the add_results method to parse any response that returns
     nodes/relationships as part (or all) of the response.
@@ -42,43 +118,19 @@ class OCNetwork(EventfulNetwork):
         super().__init__(graph, callbacks, label_max_length, edge_label_max_length, group_by_property,
                          display_property, edge_display_property, tooltip_property, edge_tooltip_property,
                          ignore_groups, group_by_raw)
+        self.compile_property_resolvers()
 
-    def get_node_property_value(self, node: dict, props: dict, title, custom_property):
-        try:
-            if isinstance(custom_property, dict):
-                if isinstance(custom_property[title], tuple):
-                    if custom_property[title][0] in props and \
-                            isinstance(props[custom_property[title][0]], list) and \
-                            len(props[custom_property[title][0]]) >= 2:
-                        label = props[custom_property[title][0]][custom_property[title][1]]
-                    else:
-                        label = title
-                elif custom_property[title] in props:
-                    label = props[custom_property[title]]
-                elif LABEL_KEY in props:
-                    label = props[LABEL_KEY]
-                else:
-                    label = props
-            elif isinstance(custom_property, tuple) and custom_property[0] in props:
-                if isinstance(props[custom_property[0]], list) and len(props[custom_property[0]]) >= 2:
-                    label = props[custom_property[0]][custom_property[1]]
-                else:
-                    label = title
-            elif custom_property == ID_KEY:
-                label = node[ID_KEY]
-            elif custom_property == LABEL_KEY:
-                label = node[LABEL_KEY]
-            elif custom_property == VERTEX_TYPE_KEY:
-                label = node[VERTEX_TYPE_KEY]
-            elif custom_property in props:
-                label = props[custom_property]
-            else:
-                label = title
-        except (KeyError, IndexError) as e:
-            logger.debug(e)
-            label = title
+    def compile_property_resolvers(self):
+        """
+        Compiles the group by, display and tooltip options into the functions parse_node calls for each node.
+        add_results calls this again, so that changes to the options apply to the next results.
+        """
+        self._group_resolver = compile_node_group_resolver(self.group_by_property)
+        self._display_resolver = compile_node_property_resolver(self.display_property)
+        self._tooltip_resolver = compile_node_property_resolver(self.tooltip_property)
 
-        return label
+    def get_node_property_value(self, node: dict, props: dict, title, custom_property):
+        return compile_node_property_resolver(custom_property)(node, props, title)
 
     def get_edge_property_value(self, data: dict, rel: dict, custom_property):
         if custom_property is not EDGE_TYPE_KEY:
@@ -133,49 +185,15 @@ class OCNetwork(EventfulNetwork):
             for key in node:
                 title_plc += str(node[key])
 
-        if not isinstance(self.group_by_property, dict):  # Handle string format group_by
-            try:
-                if self.group_by_property == DEPTH_GRP_KEY:
-                    group = depth_group
-                elif self.group_by_property == DEFAULT_RAW_GRP_KEY:
-                    group = str(node)
-                elif self.group_by_property == LABEL_KEY and len(node[LABEL_KEY]) > 0:
-                    group = node[LABEL_KEY][0]
-                elif self.group_by_property == ID_KEY:
-                    group = node[ID_KEY]
-                elif self.group_by_property in node[PROPERTIES_KEY]:
-                    group = node[PROPERTIES_KEY][self.group_by_property]
-                else:
-                    group = DEFAULT_GRP
-            except KeyError:
-                group = DEFAULT_GRP
-        else:  # handle dict format group_by
-            try:
-                if str(node[LABEL_KEY][0]) in self.group_by_property and len(node[LABEL_KEY]) > 0:
-                    key = node[LABEL_KEY][0]
-                    if self.group_by_property[key] == DEPTH_GRP_KEY:
-                        group = depth_group
-                    elif self.group_by_property[key] == DEFAULT_RAW_GRP_KEY:
-                        group = str(node)
-                    elif self.group_by_property[key] == LABEL_KEY:
-                        group = node[LABEL_KEY][0]
-                    elif self.group_by_property[key] == ID_KEY:
-                        group = node[ID_KEY]
-                    else:
-                        group = node[PROPERTIES_KEY][self.group_by_property[key]]
-                else:
-                    group = DEFAULT_GRP
-            except KeyError:
-                group = DEFAULT_GRP
-
+        group = self._group_resolver(node, depth_group)
         props = self.flatten(node)
-        label = self.get_node_property_value(node, props, title_plc, self.display_property)
+        label = self._display_resolver(node, props, title_plc)
         if not label:
             label = node[ID_KEY]
         title, label = self.strip_and_truncate_label_and_title(label, self.label_max_length)
         if self.tooltip_property and self.tooltip_property != self.display_property:
             title, label_plc = self.strip_and_truncate_label_and_title(
-                self.get_node_property_value(node, props, title_plc, self.tooltip_property))
+                self._tooltip_resolver(node, props, title_plc))
         data = {'properties': props, 'label': label, 'title': title, 'group': group}
         if self.ignore_groups:
             data['group'] = DEFAULT_GRP
@@ -211,6 +229,7 @@ class OCNetwork(EventfulNetwork):
         Args:
             results (Object): Determines the type of the object and processes it appropriately
         """
+        self.compile_property_resolvers()
         for res in results["results"]:
             if type(res) is dict:
                 for k in res.keys():
@@ -4,21 +4,23 @@ SPDX-License-Identifier: Apache-2.0
 """
 
 import re
+from collections import namedtuple
+from functools import lru_cache
 from networkx import MultiDiGraph
-from rdflib.namespace import RDF, RDFS, OWL, XSD, SKOS, DOAP, FOAF, DC, DCTERMS, VOID
 
 from graph_notebook.network.EventfulNetwork import EventfulNetwork, DEFAULT_GRP, DEFAULT_RAW_GRP_KEY
 
-NAMESPACE_RDFS = str(RDFS)
-NAMESPACE_RDF = str(RDF)
-NAMESPACE_OWL = str(OWL)
-NAMESPACE_XSD = str(XSD)
-NAMESPACE_SKOS = str(SKOS)
-NAMESPACE_DOAP = str(DOAP)
-NAMESPACE_FOAF = str(FOAF)
-NAMESPACE_DC = str(DC)
-NAMESPACE_DCTERMS = str(DCTERMS)
-NAMESPACE_VOID = str(VOID)
+# the namespaces of rdflib.namespace, which is not imported for them as it is slow to load
+NAMESPACE_RDFS = 'http://www.w3.org/2000/01/rdf-schema#'
+NAMESPACE_RDF = 'http://www.w3.org/1999/02/22-rdf-syntax-ns#'
+NAMESPACE_OWL = 'http://www.w3.org/2002/07/owl#'
+NAMESPACE_XSD = 'http://www.w3.org/2001/XMLSchema#'
+NAMESPACE_SKOS = 'http://www.w3.org/2004/02/skos/core#'
+NAMESPACE_DOAP = 'http://usefulinc.com/ns/doap#'
+NAMESPACE_FOAF = 'http://xmlns.com/foaf/0.1/'
+NAMESPACE_DC = 'http://purl.org/dc/elements/1.1/'
+NAMESPACE_DCTERMS = 'http://purl.org/dc/terms/'
+NAMESPACE_VOID = 'http://rdfs.org/ns/void#'
 
 PREFIX_RDFS = 'rdfs'
 PREFIX_RDF = 'rdf'
@@ -34,7 +36,13 @@ PREFIX_VOID = 'void'
 RDFS_LABEL = f'{NAMESPACE_RDFS}label'
 RDF_TYPE = f'{NAMESPACE_RDF}type'
 NODE_TYPES = ['uri', 'bnode']
+# properties which hold the class of a node, such as rdf:type
+NODE_CLASS_PROPERTY_REGEX = re.compile('.*:type$')
 DEFAULT_LABEL_MAX_LENGTH = 10
+# the number of distinct URIs whose prefix, local name, title and label are kept by each network
+URI_CACHE_SIZE = 100000
+
+UriParts = namedtuple('UriParts', ['prefix', 'value', 'title', 'label'])
 
 InvalidBindingsCombinationError = ValueError('Bindings must be either "subject" "predicate" "object" or "s" "p" "o"')
 
@@ -92,6 +100,76 @@ class SPARQLNetwork(EventfulNetwork):
             PREFIX_DCTERMS: NAMESPACE_DCTERMS,
             PREFIX_VOID: NAMESPACE_VOID
         }
+        # subjects and predicates repeat across the bindings of a result, so their parts are only extracted once
+        self.uri_parts = lru_cache(maxsize=URI_CACHE_SIZE)(self._extract_uri_parts)
+        self.compile_property_resolvers()
+
+    def compile_property_resolvers(self):
+        """
+        Compiles the group by, display and tooltip options into the functions parse_node calls for each node.
+        add_results calls this again, so that changes to the options apply to the next results.
+        """
+        self._display_resolver = self._compile_node_property_resolver(self.display_property)
+        self._tooltip_resolver = self._compile_node_property_resolver(self.tooltip_property)
+        self._group_resolver = self._compile_node_group_resolver(self.group_by_property)
+
+    def _compile_property_lookup(self, property_name, missing_value=None):
+        """
+        Returns a function which takes a binding and the data of its node, and returns the value of property_name,
+        which is either the name of a binding key, or "P." followed by the name of a property of the node.
+        """
+        if not isinstance(property_name, str):
+            return lambda binding, data: missing_value
+        if property_name[:2] == "P.":
+            object_property = property_name[2:]
+
+            def lookup_object_property(binding, data):
+                if 'properties' in data:
+                    return self.retrieve_object_property_value(object_property, data['properties'])
+                return binding.get(property_name, missing_value) if binding else missing_value
+            return lookup_object_property
+        return lambda binding, data: binding.get(property_name, missing_value) if binding else missing_value
+
+    def _compile_node_property_resolver(self, custom_property):
+        """
+        Returns a function which takes a binding, the data of its node and the class of the node, and returns the
+        value of a display or tooltip property option, or None.
+        """
+        if isinstance(custom_property, dict):
+            class_lookups = {node_class: self._compile_property_lookup(class_property)
+                             for node_class, class_property in custom_property.items()}
+
+            def resolve_by_class(binding, data, node_type):
+                lookup = class_lookups.get(node_type) if node_type else None
+                return None if lookup is None else lookup(binding, data)
+            return resolve_by_class
+
+        lookup = self._compile_property_lookup(custom_property)
+        return lambda binding, data, node_type: lookup(binding, data)
+
+    def _compile_node_group_resolver(self, group_by_property):
+        """
+        Returns a function which takes a binding, the data of its node and the class of the node, and returns the
+        group of the node, or None if the node should be grouped by its class.
+        """
+        if isinstance(group_by_property, dict):
+            class_lookups = {}
+            for node_class, class_property in group_by_property.items():
+                if class_property == DEFAULT_RAW_GRP_KEY:
+                    class_lookups[node_class] = lambda binding, data: str(binding)
+                else:
+                    class_lookups[node_class] = self._compile_property_lookup(class_property)
+
+            def resolve_by_class(binding, data, node_type):
+                # if rdf:type or similar node class identifier does not exist on the node, set group to the default.
+                if not node_type:
+                    return DEFAULT_GRP
+                lookup = class_lookups.get(node_type)
+                return node_type if lookup is None else lookup(binding, data)
+            return resolve_by_class
+
+        lookup = self._compile_property_lookup(group_by_property)
+        return lambda binding, data, node_type: lookup(binding, data)
 
     def extract_prefix_declarations_from_query(self, query: str):
         for line in query.split('\n'):
@@ -103,52 +181,29 @@ class SPARQLNetwork(EventfulNetwork):
                     namespace = words[-1][1:len(words[-1]) - 1].strip()
                     self.namespace_to_prefix[namespace] = shorthand
                     self.prefix_to_namespace[shorthand] = namespace
+                    self.uri_parts.cache_clear()
 
-    def generate_node_label_title(self, node_id: str, data: dict):
-        prefix = self.extract_prefix(node_id)
-        value = self.extract_value(node_id)
-
-        if prefix is not None:
-            title = f'{prefix}:{value}'
-            data['prefix'] = prefix
-        else:
-            title = node_id
-
+    def _extract_uri_parts(self, uri: str) -> UriParts:
+        prefix = self.extract_prefix(uri)
+        value = self.extract_value(uri)
+        title = f'{prefix}:{value}' if prefix is not None else uri
         label = title if len(title) <= self.label_max_length else title[:self.label_max_length - 3] + '...'
-        data['label'] = label
+        return UriParts(prefix, value, title, label)
+
+    def generate_node_label_title(self, node_id: str, data: dict):
+        uri_parts = self.uri_parts(node_id)
+        if uri_parts.prefix is not None:
+            data['prefix'] = uri_parts.prefix
+        data['label'] = uri_parts.label
         if 'title' not in data:
-            data['title'] = title
+            data['title'] = uri_parts.title
         return data
 
     def get_node_property_value(self, binding: dict, custom_property, data: dict = None):
         if data is None:
             data = {}
-            node_type = None
-        else:
-            node_type = self.get_node_class(data)
-        if isinstance(custom_property, dict):
-            if node_type:
-                try:
-                    if node_type in custom_property:
-                        property_for_type = custom_property[node_type]
-                        if property_for_type[:2] == "P." and 'properties' in data:
-                            prop_value = self.retrieve_object_property_value(property_for_type[2:], data['properties'])
-                        else:
-                            prop_value = binding[property_for_type]
-                    else:
-                        prop_value = None
-                except KeyError:
-                    prop_value = None
-            else:
-                prop_value = None
-        elif custom_property[:2] == "P." and 'properties' in data:
-            prop_value = self.retrieve_object_property_value(custom_property[2:], data['properties'])
-        elif custom_property in binding:
-            prop_value = binding[custom_property]
-        else:
-            prop_value = None
-
-        return prop_value
+        node_type = self.get_node_class(data) if isinstance(custom_property, dict) else None
+        return self._compile_node_property_resolver(custom_property)(binding, data, node_type)
 
     def get_edge_property_value(self, binding: dict, custom_property):
         # use binding["type"] as class identifier, as RDF does not support literal edge properties.
@@ -178,10 +233,9 @@ class SPARQLNetwork(EventfulNetwork):
         # use rdf:type (or similar type property) as class identifier.
         try:
             data_props = data["properties"]
-            type_regex = re.compile('.*:type$')
             node_type = None
             for prop, value in data_props.items():
-                if type_regex.match(prop):
+                if NODE_CLASS_PROPERTY_REGEX.match(prop):
                     node_type = value
                     break
         except KeyError:
@@ -198,14 +252,15 @@ class SPARQLNetwork(EventfulNetwork):
         """
         if data is None:
             data = {}
+        node_type = self.get_node_class(data)
         if self.display_property:
-            label = self.get_node_property_value(node_binding, self.display_property, data=data)
+            label = self._display_resolver(node_binding, data, node_type)
             if label:
                 title, label = self.strip_and_truncate_label_and_title(label, self.label_max_length)
                 data['label'] = label
                 data['title'] = title
         if self.tooltip_property and self.tooltip_property != self.display_property:
-            tooltip_raw = self.get_node_property_value(node_binding, self.tooltip_property, data=data)
+            tooltip_raw = self._tooltip_resolver(node_binding, data, node_type)
             if tooltip_raw:
                 title, label_plc = self.strip_and_truncate_label_and_title(tooltip_raw)
                 data['title'] = title
@@ -216,33 +271,7 @@ class SPARQLNetwork(EventfulNetwork):
         elif str(self.group_by_property) == DEFAULT_RAW_GRP_KEY:
             node_group = str(node_binding)
         else:
-            node_group = None
-            node_type = self.get_node_class(data)
-            if isinstance(self.group_by_property, dict):
-                # if rdf:type or similar node class identifier does not exist on the node, set group to the default.
-                if node_type:
-                    try:
-                        if node_type in self.group_by_property:
-                            group_by_for_type = self.group_by_property[node_type]
-                            if group_by_for_type == DEFAULT_RAW_GRP_KEY:
-                                node_group = str(node_binding)
-                            elif group_by_for_type[:2] == "P." and 'properties' in data:
-                                node_group = self.retrieve_object_property_value(group_by_for_type[2:],
-                                                                                 data['properties'])
-                            else:
-                                node_group = node_binding[group_by_for_type]
-                        else:
-                            node_group = node_type
-                    except KeyError:
-                        node_group = node_type
-                else:
-                    node_group = DEFAULT_GRP
-            elif self.group_by_property[:2] == "P." and 'properties' in data:
-                node_group = self.retrieve_object_property_value(self.group_by_property[2:],
-                                                                 data['properties'])
-            elif self.group_by_property in node_binding:
-                node_group = node_binding[self.group_by_property]
-
+            node_group = self._group_resolver(node_binding, data, node_type)
             if not node_group:
                 if node_type:
                     node_group = node_type
@@ -317,6 +346,7 @@ class SPARQLNetwork(EventfulNetwork):
         :param results:
         """
 
+        self.compile_property_resolvers()
         # validate that we can process this result..
         vars = []
         if 'head' in results and 'vars' in results['head']:
@@ -411,14 +441,14 @@ class SPARQLNetwork(EventfulNetwork):
                 continue
 
             if pred['type'] == 'uri':
-                prefix = self.extract_prefix(pred['value'])
-                value = self.extract_value(pred['value'])
+                pred_parts = self.uri_parts(pred['value'])
+                prefix = pred_parts.prefix
+                value = pred_parts.value
 
                 obj_entry = obj['value']
                 if obj['type'] == 'uri':
-                    obj_prefix = self.extract_prefix(obj['value'])
-                    obj_value = self.extract_value(obj['value'])
-                    obj_entry = f'{obj_prefix}:{obj_value}'
+                    obj_parts = self.uri_parts(obj['value'])
+                    obj_entry = f'{obj_parts.prefix}:{obj_parts.value}'
 
                 # default label/tooltip set here. May be overwritten by custom properties.
                 if pred['value'] == RDFS_LABEL:
@@ -474,9 +504,8 @@ class SPARQLNetwork(EventfulNetwork):
 
             if not edge_label:
                 if pred['type'] == 'uri':
-                    prefix = self.extract_prefix(pred['value'])
-                    value = self.extract_value(pred['value'])
-                    edge_label = f'{prefix}:{value}'
+                    pred_parts = self.uri_parts(pred['value'])
+                    edge_label = f'{pred_parts.prefix}:{pred_parts.value}'
                 else:
                     edge_label = pred['value']
 
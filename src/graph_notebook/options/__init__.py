@@ -3,4 +3,4 @@ Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 SPDX-License-Identifier: Apache-2.0
 """
 
-from .options import OPTIONS_DEFAULT_DIRECTED, vis_options_merge  # noqa F401
+from .options import OPTIONS_DEFAULT_DIRECTED, OPTIONS_PRECOMPUTED_LAYOUT, vis_options_merge  # noqa F401
@@ -76,6 +76,17 @@ OPTIONS_DEFAULT_DIRECTED = {
     }
 }
 
+# Merged over the vis options when node positions are computed in the kernel (--layout precomputed), so that
+# vis.js keeps the given positions instead of simulating physics to find its own.
+OPTIONS_PRECOMPUTED_LAYOUT = {
+    "physics": {
+        "enabled": False
+    },
+    "layout": {
+        "improvedLayout": False
+    }
+}
+
 
 def vis_options_merge(original, target):
     """Merge the target dict with the original dict, without modifying the input dicts.
@@ -3,15 +3,25 @@ Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 SPDX-License-Identifier: Apache-2.0
 """
 
+import codecs
+import io
+import mmap
 import os
 import time
 import zipfile
 import tarfile
-import boto3
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from botocore.exceptions import ClientError, NoCredentialsError
-from botocore.handlers import disable_signing
 from os.path import join as pjoin
-from shutil import rmtree
+from shutil import copyfileobj, rmtree
+
+S3_DOWNLOAD_PART_SIZE = 8 * 1024 * 1024
+S3_DOWNLOAD_CONCURRENCY = 8
+SEED_FILE_BUFFER_SIZE = 1024 * 1024
+
+# archives which are extracted while they are downloaded, rather than after downloading them to disk
+STREAMED_TAR_EXTENSIONS = ('.tar', '.tar.gz', '.tgz', '.tar.bz2', '.tbz2', '.tar.xz', '.txz')
 
 
 def normalize_model_name(name):
@@ -31,22 +41,147 @@ def normalize_language_name(lang):
     return lang
 
 
+class SeedFile(object):
+    """
+    A file of seed queries, which is read line by line as it is seeded rather than held in memory as a whole. The
+    lines are read from a memory map of the file, so that memory use does not grow with the size of the file, and can
+    be counted for the progress bar without decoding them.
+
+    Lines end with either a newline or a carriage return and newline. q['name'] and q['content'] are supported as for
+    the query dicts of content_to_query, with q['content'] reading the whole file.
+
+    check() is called before seeding, so that a file which is not UTF-8 is skipped rather than failing part way
+    through seeding it.
+    """
+
+    def __init__(self, name: str, path: str, temp_dir: str = None):
+        self.name = name
+        self.path = path
+        # directory the file was downloaded to, which is removed by remove_seed_files once seeding is done
+        self.temp_dir = temp_dir
+        self._line_count = None
+
+    def map(self):
+        """
+        Returns a read-only memory map of the file, or None if the file is empty, as empty files cannot be mapped.
+        """
+        with open(self.path, mode='rb') as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                return None
+            # the map stays valid after the file is closed
+            return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def __iter__(self):
+        """
+        Yields each line of the file without its line ending, as str.splitlines would.
+        """
+        mapped = self.map()
+        if mapped is None:
+            return
+        with mapped:
+            for line in iter(mapped.readline, b''):
+                if line.endswith(b'\n'):
+                    line = line[:-2] if line.endswith(b'\r\n') else line[:-1]
+                yield line.decode('utf-8')
+
+    def check(self):
+        """
+        Raises UnicodeDecodeError if the file is not valid UTF-8. The file is decoded a slice at a time, and its lines
+        are counted in the same pass for line_count.
+        """
+        mapped = self.map()
+        if mapped is None:
+            self._line_count = 0
+            return
+        decoder = codecs.getincrementaldecoder('utf-8')()
+        newlines = 0
+        with mapped:
+            size = len(mapped)
+            for start in range(0, size, SEED_FILE_BUFFER_SIZE):
+                data = mapped[start:start + SEED_FILE_BUFFER_SIZE]
+                decoder.decode(data, final=start + SEED_FILE_BUFFER_SIZE >= size)
+                newlines += data.count(b'\n')
+            # the last line does not need to end with a line ending
+            self._line_count = newlines + (mapped[size - 1] != ord('\n'))
+
+    @property
+    def line_count(self) -> int:
+        """
+        The number of lines of the file, cached for the progress bar of %seed.
+        """
+        if self._line_count is None:
+            self.check()
+        return self._line_count
+
+    def read(self) -> str:
+        with open(self.path, mode='r', encoding='utf-8') as file_content:
+            return file_content.read()
+
+    def __getitem__(self, key):
+        if key == 'name':
+            return self.name
+        if key == 'content':
+            return self.read()
+        raise KeyError(key)
+
+
 def content_to_query(name, content):
     if name == '__init__.py' or name == '__pycache__':
         return None
     return {'name': name, 'content': content}
 
 
-def file_to_query(file, path_to_data_sets):
+def file_to_query(file, path_to_data_sets, temp_dir=None):
+    if file == '__init__.py' or file == '__pycache__':
+        return None
     full_path = pjoin(path_to_data_sets, file)
     try:
-        with open(full_path, mode='r', encoding="utf-8") as file_content:
-            return content_to_query(file, file_content.read())
+        # only check that the file can be decoded here, its lines are read while seeding
+        seed_file = SeedFile(file, full_path, temp_dir)
+        seed_file.check()
+        return seed_file
     except Exception:
         print(f"Unable to read queries from file [{file}] under local directory [{path_to_data_sets}]")
         return None
 
 
+def remove_seed_files(queries):
+    """
+    Removes the directories that the seed files of an S3 source were downloaded to.
+    """
+    for temp_dir in set(getattr(query, 'temp_dir', None) for query in queries or []):
+        if temp_dir:
+            rmtree(temp_dir, ignore_errors=True)
+
+
+def check_archive_member_path(name, abs_extract_dir):
+    """
+    Raises ValueError if an archive member is nested inside a subdirectory, or would be extracted outside of
+    abs_extract_dir.
+    """
+    if '/' in name or '\\' in name:
+        raise ValueError(
+            f"Archive member '{name}' is nested inside a subdirectory. "
+            f"Please ensure all query files are at the root of the archive and try again."
+        )
+    member_path = os.path.realpath(os.path.join(abs_extract_dir, name))
+    if not member_path.startswith(abs_extract_dir + os.sep):
+        raise ValueError(
+            f"Archive member '{name}' contains an absolute or relative path that resolves "
+            f"outside the extraction directory. Please fix the archive and try again."
+        )
+    return member_path
+
+
+def check_tar_member(member, abs_extract_dir):
+    if member.issym() or member.islnk():
+        raise ValueError(
+            f"Archive member '{member.name}' is a symbolic or hard link which is not allowed. "
+            f"Please ensure the archive contains only regular files and try again."
+        )
+    return check_archive_member_path(member.name, abs_extract_dir)
+
+
 def validate_and_extract_archive(archive_path, extract_dir):
     """
     Validates all archive member paths before extraction.
@@ -62,22 +197,7 @@ def validate_and_extract_archive(archive_path, extract_dir):
             for member in tar.getmembers():
                 if member.isdir():
                     continue
-                if member.issym() or member.islnk():
-                    raise ValueError(
-                        f"Archive member '{member.name}' is a symbolic or hard link which is not allowed. "
-                        f"Please ensure the archive contains only regular files and try again."
-                    )
-                if '/' in member.name or '\\' in member.name:
-                    raise ValueError(
-                        f"Archive member '{member.name}' is nested inside a subdirectory. "
-                        f"Please ensure all query files are at the root of the archive and try again."
-                    )
-                member_path = os.path.realpath(os.path.join(abs_extract_dir, member.name))
-                if not member_path.startswith(abs_extract_dir + os.sep):
-                    raise ValueError(
-                        f"Archive member '{member.name}' contains an absolute or relative path that resolves "
-                        f"outside the extraction directory. Please fix the archive and try again."
-                    )
+                check_tar_member(member, abs_extract_dir)
             tar.extractall(extract_dir)
 
     elif zipfile.is_zipfile(archive_path):
@@ -85,21 +205,98 @@ def validate_and_extract_archive(archive_path, extract_dir):
             for name in zf.namelist():
                 if name.endswith('/'):
                     continue
-                if '/' in name or '\\' in name:
-                    raise ValueError(
-                        f"Archive member '{name}' is nested inside a subdirectory. "
-                        f"Please ensure all query files are at the root of the archive and try again."
-                    )
-                member_path = os.path.realpath(os.path.join(abs_extract_dir, name))
-                if not member_path.startswith(abs_extract_dir + os.sep):
-                    raise ValueError(
-                        f"Archive member '{name}' contains an absolute or relative path that resolves "
-                        f"outside the extraction directory. Please fix the archive and try again."
-                    )
+                check_archive_member_path(name, abs_extract_dir)
             zf.extractall(extract_dir)
 
 
-def download_and_extract_archive_from_s3(bucket_name, filepath):
+class ChunkedReader(io.RawIOBase):
+    """
+    A read-only file object over an iterable of byte chunks, such as the parts of a download, so that they can be
+    consumed by tarfile in stream mode as they arrive.
+    """
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._chunk = b''
+        self._offset = 0
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        while self._offset >= len(self._chunk):
+            self._chunk = next(self._chunks, None)
+            self._offset = 0
+            if self._chunk is None:
+                self._chunk = b''
+                return 0
+        size = min(len(buffer), len(self._chunk) - self._offset)
+        buffer[:size] = self._chunk[self._offset:self._offset + size]
+        self._offset += size
+        return size
+
+
+def iter_s3_object(s3_client, bucket_name, key, part_size=S3_DOWNLOAD_PART_SIZE,
+                   concurrency=S3_DOWNLOAD_CONCURRENCY):
+    """
+    Downloads an S3 object with ranged GET requests for parts of part_size bytes, up to concurrency of them at once,
+    and yields the parts in order. At most concurrency parts are held in memory at any time.
+    """
+    size = s3_client.head_object(Bucket=bucket_name, Key=key)['ContentLength']
+
+    def fetch(start):
+        end = min(start + part_size, size) - 1
+        response = s3_client.get_object(Bucket=bucket_name, Key=key, Range=f'bytes={start}-{end}')
+        return response['Body'].read()
+
+    pending = deque()
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        try:
+            for start in range(0, size, part_size):
+                pending.append(executor.submit(fetch, start))
+                if len(pending) >= concurrency:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            # if the parts stop being read before the end, don't download the ones which have not started yet
+            for future in pending:
+                future.cancel()
+
+
+def download_s3_object(s3_client, bucket_name, key, path):
+    with open(path, mode='wb') as file:
+        for part in iter_s3_object(s3_client, bucket_name, key):
+            file.write(part)
+
+
+def extract_tar_stream(fileobj, extract_dir):
+    """
+    Extracts a tar archive, compressed or not, from a non-seekable file object one member at a time, checking each
+    member as validate_and_extract_archive does before it is written.
+    """
+    abs_extract_dir = os.path.realpath(extract_dir)
+    with tarfile.open(fileobj=fileobj, mode='r|*') as tar:
+        for member in tar:
+            if member.isdir():
+                continue
+            member_path = check_tar_member(member, abs_extract_dir)
+            if not member.isfile():
+                continue
+            with tar.extractfile(member) as member_content, open(member_path, mode='wb') as file:
+                copyfileobj(member_content, file, SEED_FILE_BUFFER_SIZE)
+
+
+def make_seed_download_dir():
+    extract_dir = f'/tmp/seed-{int(time.time() * 1000)}'
+    # retry with a new timestamp if the directory already exists (e.g. two calls in the same millisecond)
+    while os.path.exists(extract_dir):
+        extract_dir = f'/tmp/seed-{int(time.time() * 1000)}'
+    os.makedirs(extract_dir)
+    return extract_dir
+
+
+def download_and_extract_archive_from_s3(bucket_name, filepath, extract_dir=None, s3_client=None):
     """
     Depending on the S3 path provided, we can handle three possible cases here:
         1. plain S3 directory
@@ -109,30 +306,46 @@ def download_and_extract_archive_from_s3(bucket_name, filepath):
     We will first attempt to send a signed AWS request to retrieve the S3 file. If credentials cannot be located, the
     request will be retried once more, unsigned.
 
-    If the S3 request succeeds, this function will create a temporary directory /tmp/seed-{timestamp}/
-    to extract archive contents into. After the datafiles are processed in get_queries, the temporary
-    directory is deleted in a finally block regardless of success or failure.
+    Files are downloaded with parallel ranged GET requests. Tar archives are extracted as they are downloaded, without
+    writing the archive itself to disk, while zip archives, which cannot be read as a stream, are downloaded first.
+
+    If the S3 request succeeds, the files are extracted into extract_dir, or else a new temporary directory
+    /tmp/seed-{timestamp}/, and the directory containing the data files is returned. The caller is responsible for
+    removing extract_dir once the data files have been processed; on failure it is removed here.
     """
+    if s3_client is None:
+        # boto3 is only needed for seeding from S3, and is slow to load
+        import boto3
+        s3_client = boto3.client('s3')
+
     base_file = os.path.basename(filepath)
     if not base_file:
         base_file = filepath
-    s3 = boto3.resource('s3')
-    bucket = s3.Bucket(bucket_name)
-    extract_dir = f'/tmp/seed-{int(time.time() * 1000)}'
-    # retry with a new timestamp if the directory already exists (e.g. two calls in the same millisecond)
-    while os.path.exists(extract_dir):
-        extract_dir = f'/tmp/seed-{int(time.time() * 1000)}'
-    os.makedirs(extract_dir)
+    if extract_dir is None:
+        extract_dir = make_seed_download_dir()
     try:
         while True:
             try:
                 if base_file.endswith('/'):
-                    for obj in bucket.objects.filter(Prefix=filepath):
-                        if not obj.key.endswith('/'):
-                            new_file = os.path.basename(obj.key)
-                            bucket.download_file(obj.key, pjoin(extract_dir, new_file))
-                else:
-                    bucket.download_file(filepath, pjoin(extract_dir, base_file))
+                    paginator = s3_client.get_paginator('list_objects_v2')
+                    for page in paginator.paginate(Bucket=bucket_name, Prefix=filepath):
+                        for obj in page.get('Contents', []):
+                            if not obj['Key'].endswith('/'):
+                                new_file = os.path.basename(obj['Key'])
+                                download_s3_object(s3_client, bucket_name, obj['Key'], pjoin(extract_dir, new_file))
+                    return extract_dir
+                if base_file.lower().endswith(STREAMED_TAR_EXTENSIONS):
+                    nested_dir = pjoin(extract_dir, base_file.split('.')[0])
+                    os.makedirs(nested_dir, exist_ok=True)
+                    parts = iter_s3_object(s3_client, bucket_name, filepath)
+                    try:
+                        with io.BufferedReader(ChunkedReader(parts), SEED_FILE_BUFFER_SIZE) as archive:
+                            extract_tar_stream(archive, nested_dir)
+                    finally:
+                        # stops downloading the rest of the archive if the extraction failed
+                        parts.close()
+                    return nested_dir
+                download_s3_object(s3_client, bucket_name, filepath, pjoin(extract_dir, base_file))
                 break
             except ClientError as e:
                 if e.response['Error']['Code'] in ["404", "403"]:
@@ -140,10 +353,11 @@ def download_and_extract_archive_from_s3(bucket_name, filepath):
                 raise
             except NoCredentialsError:
                 # if no AWS credentials are available, retry with unsigned request.
-                s3.meta.client.meta.events.register('choose-signer.s3.*', disable_signing)
+                from botocore.handlers import disable_signing
+                s3_client.meta.events.register('choose-signer.s3.*', disable_signing)
 
         archive_path = pjoin(extract_dir, base_file)
-        if not base_file.endswith('/') and (tarfile.is_tarfile(archive_path) or zipfile.is_zipfile(archive_path)):
+        if tarfile.is_tarfile(archive_path) or zipfile.is_zipfile(archive_path):
             nested_dir = pjoin(extract_dir, base_file.split('.')[0])
             os.makedirs(nested_dir, exist_ok=True)
             validate_and_extract_archive(archive_path, nested_dir)
@@ -159,6 +373,7 @@ def download_and_extract_archive_from_s3(bucket_name, filepath):
 
 # returns a list of queries which correspond to a given query language and name
 def get_queries(query_language, name, location):
+    temp_dir = None
     if location == 'samples':
         d = os.path.dirname(os.path.realpath(__file__))
         path_to_data_sets = pjoin(d, 'queries', normalize_model_name(query_language),
@@ -167,33 +382,32 @@ def get_queries(query_language, name, location):
         # handle custom files here
         if name.startswith('s3://'):
             bucketname, filename = name.replace("s3://", "").split("/", 1)
-            path_to_data_sets = download_and_extract_archive_from_s3(bucketname, filename)
+            temp_dir = make_seed_download_dir()
+            path_to_data_sets = download_and_extract_archive_from_s3(bucketname, filename, temp_dir)
         else:
             path_to_data_sets = name
 
+    # the files are only opened here, so that their lines can be read lazily while seeding. Downloaded files are
+    # removed by remove_seed_files once seeding is done.
     queries = []
-    if os.path.isdir(path_to_data_sets):  # path_to_data_sets is an existing directory
-        try:
+    try:
+        if os.path.isdir(path_to_data_sets):  # path_to_data_sets is an existing directory
             for file in os.listdir(path_to_data_sets):
-                new_query = file_to_query(file, path_to_data_sets)
+                new_query = file_to_query(file, path_to_data_sets, temp_dir)
                 if new_query:
                     queries.append(new_query)
             queries.sort(key=lambda i: i['name'])  # ensure we get queries back in lexicographical order.
-        finally:
-            if name.startswith('s3://'):
-                rmtree(path_to_data_sets, ignore_errors=True)
-    elif os.path.isfile(path_to_data_sets):  # path_to_data_sets is an existing file
-        try:
+        elif os.path.isfile(path_to_data_sets):  # path_to_data_sets is an existing file
             file = os.path.basename(path_to_data_sets)
             folder = os.path.dirname(path_to_data_sets)
-            new_query = file_to_query(file, folder)
+            new_query = file_to_query(file, folder, temp_dir)
             if new_query:
                 queries.append(new_query)
-        finally:
-            if name.startswith('s3://'):
-                rmtree(os.path.dirname(path_to_data_sets), ignore_errors=True)
-    else:
-        return None
+        else:
+            return None
+    finally:
+        if temp_dir and not queries:
+            rmtree(temp_dir, ignore_errors=True)
 
     return queries
 
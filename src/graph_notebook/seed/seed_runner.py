@@ -0,0 +1,292 @@
+"""
+Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import logging
+import re
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+logger = logging.getLogger("seed_runner")
+
+DEFAULT_SEED_CONCURRENCY = 1
+DEFAULT_SEED_BATCH_SIZE = 1
+
+# Seed lines are only run concurrently with neighbouring lines of the same kind. Vertex-creating lines do not depend
+# on one another, and edge-creating lines only depend on vertices created by earlier lines, so each run of either
+# kind can be fanned out. Anything else is treated as a barrier and run on its own.
+LINE_KIND_VERTEX = 'vertex'
+LINE_KIND_EDGE = 'edge'
+LINE_KIND_OTHER = 'other'
+
+GREMLIN_TERMINAL_STEPS = ('.next()', '.iterate()', '.toList()', '.toSet()')
+GREMLIN_LOOKUP_RE = re.compile(r'(?<!add)[VE]\(')
+OC_NODE_CREATE_RE = re.compile(r'^CREATE\s*\(\s*\w*\s*:\s*(\w+)\s*\{', re.IGNORECASE)
+OC_EDGE_CREATE_RE = re.compile(r'^MATCH\b.*\bCREATE\b.*(-\[|\]-)', re.IGNORECASE | re.DOTALL)
+OC_WRITE_CLAUSES_RE = re.compile(r'\b(MATCH|MERGE|DELETE|DETACH|SET|REMOVE|WITH|UNWIND|CALL|RETURN)\b|-\[|\]-',
+                                 re.IGNORECASE)
+OC_EDGE_EXCLUDED_CLAUSES_RE = re.compile(r'\b(MERGE|DELETE|DETACH|REMOVE|CALL)\b', re.IGNORECASE)
+
+
+def classify_gremlin_line(query_line: str) -> str:
+    if query_line.startswith('g.addV(') and 'addE(' not in query_line \
+            and not GREMLIN_LOOKUP_RE.search(query_line):
+        return LINE_KIND_VERTEX
+    if query_line.startswith('g.addE(') and 'addV(' not in query_line:
+        return LINE_KIND_EDGE
+    return LINE_KIND_OTHER
+
+
+def gremlin_batch_key(query_line: str):
+    kind = classify_gremlin_line(query_line)
+    return None if kind == LINE_KIND_OTHER else kind
+
+
+def combine_gremlin_lines(query_lines: list) -> str:
+    """
+    Joins traversals into a single multi-statement request. Every statement but the last has to end in a terminal
+    step for the server to execute it.
+    """
+    statements = []
+    for query_line in query_lines:
+        statement = query_line.rstrip().rstrip(';').rstrip()
+        if not statement.endswith(GREMLIN_TERMINAL_STEPS):
+            statement += '.next()'
+        statements.append(statement)
+    return ';\n'.join(statements)
+
+
+def find_map_literal_end(query_line: str, start: int) -> int:
+    """
+    Returns the index just past the openCypher map literal opening at query_line[start], or -1 if it is unbalanced.
+    """
+    depth = 0
+    quote = None
+    i = start
+    while i < len(query_line):
+        c = query_line[i]
+        if quote:
+            if c == '\\':
+                i += 1
+            elif c == quote:
+                quote = None
+        elif c in ('"', "'", '`'):
+            quote = c
+        elif c == '{':
+            depth += 1
+        elif c == '}':
+            depth -= 1
+            if depth == 0:
+                return i + 1
+        i += 1
+    return -1
+
+
+def parse_oc_node_create(query_line: str):
+    """
+    Splits a line of the form CREATE (var:Label {map}) into (label, map literal text), or returns None if the line
+    does anything else.
+    """
+    statement = query_line.strip().rstrip(';').rstrip()
+    match = OC_NODE_CREATE_RE.match(statement)
+    if not match:
+        return None
+    map_start = match.end() - 1
+    map_end = find_map_literal_end(statement, map_start)
+    if map_end == -1 or statement[map_end:].strip() != ')':
+        return None
+    map_literal = statement[map_start:map_end]
+    # ~id can only be assigned when the node is created, not through SET
+    if '~id' in map_literal:
+        return None
+    return match.group(1), map_literal
+
+
+def classify_opencypher_line(query_line: str) -> str:
+    statement = query_line.strip()
+    if statement.upper().startswith('CREATE') and not OC_WRITE_CLAUSES_RE.search(statement):
+        return LINE_KIND_VERTEX
+    if OC_EDGE_CREATE_RE.match(statement) and not OC_EDGE_EXCLUDED_CLAUSES_RE.search(statement):
+        return LINE_KIND_EDGE
+    return LINE_KIND_OTHER
+
+
+def opencypher_batch_key(query_line: str):
+    node_create = parse_oc_node_create(query_line)
+    if node_create is None:
+        return None
+    return LINE_KIND_VERTEX, node_create[0]
+
+
+def combine_opencypher_lines(query_lines: list) -> str:
+    """
+    Rewrites CREATE (var:Label {map}) lines sharing a label into one UNWIND over their map literals.
+    """
+    label = None
+    maps = []
+    for query_line in query_lines:
+        label, map_literal = parse_oc_node_create(query_line)
+        maps.append(map_literal)
+    return f'UNWIND [{", ".join(maps)}] AS props CREATE (n:{label}) SET n += props'
+
+
+class SeedStatement(object):
+    def __init__(self, query: str, line_indexes: list, lines: list = None):
+        self.query = query
+        self.line_indexes = line_indexes
+        self.lines = lines if lines is not None else [query]
+
+    @property
+    def line_count(self):
+        return len(self.line_indexes)
+
+
+class SeedError(object):
+    def __init__(self, file_name: str, line_index: int, query: str, exception: Exception):
+        self.file_name = file_name
+        self.line_index = line_index
+        self.query = query
+        self.exception = exception
+
+
+class SeedRunner(object):
+    """
+    Runs the lines of seed files against an endpoint, fanning independent lines out over a thread pool and
+    optionally combining adjacent lines into batched requests.
+
+    execute is called with each (possibly combined) query and should raise on failure. If a combined request fails
+    and atomic_batches is True, its lines are retried one at a time so that errors are still reported per line. This
+    is only safe when a failed request is rolled back as a whole, as on Neptune or for a single openCypher statement.
+    Otherwise some lines of the batch may already have been applied, so the batch is reported as one error on its
+    first line instead of being run again.
+    """
+
+    def __init__(self, execute, classify=None, batch_key=None, combine=None,
+                 concurrency: int = DEFAULT_SEED_CONCURRENCY, batch_size: int = DEFAULT_SEED_BATCH_SIZE,
+                 ignore_errors: bool = False, on_progress=None, atomic_batches: bool = False):
+        self.execute = execute
+        self.classify = classify if classify is not None else (lambda line: LINE_KIND_OTHER)
+        self.batch_key = batch_key
+        self.combine = combine
+        self.concurrency = max(1, concurrency)
+        self.batch_size = max(1, batch_size)
+        self.ignore_errors = ignore_errors
+        self.on_progress = on_progress
+        self.atomic_batches = atomic_batches
+        self.errors = []
+        self.aborted = False
+
+    def run_file(self, file_name: str, query_lines) -> bool:
+        """
+        Runs every line of one seed file. Returns False if seeding was aborted because of an error.
+        """
+        for phase in self.plan(query_lines):
+            self.run_phase(file_name, phase)
+            if self.aborted:
+                return False
+        return True
+
+    def plan(self, query_lines):
+        """
+        Groups lines into phases; statements within a phase may run concurrently, phases run in order.
+        """
+        phase = []
+        phase_kind = None
+        pending = []
+        pending_key = None
+
+        def flush_pending():
+            if pending:
+                phase.append(self.make_statement(pending))
+                pending.clear()
+
+        for line_index, query_line in enumerate(query_lines):
+            if not query_line:
+                logger.debug(f"Skipped blank query at line {line_index + 1}")
+                if self.on_progress:
+                    self.on_progress(1)
+                continue
+            kind = self.classify(query_line)
+            if kind != phase_kind or kind == LINE_KIND_OTHER:
+                flush_pending()
+                if phase:
+                    yield phase
+                phase = []
+                phase_kind = kind
+            key = self.batch_key(query_line) if self.batch_key and self.batch_size > 1 else None
+            if key is None or key != pending_key or len(pending) >= self.batch_size:
+                flush_pending()
+            pending_key = key
+            pending.append((line_index, query_line))
+            if key is None:
+                flush_pending()
+        flush_pending()
+        if phase:
+            yield phase
+
+    def make_statement(self, pending: list) -> SeedStatement:
+        line_indexes = [line_index for line_index, _ in pending]
+        lines = [query_line for _, query_line in pending]
+        if len(lines) == 1 or self.combine is None:
+            return SeedStatement(lines[0], line_indexes, lines)
+        return SeedStatement(self.combine(lines), line_indexes, lines)
+
+    def run_phase(self, file_name: str, phase: list):
+        if self.concurrency == 1 or len(phase) == 1:
+            for statement in phase:
+                self.record(self.run_statement(file_name, statement), statement)
+                if self.aborted:
+                    return
+            return
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            statements = iter(phase)
+            in_flight = {}
+            for statement in statements:
+                in_flight[executor.submit(self.run_statement, file_name, statement)] = statement
+                if len(in_flight) >= self.concurrency * 2:
+                    break
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    statement = in_flight.pop(future)
+                    if not future.cancelled():
+                        self.record(future.result(), statement)
+                if self.aborted:
+                    # let requests that are already running finish, but don't start any new ones
+                    for future in in_flight:
+                        future.cancel()
+                    continue
+                for statement in statements:
+                    in_flight[executor.submit(self.run_statement, file_name, statement)] = statement
+                    if len(in_flight) >= self.concurrency * 2:
+                        break
+
+    def run_statement(self, file_name: str, statement: SeedStatement) -> list:
+        try:
+            self.execute(statement.query)
+            return []
+        except Exception as e:
+            if statement.line_count == 1 or not self.atomic_batches:
+                return [SeedError(file_name, statement.line_indexes[0], statement.query, e)]
+            logger.debug(f"Batched request for lines {statement.line_indexes[0] + 1}-{statement.line_indexes[-1] + 1} "
+                         f"of {file_name} failed, retrying line by line: {e}")
+
+        errors = []
+        for line_index, query_line in zip(statement.line_indexes, statement.lines):
+            try:
+                self.execute(query_line)
+            except Exception as e:
+                errors.append(SeedError(file_name, line_index, query_line, e))
+                if not self.ignore_errors:
+                    break
+        return errors
+
+    def record(self, errors: list, statement: SeedStatement):
+        for error in errors:
+            logger.debug(f"Error at line {error.line_index + 1} in seed file {error.file_name}: {error.exception}")
+        self.errors.extend(errors)
+        if errors and not self.ignore_errors:
+            self.aborted = True
+        if self.on_progress:
+            self.on_progress(statement.line_count)
@@ -0,0 +1,217 @@
+"""
+Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import csv
+import gzip
+import io
+import json
+import os
+from itertools import islice
+
+from graph_notebook.visualization.json_safe import convert_to_json_safe
+
+EXPORT_CHUNK_SIZE = 50000
+EXPORT_BUFFER_SIZE = 1024 * 1024
+# exports are written next to the export path under this suffix, and only renamed into place once they are complete
+PARTIAL_EXPORT_SUFFIX = '.part'
+INT64_MIN = -2 ** 63
+INT64_MAX = 2 ** 63 - 1
+
+EXPORT_FORMAT_PARQUET = 'parquet'
+EXPORT_FORMAT_JSONL = 'jsonl'
+EXPORT_FORMAT_CSV_GZ = 'csv.gz'
+STREAMING_EXPORT_EXTENSIONS = {
+    '.parquet': EXPORT_FORMAT_PARQUET,
+    '.jsonl': EXPORT_FORMAT_JSONL,
+    '.csv.gz': EXPORT_FORMAT_CSV_GZ
+}
+
+
+def get_streaming_export_format(export_path: str):
+    """
+    Returns the streaming export format for an --export-to path, or None if it should be exported as a plain CSV.
+    """
+    lower_path = export_path.lower()
+    for extension, export_format in STREAMING_EXPORT_EXTENSIONS.items():
+        if lower_path.endswith(extension):
+            return export_format
+    return None
+
+
+def chunked(rows, chunk_size: int):
+    rows = iter(rows)
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def to_text(value) -> str:
+    if value is None:
+        return ''
+    if isinstance(value, str):
+        return value
+    return str(value)
+
+
+def to_json_value(value):
+    """
+    Converts a result value to JSON, turning keys such as T.id and T.label in the maps returned by elementMap() and
+    valueMap(true) into strings.
+    """
+    if value is None:
+        return None
+    return convert_to_json_safe(value)
+
+
+def write_jsonl(export_path: str, columns: list, rows, chunk_size: int = EXPORT_CHUNK_SIZE):
+    columns = [to_text(column) for column in columns]
+    with open(export_path, 'w', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE) as export_file:
+        for chunk in chunked(rows, chunk_size):
+            export_file.write(''.join(json.dumps({column: to_json_value(value) for column, value in zip(columns, row)})
+                                      + '\n' for row in chunk))
+
+
+def write_csv_gz(export_path: str, columns: list, rows, chunk_size: int = EXPORT_CHUNK_SIZE):
+    with gzip.open(export_path, 'wb') as gz_file:
+        with io.TextIOWrapper(io.BufferedWriter(gz_file, EXPORT_BUFFER_SIZE), encoding='utf-8',
+                              newline='') as export_file:
+            writer = csv.writer(export_file)
+            writer.writerow(columns)
+            for chunk in chunked(rows, chunk_size):
+                writer.writerows([to_text(value) for value in row] for row in chunk)
+
+
+def infer_parquet_type(values: list):
+    """
+    Picks the Arrow type of a column from the values in a chunk. Columns that are not consistently boolean, numeric or
+    string are written as their string form.
+    """
+    import pyarrow as pa
+
+    value_types = {type(value) for value in values if value is not None}
+    if value_types == {bool}:
+        return pa.bool_()
+    if value_types and value_types <= {int, float}:
+        if int in value_types and not all(INT64_MIN <= value <= INT64_MAX for value in values if type(value) is int):
+            # integers which do not fit in 64 bits are written as their exact string form
+            return pa.string()
+        return pa.int64() if value_types == {int} else pa.float64()
+    return pa.string()
+
+
+def widen_parquet_type(parquet_type, values: list):
+    """
+    Returns the Arrow type that holds both the values already written to a column and the values of the next chunk:
+    integers and floats widen to float, and any other mix falls back to string.
+    """
+    import pyarrow as pa
+
+    if all(value is None for value in values):
+        return parquet_type
+    value_type = infer_parquet_type(values)
+    if value_type == parquet_type:
+        return parquet_type
+    if {str(value_type), str(parquet_type)} == {'int64', 'double'}:
+        return pa.float64()
+    return pa.string()
+
+
+def to_parquet_array(values: list, parquet_type):
+    import pyarrow as pa
+
+    if parquet_type == pa.string():
+        values = [None if value is None else to_text(value) for value in values]
+    return pa.array(values, type=parquet_type)
+
+
+def rewrite_parquet(source_path: str, target_path: str, schema):
+    """
+    Copies the row groups written so far to target_path with a widened schema, a row group at a time, and returns the
+    open writer of target_path so that later chunks are appended to it.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    writer = pq.ParquetWriter(target_path, schema)
+    try:
+        with pq.ParquetFile(source_path) as parquet_file:
+            for i in range(parquet_file.num_row_groups):
+                row_group = parquet_file.read_row_group(i)
+                arrays = [column if column.type == field.type else to_parquet_array(column.to_pylist(), field.type)
+                          for field, column in zip(schema, row_group.columns)]
+                writer.write_table(pa.Table.from_arrays(arrays, schema=schema))
+    except BaseException:
+        writer.close()
+        raise
+    os.remove(source_path)
+    return writer
+
+
+def write_parquet(export_path: str, columns: list, rows, chunk_size: int = EXPORT_CHUNK_SIZE):
+    """
+    Writes the rows a chunk at a time. The schema is inferred from the first chunk, and if a later chunk does not fit
+    it, the file written so far is rewritten once with the widened schema.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    field_names = [str(column) for column in columns]
+    # a rewrite switches between export_path and a partial file beside it
+    paths = [export_path, export_path + PARTIAL_EXPORT_SUFFIX]
+    writer = None
+    try:
+        for chunk in chunked(rows, chunk_size):
+            column_values = [list(values) for values in zip(*chunk)] if chunk else []
+            if writer is None:
+                schema = pa.schema([(name, infer_parquet_type(values))
+                                    for name, values in zip(field_names, column_values)])
+                writer = pq.ParquetWriter(paths[0], schema)
+            else:
+                schema = pa.schema([(field.name, widen_parquet_type(field.type, values))
+                                    for field, values in zip(writer.schema, column_values)])
+                if not schema.equals(writer.schema):
+                    writer.close()
+                    writer = None
+                    writer = rewrite_parquet(paths[0], paths[1], schema)
+                    paths.reverse()
+            arrays = [to_parquet_array(values, field.type) for field, values in zip(writer.schema, column_values)]
+            writer.write_table(pa.Table.from_arrays(arrays, schema=writer.schema))
+        if writer is None:
+            writer = pq.ParquetWriter(paths[0], pa.schema([(name, pa.string()) for name in field_names]))
+    finally:
+        if writer is not None:
+            writer.close()
+    if paths[0] != export_path:
+        os.replace(paths[0], export_path)
+
+
+STREAMING_EXPORT_WRITERS = {
+    EXPORT_FORMAT_PARQUET: write_parquet,
+    EXPORT_FORMAT_JSONL: write_jsonl,
+    EXPORT_FORMAT_CSV_GZ: write_csv_gz
+}
+
+
+def export_rows(export_path: str, columns: list, rows, chunk_size: int = EXPORT_CHUNK_SIZE):
+    """
+    Writes query result rows to export_path in the format given by its extension, a chunk of rows at a time, so
+    that the whole export never has to be held in memory as a DataFrame. The rows are written to a partial file that
+    only replaces export_path once the export is complete.
+    """
+    export_format = get_streaming_export_format(export_path)
+    if export_format is None:
+        raise ValueError(f'Unsupported export format for path {export_path}. '
+                         f'Supported extensions are: {list(STREAMING_EXPORT_EXTENSIONS.keys())}')
+    partial_path = export_path + PARTIAL_EXPORT_SUFFIX
+    try:
+        STREAMING_EXPORT_WRITERS[export_format](partial_path, list(columns), rows, chunk_size)
+    except BaseException:
+        for path in [partial_path, partial_path + PARTIAL_EXPORT_SUFFIX]:
+            if os.path.exists(path):
+                os.remove(path)
+        raise
+    os.replace(partial_path, export_path)
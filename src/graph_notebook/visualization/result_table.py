@@ -0,0 +1,106 @@
+"""
+Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: Apache-2.0
+"""
+
+from __future__ import annotations  # annotations such as pd.DataFrame must not import pandas
+
+from itertools import zip_longest
+
+from graph_notebook.lazy_import import lazy_import
+
+pd = lazy_import('pandas')
+
+DT_HTML_CHAR_MAP = {"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#39;"}
+RESULTS_INDEX_COLUMN = '#'
+GREMLIN_RESULTS_COLUMN = 'Result'
+# columns with no missing values whose str() is already what convert_dtypes().astype(str) would produce
+CONVERSION_FREE_DTYPES = ('string', 'integer', 'boolean')
+
+
+def escape_html_values(values) -> list:
+    """
+    HTML-escapes the string form of every value in a column. Chained str.replace calls run in C and, for these
+    five characters, beat both str.translate and a regex substitution.
+    """
+    return [str(value).replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;').replace('"', '&quot;')
+            .replace("'", '&#39;') for value in values]
+
+
+def rows_to_columns(rows: list) -> list:
+    """
+    Transposes result rows into a list of columns, padding short rows with None as pandas would.
+    """
+    if not rows:
+        return []
+    if isinstance(rows[0], dict):
+        keys = list(dict.fromkeys(key for row in rows for key in row))
+        return [[row.get(key) for row in rows] for key in keys]
+    return [list(column) for column in zip_longest(*rows)]
+
+
+def column_to_display_strings(values: list, convert_types: bool = True) -> list:
+    """
+    Returns the text shown for each value of a column. With convert_types, this is the text pandas produces for the
+    column after convert_dtypes(), so e.g. integral floats render as integers and missing values as <NA>.
+    """
+    if convert_types and pd.api.types.infer_dtype(values, skipna=False) not in CONVERSION_FREE_DTYPES:
+        values = pd.Series(values).convert_dtypes().astype(str).tolist()
+    return escape_html_values(values)
+
+
+def build_gremlin_results_df(query_res: list, start: int = 1) -> pd.DataFrame:
+    """
+    Builds the single-column %%gremlin results table, indexed by result number from start. The raw results are left
+    untouched.
+    """
+    results_df = pd.DataFrame({GREMLIN_RESULTS_COLUMN: escape_html_values(query_res)},
+                              index=pd.RangeIndex(start, start + len(query_res)), dtype=object)
+    results_df.columns.name = RESULTS_INDEX_COLUMN
+    return results_df
+
+
+def build_results_df(rows: list, columns, convert_types: bool = True) -> pd.DataFrame:
+    """
+    Builds a results table with a leading # column from rows of query results, converting and escaping each column
+    in a single pass. Column names are assigned by position; named columns with no values are left empty.
+    """
+    column_values = rows_to_columns(rows)
+    column_names = list(columns)
+    display_columns = [column_to_display_strings(values, convert_types) for values in column_values]
+    labels = [column_names[i] if i < len(column_names) else i for i in range(len(display_columns))]
+    for column_name in column_names[len(display_columns):]:
+        display_columns.append([''] * len(rows))
+        labels.append(column_name)
+
+    results_df = pd.DataFrame({i: values for i, values in enumerate(display_columns)}, dtype=object)
+    results_df.columns = labels
+    results_df.insert(0, RESULTS_INDEX_COLUMN, range(1, len(rows) + 1))
+    return results_df
+
+
+def unescape_html_value(value: str) -> str:
+    # &amp; goes last, so that this is the exact inverse of escape_html_values
+    return value.replace('&lt;', '<').replace('&gt;', '>').replace('&quot;', '"').replace('&#39;', "'") \
+        .replace('&amp;', '&')
+
+
+def unescape_html_column(series: pd.Series) -> pd.Series:
+    """
+    Reverses escape_html_values on the string cells of a column in one pass; other cells are left as they are.
+    """
+    if not (series.dtype == object or pd.api.types.is_string_dtype(series.dtype)):
+        return series
+    decoded = [unescape_html_value(value) if isinstance(value, str) and '&' in value else value
+               for value in series.tolist()]
+    return pd.Series(decoded, index=series.index, name=series.name, dtype=series.dtype)
+
+
+def unescape_html_df(results_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Returns a copy of a results table with the HTML escaping added for display removed from every string column.
+    """
+    results_df = results_df.copy()
+    for position in range(results_df.shape[1]):
+        results_df.isetitem(position, unescape_html_column(results_df.iloc[:, position]))
+    return results_df
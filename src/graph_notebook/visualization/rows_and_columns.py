@@ -46,21 +46,14 @@ def opencypher_get_rows_and_columns(results, res_format: str = None):
     else:
         res = results
 
-    if res_format != 'jolt':
-        if len(res) > 0:
-            columns = res[0].keys()
-
-        for r in res:
-            row = []
-            for key, item in r.items():
-                row.append(item)
-            rows.append(row)
-    else:
-        if len(res) > 0:
-            columns.add("Result")
-
-        for r in res:
-            rows.append(r)
+    if len(res) > 0:
+        columns = res[0].keys()
+
+    for r in res:
+        row = []
+        for key, item in r.items():
+            row.append(item)
+        rows.append(row)
 
     return {
         'columns': columns,
@@ -7,6 +7,7 @@ import json
 import os
 
 from .force import Force  # noqa F401
+from .table import PaginatedTable  # noqa F401
 
 
 def get_package_json():
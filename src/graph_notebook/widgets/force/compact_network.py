@@ -0,0 +1,195 @@
+"""
+Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: Apache-2.0
+
+Compact wire format for the network sent to the Force widget.
+
+The JSON produced by Network.to_json repeats the same keys (label, title, group, properties, ...) and often the same
+values (labels, group names) for every node and edge. In the compact format:
+
+- every distinct value (keys and values alike) is stored once in a value table, and referenced by its index.
+- every distinct layout of keys of a node or edge, including the keys of nested dicts such as properties (a "shape"),
+  is stored once. A shape is a list whose entries are either the index of a key holding a value, or
+  [key index, shape] for a key holding a nested dict.
+- each node and edge is then just the index of its shape, followed by the value indexes of its values in shape order.
+- node ids, shapes and values, and the endpoints, keys, shapes and values of edges, are sent as arrays of little-endian
+  unsigned integers in binary buffers, using the smallest of 1, 2 or 4 bytes per integer that fits the largest one.
+  Edge endpoints are positions in the node arrays.
+
+Decoding a compact network gives the same nodes and links as convert_to_json_safe(network.to_json()).
+"""
+
+import json
+
+import numpy as np
+from networkx import MultiDiGraph
+
+from graph_notebook.visualization.json_safe import convert_to_json_safe
+
+COMPACT_FORMAT = 'compact'
+UINT_DTYPES = {1: '<u1', 2: '<u2', 4: '<u4'}
+BUFFER_NAMES = ['node_ids', 'node_shapes', 'node_values', 'edge_sources', 'edge_targets', 'edge_keys', 'edge_shapes',
+                'edge_values']
+
+
+class CompactEncoder:
+    def __init__(self):
+        self.values = []
+        self.value_indexes = {}
+        self.shapes = []
+        self.shape_indexes = {}
+
+    def value_index(self, value) -> int:
+        value_type = type(value)
+        if value_type is str:
+            key = value
+        elif value_type in (int, float, bool):
+            # the type is part of the key so that 1, 1.0 and True are kept apart
+            key = (value_type, value)
+        elif value_type is list:
+            value = convert_to_json_safe(value)
+            key = (list, json.dumps(value))
+        else:
+            # same conversion as convert_to_json_safe, for None, enums like T.id and other custom types
+            value = str(value)
+            key = value
+        index = self.value_indexes.get(key)
+        if index is None:
+            index = len(self.values)
+            self.value_indexes[key] = index
+            self.values.append(value)
+        return index
+
+    def flatten(self, data: dict, values: list) -> tuple:
+        """
+        Appends the value indexes of data to values, and returns the layout of its keys.
+        """
+        shape = []
+        for key, value in data.items():
+            if isinstance(value, dict):
+                shape.append((key, self.flatten(value, values)))
+            else:
+                values.append(self.value_index(value))
+                shape.append(key)
+        return tuple(shape)
+
+    def shape_to_json(self, shape: tuple) -> list:
+        return [[self.value_index(str(entry[0])), self.shape_to_json(entry[1])] if isinstance(entry, tuple)
+                else self.value_index(str(entry)) for entry in shape]
+
+    def shape_index(self, shape: tuple) -> int:
+        index = self.shape_indexes.get(shape)
+        if index is None:
+            index = len(self.shapes)
+            self.shape_indexes[shape] = index
+            self.shapes.append(self.shape_to_json(shape))
+        return index
+
+    def encode(self, data: dict, shapes: list, values: list):
+        shapes.append(self.shape_index(self.flatten(data, values)))
+
+
+def graph_to_compact_json(graph: MultiDiGraph) -> dict:
+    """
+    Returns the compact form of a graph. The integer arrays are returned as memoryviews, which ipywidgets
+    sends to the front-end as binary buffers instead of JSON.
+    """
+    encoder = CompactEncoder()
+    node_positions = {}
+    node_ids = []
+    node_shapes = []
+    node_values = []
+    for position, (node_id, data) in enumerate(graph.nodes(data=True)):
+        node_positions[node_id] = position
+        node_ids.append(encoder.value_index(node_id))
+        encoder.encode(data, node_shapes, node_values)
+
+    edge_sources = []
+    edge_targets = []
+    edge_keys = []
+    edge_shapes = []
+    edge_values = []
+    for source, target, key, data in graph.edges(keys=True, data=True):
+        edge_sources.append(node_positions[source])
+        edge_targets.append(node_positions[target])
+        edge_keys.append(encoder.value_index(key))
+        encoder.encode(data, edge_shapes, edge_values)
+
+    graph_shapes = []
+    graph_values = []
+    encoder.encode(graph.graph, graph_shapes, graph_values)
+
+    buffers = [node_ids, node_shapes, node_values, edge_sources, edge_targets, edge_keys, edge_shapes, edge_values]
+    compact = {
+        'format': COMPACT_FORMAT,
+        'directed': graph.is_directed(),
+        'multigraph': graph.is_multigraph(),
+        'graph': graph_shapes + graph_values,
+        'values': encoder.values,
+        'shapes': encoder.shapes
+    }
+    compact['buffer_widths'] = {}
+    for name, indexes in zip(BUFFER_NAMES, buffers):
+        width = uint_width(max(indexes, default=0))
+        compact['buffer_widths'][name] = width
+        compact[name] = memoryview(np.array(indexes, dtype=UINT_DTYPES[width]))
+    return compact
+
+
+def uint_width(max_value: int) -> int:
+    if max_value < 1 << 8:
+        return 1
+    if max_value < 1 << 16:
+        return 2
+    return 4
+
+
+def decode_compact_record(compact: dict, shape: list, values, position: int):
+    """
+    Rebuilds a dict from its shape and the value indexes starting at position. Returns the dict and the position
+    after its last value.
+    """
+    record = {}
+    for entry in shape:
+        if isinstance(entry, list):
+            record[compact['values'][entry[0]]], position = decode_compact_record(compact, entry[1], values, position)
+        else:
+            record[compact['values'][entry]] = compact['values'][values[position]]
+            position += 1
+    return record, position
+
+
+def decode_compact_records(compact: dict, shapes, values) -> list:
+    records = []
+    position = 0
+    for shape_index in shapes:
+        record, position = decode_compact_record(compact, compact['shapes'][shape_index], values, position)
+        records.append(record)
+    return records
+
+
+def compact_json_to_graph_json(compact: dict) -> dict:
+    """
+    Decodes a compact network back into the node-link json of Network.to_json. This mirrors the decoder used by the
+    Force widget front-end.
+    """
+    values = compact['values']
+    buffers = {name: np.frombuffer(compact[name], dtype=UINT_DTYPES[compact['buffer_widths'][name]]).tolist()
+               for name in BUFFER_NAMES}
+    node_ids = [values[i] for i in buffers['node_ids']]
+    node_data = decode_compact_records(compact, buffers['node_shapes'], buffers['node_values'])
+    nodes = [{**data, 'id': node_id} for node_id, data in zip(node_ids, node_data)]
+    edge_data = decode_compact_records(compact, buffers['edge_shapes'], buffers['edge_values'])
+    links = [{**data, 'source': node_ids[source], 'target': node_ids[target], 'key': values[key]}
+             for source, target, key, data in zip(buffers['edge_sources'], buffers['edge_targets'],
+                                                  buffers['edge_keys'], edge_data)]
+    graph_data = decode_compact_records(compact, compact['graph'][:1], compact['graph'][1:])[0]
+    return {
+        'graph': {
+            'directed': compact['directed'],
+            'multigraph': compact['multigraph'],
+            'graph': graph_data,
+            'nodes': nodes,
+            'links': links
+        }
+    }
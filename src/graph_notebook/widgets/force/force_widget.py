@@ -2,38 +2,35 @@
 Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 SPDX-License-Identifier: Apache-2.0
 """
+import asyncio
+import time
+
 import graph_notebook
 from graph_notebook.network.EventfulNetwork import EventfulNetwork
+from graph_notebook.network.clustering import NetworkClusters
+from graph_notebook.widgets.force.compact_network import graph_to_compact_json
 from graph_notebook.options import OPTIONS_DEFAULT_DIRECTED
+from graph_notebook.visualization.json_safe import convert_to_json_safe
 from traitlets import Unicode, Dict, Instance
 from ipywidgets import DOMWidget, register
 
 MAX_LABEL_LENGTH = 10
+DEFAULT_SYNC_INTERVAL_MS = 100
+DEFAULT_SYNC_BATCH_SIZE = 1000
+# networks with at least this many nodes and edges are sent in the compact format by default
+COMPACT_PAYLOAD_THRESHOLD = 5000
 
 
-def convert_to_json_safe(data):
-    """
-    Converts data structures to JSON-compliant format by ensuring all dictionary keys and values 
-    meet Jupiter client's serialization requirements. As per Jupyter protocol, dictionary keys 
-    must be one of: str, int, float, bool, or None.
-    
-    Any custom types (like enum T) or complex objects that aren't JSON-serializable are 
-    converted to their string representation using str(). This handles cases where graph data 
-    contains non-standard types like custom classes or enums that would otherwise cause 
-    serialization failures.
-"""
-    if isinstance(data, dict):
-        return {
-            str(k) if hasattr(k, '__class__') else k: convert_to_json_safe(v)
-            for k, v in data.items()
-        }
-    elif isinstance(data, list):
-        return [convert_to_json_safe(item) for item in data]
-    elif hasattr(data, '__class__') and not isinstance(data, (str, int, float, bool)):
-        return str(data)
-    return data
-
-def graph_to_json(network: EventfulNetwork, trait):
+def use_compact_payload(network: EventfulNetwork, compact_payload) -> bool:
+    if compact_payload is None:
+        graph = network.graph
+        return graph.number_of_nodes() + graph.number_of_edges() >= COMPACT_PAYLOAD_THRESHOLD
+    return compact_payload
+
+
+def graph_to_json(network: EventfulNetwork, widget):
+    if use_compact_payload(network, getattr(widget, 'compact_payload', False)):
+        return graph_to_compact_json(network.graph)
     json_data = network.to_json()
     converted_data = convert_to_json_safe(json_data)
     return converted_data
@@ -67,10 +64,16 @@ class Force(DOMWidget):
         - See https://visjs.github.io/vis-network/docs/network/#options for more info.
     2. message -> Notification system to tell the user what actions have taken place. For example, issuing a query for the user to gather more data.
     3. network -> The instance of an EventfulNetwork which will trigger messages to the front-end whenever methods are called to modify the underlying graph.
+        - Large networks are sent in the compact format of graph_notebook.widgets.force.compact_network, which can be
+          turned on or off for any network size with compact_payload.
+        - When the network was collapsed into clusters (see graph_notebook.network.clustering), clusters is the
+          kernel-side index used to expand a cluster when the front-end sends an "expand_cluster" message.
 
-    By default, we will register one placeholder event which will trigger on all method calls of the network traitlet.
-    This will wrap the parameters of the method call with an event and send it as a message to the front-end to keep the
-    browser network in sync.
+    By default, we will register one event which will trigger on all method calls of the network traitlet.
+    This will wrap the parameters of the method call with an event and send it to the front-end to keep the
+    browser network in sync. Events are queued and sent together as a single "batch" custom message once
+    sync_batch_size events are queued or sync_interval_ms has passed, so only the changes to the network are sent
+    rather than serializing the whole network again. The full network is only sent when the widget is first rendered.
 
     You can find more information on Widgets here: https://ipywidgets.readthedocs.io/en/latest/examples/Widget%20Basics.html
     """
@@ -96,11 +99,78 @@ class Force(DOMWidget):
     network = Instance(klass=EventfulNetwork).tag(sync=True, to_json=graph_to_json)
 
     def __init__(self, network: EventfulNetwork = EventfulNetwork(), options: dict = OPTIONS_DEFAULT_DIRECTED,
-                 with_callback: bool = True, **kwargs):
+                 with_callback: bool = True, sync_interval_ms: int = DEFAULT_SYNC_INTERVAL_MS,
+                 sync_batch_size: int = DEFAULT_SYNC_BATCH_SIZE, compact_payload: bool = None,
+                 clusters: NetworkClusters = None, **kwargs):
+        self.compact_payload = compact_payload
+        self.clusters = clusters
+        self.sync_interval_ms = sync_interval_ms
+        self.sync_batch_size = max(1, sync_batch_size)
+        self._pending_events = []
+        self._last_flush = time.monotonic()
+        self._flush_handle = None
+        # Until a view has rendered, the front-end cannot apply events, so any changes made in the meantime
+        # are picked up by sending the full network once the view reports that it is ready. The same goes for views
+        # rendered later on, which start from the last full network that was sent.
+        self._view_ready = False
+        self._stale_snapshot = False
         if with_callback:
             network.register_universal_callback(self.eventful_network_callback)
 
         super().__init__(network=network, options=options, **kwargs)
+        self.on_msg(self._handle_custom_msg)
 
     def eventful_network_callback(self, network, event_name, data):
-        pass
+        if network is not self.network:
+            return
+        self._stale_snapshot = True
+        if not self._view_ready:
+            return
+        self._pending_events.append({
+            'method': event_name,
+            'data': convert_to_json_safe(data)
+        })
+        if len(self._pending_events) >= self.sync_batch_size \
+                or (time.monotonic() - self._last_flush) * 1000 >= self.sync_interval_ms:
+            self.flush_events()
+        elif self._flush_handle is None:
+            self._schedule_flush()
+
+    def _schedule_flush(self):
+        """
+        Makes sure that events queued at the end of a burst of changes are sent without waiting for the next change.
+        Outside a running event loop (e.g. when the network is changed from a thread), flush_events must be called.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._flush_handle = loop.call_later(self.sync_interval_ms / 1000, self.flush_events)
+
+    def flush_events(self):
+        """
+        Sends all queued network events to the front-end in one batch message.
+        """
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self._last_flush = time.monotonic()
+        if not self._pending_events:
+            return
+        events = self._pending_events
+        self._pending_events = []
+        self.send({'method': 'batch', 'data': events})
+
+    def _handle_custom_msg(self, widget, content, buffers):
+        if content.get('method') == 'expand_cluster':
+            if self.clusters is not None:
+                # a cluster which cannot be expanded still has its title updated
+                self.clusters.expand(content.get('data', {}).get('cluster_id'), self.network)
+                self.flush_events()
+        elif content.get('method') == 'view_ready':
+            self._view_ready = True
+            if self._stale_snapshot:
+                self._pending_events = []
+                self.flush_events()
+                self._stale_snapshot = False
+                self.send_state('network')
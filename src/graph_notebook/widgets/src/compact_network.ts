@@ -0,0 +1,121 @@
+/*
+Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: Apache-2.0
+ */
+
+import { DynamicObject, ForceNetwork, Graph, Link, VisNode } from "./types";
+
+const COMPACT_FORMAT = "compact";
+
+/*
+Decoder for the compact network format written by graph_notebook/widgets/force/compact_network.py.
+
+Every key and value is an index into the "values" table. Each node and edge has a shape, which lists the indexes of
+its keys in order (or [key index, shape] for a key holding a nested dict), and the indexes of its values follow the
+order of its shape. All per-node and per-edge indexes arrive as binary buffers of little-endian unsigned integers,
+whose width in bytes is given by "buffer_widths".
+*/
+type Shape = Array<number | [number, Shape]>;
+type UintArray = Uint8Array | Uint16Array | Uint32Array;
+
+function toUintArray(view: DataView, width: number): UintArray {
+  // copy the buffer so that the array is aligned regardless of where the view starts
+  const buffer = view.buffer.slice(
+    view.byteOffset,
+    view.byteOffset + view.byteLength
+  );
+  switch (width) {
+    case 1:
+      return new Uint8Array(buffer);
+    case 2:
+      return new Uint16Array(buffer);
+    default:
+      return new Uint32Array(buffer);
+  }
+}
+
+/**
+ * Decodes the records (nodes or edges) whose shapes and value indexes are given, reading the values of each
+ * record in the order of its shape.
+ */
+function decodeRecords(
+  values: Array<any>,
+  shapes: Array<Shape>,
+  recordShapes: ArrayLike<number>,
+  recordValues: ArrayLike<number>
+): Array<DynamicObject> {
+  let position = 0;
+  const decodeRecord = (shape: Shape): DynamicObject => {
+    const record: DynamicObject = {};
+    shape.forEach((entry) => {
+      if (Array.isArray(entry)) {
+        record[values[entry[0]]] = decodeRecord(entry[1]);
+      } else {
+        record[values[entry]] = values[recordValues[position]];
+        position += 1;
+      }
+    });
+    return record;
+  };
+  return Array.from(recordShapes, (shapeIndex) =>
+    decodeRecord(shapes[shapeIndex])
+  );
+}
+
+export function isCompactNetwork(network: DynamicObject | null): boolean {
+  return network !== null && network["format"] === COMPACT_FORMAT;
+}
+
+/**
+ * Rebuild the node-link json of a network from its compact form, so that it can be used
+ * in the same way as a network which was sent as plain json.
+ */
+export function decodeCompactNetwork(compact: DynamicObject): ForceNetwork {
+  const values: Array<any> = compact["values"];
+  const shapes: Array<Shape> = compact["shapes"];
+  const buffer = (name: string): UintArray =>
+    toUintArray(compact[name], compact["buffer_widths"][name]);
+
+  const nodeIDs = Array.from(buffer("node_ids"), (i) => values[i]);
+  const nodeData = decodeRecords(
+    values,
+    shapes,
+    buffer("node_shapes"),
+    buffer("node_values")
+  );
+  const nodes = nodeIDs.map(
+    (id, i) => ({ ...nodeData[i], id: id } as VisNode)
+  );
+
+  const edgeSources = buffer("edge_sources");
+  const edgeTargets = buffer("edge_targets");
+  const edgeKeys = buffer("edge_keys");
+  const edgeData = decodeRecords(
+    values,
+    shapes,
+    buffer("edge_shapes"),
+    buffer("edge_values")
+  );
+  const links = edgeData.map(
+    (data, i) =>
+      ({
+        ...data,
+        source: nodeIDs[edgeSources[i]],
+        target: nodeIDs[edgeTargets[i]],
+        key: values[edgeKeys[i]],
+      } as Link)
+  );
+
+  return new ForceNetwork(new Graph(nodes, links));
+}
+
+/**
+ * Deserializer for the network traitlet of the ForceModel, which decodes compact networks and
+ * leaves networks sent as plain json as they are.
+ */
+export function deserializeNetwork(network: DynamicObject | null): any {
+  if (isCompactNetwork(network)) {
+    return decodeCompactNetwork(network as DynamicObject);
+  }
+  return network;
+}
@@ -23,6 +23,7 @@ import {
   VisNode,
 } from "./types";
 import { MODULE_NAME, MODULE_VERSION } from "./version";
+import { deserializeNetwork } from "./compact_network";
 import { initThemeDetection } from "./theme_manager";
 
 import feather from "feather-icons";
@@ -61,6 +62,7 @@ export class ForceModel extends DOMWidgetModel {
   static serializers: ISerializers = {
     ...DOMWidgetModel.serializers,
     // Add any extra serializers here
+    network: { deserialize: deserializeNetwork },
   };
 
   static model_name = "ForceModel";
@@ -112,6 +114,9 @@ export class ForceView extends DOMWidgetView {
   private detailsBtn = document.createElement("button");
   private selectedNodeID: string | number = "";
   private physicsBtn = document.createElement("button");
+  // nodes and edges changed by the batch of events currently being applied, see applyBatch
+  private pendingNodes: Map<string, VisNode> | null = null;
+  private pendingEdges: Map<string, VisEdge> | null = null;
 
   render(): void {
     // Initialize theme detection for dark mode compatibility
@@ -183,6 +188,9 @@ export class ForceView extends DOMWidgetView {
     this.listenTo(this.model, "change:network", this.changeNetwork);
     this.listenTo(this.model, "change:options", this.changeOptions);
 
+    // let the kernel know it can start sending network changes as batches of events
+    this.send({ method: "view_ready" });
+
     // Wait for jQuery UI CSS to load before building actions
     jqueryUICss.onload = () => {
       console.warn('jQuery UI CSS loaded, initializing actions');
@@ -281,11 +289,88 @@ export class ForceView extends DOMWidgetView {
       case "add_edge_data":
         this.addEdgeData(msgData);
         break;
+      case "remove_node":
+        this.removeNode(msgData);
+        break;
+      case "batch":
+        this.applyBatch(msgData);
+        break;
       default:
         console.log("unsupported method found", msg["method"]);
     }
   }
 
+  /**
+   * Apply a batch of network events sent together by the kernel. Each event has the same method and data fields as
+   * a single custom message. Nodes and edges changed by the batch are collected first, so that the datasets (and the
+   * rendered network) are only updated once per batch instead of once per event.
+   */
+  applyBatch(events: Array<Message>): void {
+    this.pendingNodes = new Map<string, VisNode>();
+    this.pendingEdges = new Map<string, VisEdge>();
+    try {
+      events.forEach((event) => {
+        if (event["method"] === "batch") {
+          return;
+        }
+        this.interceptCustom(event);
+      });
+      this.nodeDataset.update(Array.from(this.pendingNodes.values()));
+      this.edgeDataset.update(Array.from(this.pendingEdges.values()));
+    } finally {
+      this.pendingNodes = null;
+      this.pendingEdges = null;
+    }
+  }
+
+  getNode(id: string): VisNode | null {
+    const pending = this.pendingNodes?.get(id);
+    return pending !== undefined ? pending : this.nodeDataset.get(id);
+  }
+
+  updateNode(node: VisNode): void {
+    if (this.pendingNodes !== null) {
+      this.pendingNodes.set(node.id, node);
+    } else {
+      this.nodeDataset.update([node]);
+    }
+  }
+
+  getEdge(id: string): VisEdge | null {
+    const pending = this.pendingEdges?.get(id);
+    return pending !== undefined ? pending : this.edgeDataset.get(id);
+  }
+
+  updateEdge(edge: VisEdge): void {
+    if (this.pendingEdges !== null) {
+      this.pendingEdges.set(edge.id, edge);
+    } else {
+      this.edgeDataset.update([edge]);
+    }
+  }
+
+  /**
+   * Remove a node, and every edge from or to it, from the datasets.
+   *
+   * Example input:
+   {
+        "node_id": "1234"
+   }
+   */
+  removeNode(msgData: DynamicObject): void {
+    const id: string = msgData["node_id"];
+    const isConnected = (edge: VisEdge): boolean =>
+      edge.from === id || edge.to === id;
+    this.pendingNodes?.delete(id);
+    this.pendingEdges?.forEach((edge, edgeID) => {
+      if (isConnected(edge)) {
+        this.pendingEdges?.delete(edgeID);
+      }
+    });
+    this.edgeDataset.remove(this.edgeDataset.getIds({ filter: isConnected }));
+    this.nodeDataset.remove(id);
+  }
+
   /**
      * Add a node to the nodes dataset, merging the new node with the existing one
      * if this id is already present.
@@ -309,7 +394,7 @@ export class ForceView extends DOMWidgetView {
     }
 
     const id: string = msgData["node_id"];
-    let node = this.nodeDataset.get(id);
+    let node = this.getNode(id);
     if (node === null) {
       // node with given id was not found...
       // The node does not exist, we can convert this object to one and add it.
@@ -323,7 +408,7 @@ export class ForceView extends DOMWidgetView {
       // no label found, using node id
       node["label"] = id;
     }
-    this.nodeDataset.update([node]);
+    this.updateNode(node);
     return;
   }
 
@@ -430,7 +515,7 @@ export class ForceView extends DOMWidgetView {
       label: label,
       ...innerData,
     };
-    let edge = this.edgeDataset.get(edgeID);
+    let edge = this.getEdge(edgeID);
     if (edge === null) {
       // edge does not exist, we need to create a new one from this payload
       edge = VisEdge.fromObject(copiedData);
@@ -438,7 +523,7 @@ export class ForceView extends DOMWidgetView {
       edge = VisEdge.mergeObject(edge, copiedData);
     }
 
-    this.edgeDataset.update([edge]);
+    this.updateEdge(edge);
   }
 
   /**
@@ -490,6 +575,16 @@ export class ForceView extends DOMWidgetView {
       }
     });
 
+    this.vis?.on("doubleClick", (params) => {
+      // clusters of nodes are expanded by the kernel, which holds their members
+      if (params.nodes.length === 1) {
+        const node = this.nodeDataset.get(params.nodes[0]);
+        if (node !== null && node["cluster"] === true) {
+          this.send({ method: "expand_cluster", data: { cluster_id: node.id } });
+        }
+      }
+    });
+
     this.vis?.on("selectNode", (params) => {
       this.handleNodeClick(params.nodes[0]);
     });
@@ -5,6 +5,7 @@ SPDX-License-Identifier: Apache-2.0
 
 export * from "./version";
 export * from "./force_widget";
+export * from "./table_widget";
 
 if (module.hot) {
   module.hot.accept(function () {
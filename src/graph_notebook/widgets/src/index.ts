@@ -5,3 +5,4 @@ SPDX-License-Identifier: Apache-2.0
 
 export * from "./version";
 export * from "./force_widget";
+export * from "./table_widget";
@@ -6,6 +6,7 @@ SPDX-License-Identifier: Apache-2.0
 import { JupyterFrontEnd, JupyterFrontEndPlugin } from '@jupyterlab/application';
 import { IJupyterWidgetRegistry } from "@jupyter-widgets/base";
 import { ForceModel, ForceView } from "./force_widget";
+import { PaginatedTableModel, PaginatedTableView } from "./table_widget";
 import { MODULE_NAME, MODULE_VERSION } from "./version";
 
 const EXTENSION_ID = "graph_notebook_widgets:plugin";
@@ -18,7 +19,7 @@ function activate(app: JupyterFrontEnd, registry: IJupyterWidgetRegistry): void
   registry.registerWidget({
     name: MODULE_NAME,
     version: MODULE_VERSION,
-    exports: { ForceModel, ForceView },
+    exports: { ForceModel, ForceView, PaginatedTableModel, PaginatedTableView },
   });
   console.log("✅ Widget registration successful");
 }
@@ -0,0 +1,252 @@
+/*
+Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: Apache-2.0
+ */
+
+import {
+  DOMWidgetModel,
+  DOMWidgetView,
+  ISerializers,
+} from "@jupyter-widgets/base";
+
+import { DynamicObject, Message } from "./types";
+import { MODULE_NAME, MODULE_VERSION } from "./version";
+
+import "../css/widget.css";
+
+// Wait this long after the last keystroke in the search box before asking the kernel to filter
+const SEARCH_DEBOUNCE_MS = 300;
+
+/*
+The PaginatedTableModel holds only metadata about the results table (column names, row count and page size
+options). The rows themselves stay in the kernel, and the PaginatedTableView asks for them one page at a time.
+*/
+export class PaginatedTableModel extends DOMWidgetModel {
+  // eslint-disable-next-line @typescript-eslint/explicit-function-return-type
+  defaults() {
+    return {
+      ...super.defaults(),
+      _model_name: PaginatedTableModel.model_name,
+      _model_module: PaginatedTableModel.model_module,
+      _model_module_version: PaginatedTableModel.model_module_version,
+      _view_name: PaginatedTableModel.view_name,
+      _view_module: PaginatedTableModel.view_module,
+      _view_module_version: PaginatedTableModel.view_module_version,
+    };
+  }
+
+  static serializers: ISerializers = {
+    ...DOMWidgetModel.serializers,
+  };
+
+  static model_name = "PaginatedTableModel";
+  static model_module = MODULE_NAME;
+  static model_module_version = MODULE_VERSION;
+  static view_name = "PaginatedTableView";
+  static view_module = MODULE_NAME;
+  static view_module_version = MODULE_VERSION;
+}
+
+export class PaginatedTableView extends DOMWidgetView {
+  private controlsDiv: HTMLDivElement = document.createElement("div");
+  private pageSizeSelect: HTMLSelectElement = document.createElement("select");
+  private searchInput: HTMLInputElement = document.createElement("input");
+  private table: HTMLTableElement = document.createElement("table");
+  private tableHead: HTMLTableSectionElement = document.createElement("thead");
+  private tableBody: HTMLTableSectionElement = document.createElement("tbody");
+  private footerDiv: HTMLDivElement = document.createElement("div");
+  private infoSpan: HTMLSpanElement = document.createElement("span");
+  private previousBtn: HTMLButtonElement = document.createElement("button");
+  private nextBtn: HTMLButtonElement = document.createElement("button");
+  private page = 0;
+  private pageSize = 10;
+  private sortColumn = -1;
+  private ascending = true;
+  private search = "";
+  private filteredRows = 0;
+  private requestId = 0;
+  private searchTimer: number | null = null;
+
+  render(): void {
+    this.el.classList.add("paginated-table");
+    this.pageSize = this.model.get("page_size");
+
+    this.buildControls();
+    this.table.classList.add("paginated-table-rows");
+    this.table.appendChild(this.tableHead);
+    this.table.appendChild(this.tableBody);
+    this.buildFooter();
+
+    this.el.appendChild(this.controlsDiv);
+    this.el.appendChild(this.table);
+    this.el.appendChild(this.footerDiv);
+
+    this.listenTo(this.model, "msg:custom", this.interceptCustom);
+    this.listenTo(this.model, "change:columns", this.renderHeader);
+    // rows are appended while results are streamed in
+    this.listenTo(this.model, "change:total_rows", this.requestPage);
+    this.renderHeader();
+    this.requestPage();
+  }
+
+  buildControls(): void {
+    this.controlsDiv.classList.add("paginated-table-controls");
+
+    const options: Array<number> = this.model.get("page_size_options");
+    const labels: Array<string> = this.model.get("page_size_labels");
+    options.forEach((option, i) => {
+      const optionElement = document.createElement("option");
+      optionElement.value = String(option);
+      optionElement.text = labels[i];
+      optionElement.selected = option === this.pageSize;
+      this.pageSizeSelect.appendChild(optionElement);
+    });
+    this.pageSizeSelect.addEventListener("change", () => {
+      this.pageSize = parseInt(this.pageSizeSelect.value);
+      this.page = 0;
+      this.requestPage();
+    });
+
+    const lengthLabel = document.createElement("label");
+    lengthLabel.append("Show ", this.pageSizeSelect, " entries");
+
+    this.searchInput.type = "search";
+    this.searchInput.addEventListener("input", () => {
+      if (this.searchTimer !== null) {
+        window.clearTimeout(this.searchTimer);
+      }
+      this.searchTimer = window.setTimeout(() => {
+        this.search = this.searchInput.value;
+        this.page = 0;
+        this.requestPage();
+      }, SEARCH_DEBOUNCE_MS);
+    });
+    const searchLabel = document.createElement("label");
+    searchLabel.append("Search: ", this.searchInput);
+
+    this.controlsDiv.appendChild(lengthLabel);
+    this.controlsDiv.appendChild(searchLabel);
+  }
+
+  buildFooter(): void {
+    this.footerDiv.classList.add("paginated-table-footer");
+    this.previousBtn.textContent = "Previous";
+    this.nextBtn.textContent = "Next";
+    this.previousBtn.addEventListener("click", () => {
+      this.page -= 1;
+      this.requestPage();
+    });
+    this.nextBtn.addEventListener("click", () => {
+      this.page += 1;
+      this.requestPage();
+    });
+
+    const pagerDiv = document.createElement("div");
+    pagerDiv.appendChild(this.previousBtn);
+    pagerDiv.appendChild(this.nextBtn);
+    this.footerDiv.appendChild(this.infoSpan);
+    this.footerDiv.appendChild(pagerDiv);
+  }
+
+  renderHeader(): void {
+    const columns: Array<string> = this.model.get("columns");
+    const hideIndex: boolean = this.model.get("hide_index");
+    const row = document.createElement("tr");
+    columns.forEach((column, i) => {
+      const th = document.createElement("th");
+      th.textContent = column;
+      if (i === this.sortColumn) {
+        th.classList.add(this.ascending ? "sorted-asc" : "sorted-desc");
+      }
+      if (i === 0 && hideIndex) {
+        th.classList.add("paginated-table-hidden-column");
+      }
+      th.addEventListener("click", () => this.toggleSort(i));
+      row.appendChild(th);
+    });
+    this.tableHead.replaceChildren(row);
+  }
+
+  toggleSort(column: number): void {
+    if (this.sortColumn === column) {
+      this.ascending = !this.ascending;
+    } else {
+      this.sortColumn = column;
+      this.ascending = true;
+    }
+    this.page = 0;
+    this.renderHeader();
+    this.requestPage();
+  }
+
+  /**
+   * Ask the kernel for the current page. Each request carries an id, so that responses to requests which have since
+   * been superseded (e.g. while typing into the search box) can be ignored.
+   */
+  requestPage(): void {
+    this.requestId += 1;
+    this.send({
+      method: "request_page",
+      data: {
+        page: this.page,
+        page_size: this.pageSize,
+        sort_column: this.sortColumn,
+        ascending: this.ascending,
+        search: this.search,
+        request_id: this.requestId,
+      },
+    });
+  }
+
+  interceptCustom(msg: Message): void {
+    switch (msg["method"]) {
+      case "page":
+        this.renderPage(msg["data"]);
+        break;
+      default:
+        console.log("unsupported method found", msg["method"]);
+    }
+  }
+
+  /**
+   * Render the rows of one page. Cell values are HTML-escaped by the kernel before they are sent.
+   */
+  renderPage(pageData: DynamicObject): void {
+    if (pageData["request_id"] !== this.requestId) {
+      return;
+    }
+    this.page = pageData["page"];
+    this.filteredRows = pageData["filtered_rows"];
+    const hideIndex: boolean = this.model.get("hide_index");
+    const rows: Array<Array<string>> = pageData["rows"];
+
+    const fragment = document.createDocumentFragment();
+    rows.forEach((row, rowIndex) => {
+      const tr = document.createElement("tr");
+      tr.classList.add(rowIndex % 2 === 0 ? "odd" : "even");
+      row.forEach((value, i) => {
+        const td = document.createElement("td");
+        td.innerHTML = value;
+        if (i === 0 && hideIndex) {
+          td.classList.add("paginated-table-hidden-column");
+        }
+        tr.appendChild(td);
+      });
+      fragment.appendChild(tr);
+    });
+    this.tableBody.replaceChildren(fragment);
+
+    const start: number = pageData["start"];
+    const total: number = pageData["total_rows"];
+    let info =
+      this.filteredRows === 0
+        ? "Showing 0 to 0 of 0 entries"
+        : `Showing ${start + 1} to ${start + rows.length} of ${this.filteredRows} entries`;
+    if (this.filteredRows !== total) {
+      info += ` (filtered from ${total} total entries)`;
+    }
+    this.infoSpan.textContent = info;
+    this.previousBtn.disabled = this.page === 0;
+    this.nextBtn.disabled = start + rows.length >= this.filteredRows;
+  }
+}
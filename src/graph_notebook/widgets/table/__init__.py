@@ -0,0 +1,6 @@
+"""
+Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: Apache-2.0
+"""
+
+from .table_widget import PaginatedTable  # noqa F401
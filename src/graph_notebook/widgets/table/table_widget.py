@@ -0,0 +1,153 @@
+"""
+Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: Apache-2.0
+"""
+from __future__ import annotations  # annotations such as pd.DataFrame must not import pandas
+
+import graph_notebook
+import numpy as np
+from traitlets import Unicode, Int, List, Bool
+from ipywidgets import DOMWidget, register
+
+from graph_notebook.lazy_import import lazy_import
+from graph_notebook.visualization.result_table import unescape_html_value
+
+pd = lazy_import('pandas')
+
+DEFAULT_PAGE_SIZE = 10
+
+
+@register
+class PaginatedTable(DOMWidget):
+    """
+    Widget that renders a results table one page at a time.
+
+    The rows stay in the kernel. The front-end asks for a page with a "request_page" custom message carrying the page
+    number, page size, sort column and search text, and the kernel answers with a "page" message containing only the
+    rows of that page, so the size of the notebook output no longer grows with the size of the results.
+
+    Cell values are expected to be HTML-escaped already, as they are in the tables built by
+    graph_notebook.visualization.result_table, since the front-end renders them as HTML.
+    """
+    _view_name = Unicode('PaginatedTableView').tag(sync=True)
+    _model_name = Unicode('PaginatedTableModel').tag(sync=True)
+    _view_module = Unicode('graph_notebook_widgets').tag(sync=True)
+    _model_module = Unicode('graph_notebook_widgets').tag(sync=True)
+    _view_module_version = Unicode(graph_notebook.__version__).tag(sync=True)
+    _model_module_version = Unicode(graph_notebook.__version__).tag(sync=True)
+
+    columns = List(Unicode()).tag(sync=True)
+    total_rows = Int(0).tag(sync=True)
+    page_size = Int(DEFAULT_PAGE_SIZE).tag(sync=True)
+    page_size_options = List().tag(sync=True)
+    page_size_labels = List().tag(sync=True)
+    hide_index = Bool(False).tag(sync=True)
+
+    def __init__(self, results_df: pd.DataFrame, page_size: int = DEFAULT_PAGE_SIZE, page_size_options: list = None,
+                 page_size_labels: list = None, hide_index: bool = False, **kwargs):
+        if page_size_options is None:
+            page_size_options = [page_size]
+        if page_size_labels is None:
+            page_size_labels = list(page_size_options)
+        super().__init__(columns=[str(column) for column in results_df.columns], total_rows=len(results_df),
+                         page_size=page_size, page_size_options=page_size_options,
+                         page_size_labels=[str(label) for label in page_size_labels], hide_index=hide_index,
+                         **kwargs)
+        self._columns = [[str(value) for value in results_df.iloc[:, i].tolist()]
+                         for i in range(results_df.shape[1])]
+        self._search_text = None
+        self._search_matches = None
+        self._sort_key = None
+        self._sort_order = None
+        self._sort_values_cache = {}
+        self._lowered_columns = None
+        self.on_msg(self._handle_custom_msg)
+
+    def append_rows(self, results_df: pd.DataFrame):
+        """
+        Adds rows with the same columns to the end of the table, such as each batch of streamed results as it arrives.
+        The front-end asks for its current page again once total_rows changes.
+        """
+        for column, i in zip(self._columns, range(results_df.shape[1])):
+            column.extend(str(value) for value in results_df.iloc[:, i].tolist())
+        self._search_text = None
+        self._search_matches = None
+        self._sort_key = None
+        self._sort_order = None
+        self._sort_values_cache = {}
+        self._lowered_columns = None
+        self.total_rows += len(results_df)
+
+    def _handle_custom_msg(self, widget, content, buffers):
+        if content.get('method') == 'request_page':
+            self.send({'method': 'page', 'data': self.get_page(**content.get('data', {}))})
+
+    def get_page(self, page: int = 0, page_size: int = None, sort_column: int = -1, ascending: bool = True,
+                 search: str = '', request_id: int = 0) -> dict:
+        """
+        Returns the rows shown on one page, after filtering by search text and sorting by one column.
+        A page_size of -1 returns every row.
+        """
+        if page_size is None:
+            page_size = self.page_size
+        order = self._row_order(sort_column, ascending, search)
+        filtered_rows = len(order)
+        if page_size < 0:
+            page = 0
+            start, end = 0, filtered_rows
+        else:
+            page_size = max(1, page_size)
+            last_page = max(0, (filtered_rows - 1) // page_size)
+            page = min(max(0, page), last_page)
+            start = page * page_size
+            end = min(start + page_size, filtered_rows)
+        row_indexes = order[start:end].tolist()
+        rows = [[column[i] for column in self._columns] for i in row_indexes]
+        return {
+            'request_id': request_id,
+            'page': page,
+            'start': start,
+            'rows': rows,
+            'filtered_rows': filtered_rows,
+            'total_rows': self.total_rows
+        }
+
+    def _row_order(self, sort_column: int, ascending: bool, search: str):
+        matches = self._search(search)
+        if sort_column is None or not 0 <= sort_column < len(self._columns):
+            return matches
+        sort_key = (sort_column, ascending, search)
+        if self._sort_key != sort_key:
+            sort_values = self._sort_values(sort_column)[matches]
+            order = matches[np.argsort(sort_values, kind='stable')]
+            self._sort_order = order if ascending else order[::-1]
+            self._sort_key = sort_key
+        return self._sort_order
+
+    def _sort_values(self, column_index: int) -> np.ndarray:
+        if column_index not in self._sort_values_cache:
+            values = self._columns[column_index]
+            try:
+                # sort numerically when every value in the column is a number, e.g. for the # column
+                sort_values = np.asarray(values, dtype=float)
+            except ValueError:
+                sort_values = np.asarray(values, dtype=object)
+            self._sort_values_cache[column_index] = sort_values
+        return self._sort_values_cache[column_index]
+
+    def _search(self, search: str) -> np.ndarray:
+        search = (search or '').strip()
+        if not search:
+            return np.arange(self.total_rows)
+        if search != self._search_text:
+            needle = search.lower()
+            if self._lowered_columns is None:
+                # match against the text shown in the browser, not the HTML-escaped values
+                self._lowered_columns = [pd.Series([unescape_html_value(value) for value in column],
+                                                   dtype=object).str.lower() for column in self._columns]
+            matched = np.zeros(self.total_rows, dtype=bool)
+            for column in self._lowered_columns:
+                matched |= column.str.contains(needle, regex=False).to_numpy(dtype=bool)
+            self._search_matches = np.flatnonzero(matched)
+            self._search_text = search
+        return self._search_matches
@@ -0,0 +1,8 @@
+"""
+Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: Apache-2.0
+
+Standalone microbenchmarks. These are not collected by pytest; run them directly, e.g.
+
+    python -m test.benchmark.bench_request_signing
+"""
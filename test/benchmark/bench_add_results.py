@@ -0,0 +1,130 @@
+"""
+Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: Apache-2.0
+
+Measures the throughput, in path elements per second, of GremlinNetwork.add_results for path results of Vertex and
+Edge objects, of elementMaps, of valueMaps and of maps without ids, against the previous classification of each path
+element.
+"""
+
+import argparse
+import time
+
+from gremlin_python.process.traversal import T, Direction
+from gremlin_python.structure.graph import Path, Vertex, Edge
+
+from graph_notebook.network.gremlin.GremlinNetwork import GremlinNetwork, INVALID_PATH_ERROR
+
+
+def legacy_add_results(network, results, is_http=False):
+    if is_http:
+        gremlin_ids = ['id', '~id']
+        gremlin_label = 'label'
+    else:
+        gremlin_ids = [T.id]
+        gremlin_label = T.label
+
+    for path_index, path in enumerate(results):
+        if isinstance(path, Path):
+            if type(path[0]) is Edge or type(path[-1]) is Edge:
+                raise INVALID_PATH_ERROR
+
+            for i in range(len(path)):
+                if isinstance(path[i], dict):
+                    is_elementmap = False
+                    gremlin_id_in_path = False
+                    for possible_id in gremlin_ids:
+                        if possible_id in path[i]:
+                            gremlin_id_in_path = True
+                            break
+                    if gremlin_id_in_path and gremlin_label in path[i]:
+                        for prop, value in path[i].items():
+                            if isinstance(value, str) and prop not in gremlin_ids + [gremlin_label]:
+                                is_elementmap = True
+                                break
+                            elif isinstance(value, dict):
+                                if prop in [Direction.IN, Direction.OUT]:
+                                    is_elementmap = True
+                                    break
+                            elif isinstance(value, list):
+                                break
+                            elif not isinstance(value, (str, list, dict)):
+                                is_elementmap = True
+                                break
+                    if is_elementmap:
+                        network.insert_elementmap(path[i], check_emap=True, path_element=path, index=i)
+                    else:
+                        network.insert_path_element(path, i)
+                else:
+                    network.insert_path_element(path, i)
+        elif isinstance(path, dict):
+            network.insert_elementmap(path, index=path_index)
+
+
+def object_paths(count):
+    paths = []
+    for i in range(count):
+        out_v, in_v = Vertex(f'v{i}', 'airport'), Vertex(f'v{i + 1}', 'airport')
+        paths.append(Path([], [out_v, Edge(f'e{i}', out_v, 'route', in_v), in_v]))
+    return paths
+
+
+def elementmap_paths(count):
+    paths = []
+    for i in range(count):
+        out_v = {T.id: f'v{i}', T.label: 'airport', 'code': f'A{i}', 'runways': i % 5}
+        in_v = {T.id: f'v{i + 1}', T.label: 'airport', 'code': f'A{i + 1}', 'runways': i % 3}
+        route = {T.id: f'e{i}', T.label: 'route', Direction.OUT: {T.id: f'v{i}', T.label: 'airport'},
+                 Direction.IN: {T.id: f'v{i + 1}', T.label: 'airport'}, 'dist': i % 1000}
+        paths.append(Path([], [out_v, route, in_v]))
+    return paths
+
+
+def valuemap_paths(count):
+    paths = []
+    for i in range(count):
+        out_v = {T.id: f'v{i}', T.label: 'airport', 'code': [f'A{i}'], 'runways': [i % 5]}
+        in_v = {T.id: f'v{i + 1}', T.label: 'airport', 'code': [f'A{i + 1}'], 'runways': [i % 3]}
+        paths.append(Path([], [out_v, {T.id: f'e{i}', T.label: 'route', 'dist': i % 1000}, in_v]))
+    return paths
+
+
+def project_paths(count):
+    # project() and valueMap() without tokens return maps without ids, which are identified by a hash of their contents
+    paths = []
+    for i in range(count):
+        paths.append(Path([], [{'code': [f'A{i}'], 'runways': [i % 5]}, {'code': [f'A{i + 1}'], 'runways': [i % 3]}]))
+    return paths
+
+
+def best_of(repeat, fn, results):
+    timings = []
+    for _ in range(repeat):
+        network = GremlinNetwork()
+        start = time.perf_counter()
+        fn(network, results)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    shapes = [('path', object_paths), ('elementMap', elementmap_paths), ('valueMap', valuemap_paths),
+              ('project', project_paths)]
+    print(f'{"paths":>9}{"results":>12}{"legacy el/s":>14}{"current el/s":>14}{"speedup":>10}')
+    for size in args.sizes:
+        for name, build_results in shapes:
+            results = build_results(size)
+            elements = sum(len(path) for path in results)
+            legacy = best_of(args.repeat, legacy_add_results, results)
+            current = best_of(args.repeat, lambda network, res: network.add_results(res), results)
+            print(f'{size:>9}{name:>12}{elements / legacy:>14,.0f}{elements / current:>14,.0f}'
+                  f'{legacy / current:>9.2f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+"""
+Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: Apache-2.0
+
+Measures the serialization time and size of the network payload sent to the Force widget, as plain json and in the
+compact format with binary buffers, for networks built by GremlinNetwork from elementMap-style paths.
+"""
+
+import argparse
+import json
+import time
+
+from gremlin_python.process.traversal import T, Direction
+from gremlin_python.structure.graph import Path
+
+from graph_notebook.network.gremlin.GremlinNetwork import GremlinNetwork
+from graph_notebook.widgets.force.compact_network import graph_to_compact_json
+from graph_notebook.visualization.json_safe import convert_to_json_safe
+
+CITIES = ['Seattle', 'Austin', 'New York', 'Anchorage', 'Los Angeles']
+COUNTRIES = ['US', 'CA', 'MX']
+
+
+def airport(i: int) -> dict:
+    return {T.id: str(i), T.label: 'airport', 'code': f'A{i}', 'city': CITIES[i % len(CITIES)],
+            'country': COUNTRIES[i % len(COUNTRIES)], 'runways': i % 5}
+
+
+def build_network(node_count: int) -> GremlinNetwork:
+    paths = []
+    for i in range(node_count):
+        j = (i * 7 + 1) % node_count
+        route = {T.id: f'r{i}', T.label: 'route', Direction.OUT: {T.id: str(i), T.label: 'airport'},
+                 Direction.IN: {T.id: str(j), T.label: 'airport'}, 'dist': i % 1000}
+        paths.append(Path([], [airport(i), route, airport(j)]))
+    network = GremlinNetwork()
+    network.add_results(paths)
+    return network
+
+
+def json_payload_bytes(network) -> int:
+    return len(json.dumps(convert_to_json_safe(network.to_json()), separators=(',', ':')))
+
+
+def compact_payload_bytes(network) -> int:
+    compact = graph_to_compact_json(network.graph)
+    buffer_bytes = sum(value.nbytes for value in compact.values() if isinstance(value, memoryview))
+    state = {key: value for key, value in compact.items() if not isinstance(value, memoryview)}
+    return len(json.dumps(state, separators=(',', ':'))) + buffer_bytes
+
+
+def best_of(repeat, fn, *fn_args):
+    timings = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(*fn_args)
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 50000])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    print(f'{"nodes":>8}{"edges":>8}{"json s":>10}{"compact s":>11}{"json MB":>10}{"compact MB":>12}{"ratio":>8}')
+    for size in args.sizes:
+        network = build_network(size)
+        json_time, json_bytes = best_of(args.repeat, json_payload_bytes, network)
+        compact_time, compact_bytes = best_of(args.repeat, compact_payload_bytes, network)
+        print(f'{network.graph.number_of_nodes():>8}{network.graph.number_of_edges():>8}'
+              f'{json_time:>10.3f}{compact_time:>11.3f}{json_bytes / 1e6:>10.2f}{compact_bytes / 1e6:>12.2f}'
+              f'{json_bytes / compact_bytes:>7.1f}x')
+
+
+if __name__ == '__main__':
+    main()
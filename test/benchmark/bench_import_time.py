@@ -0,0 +1,69 @@
+"""
+Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: Apache-2.0
+
+Measures the time taken to import graph_notebook.magics, as %load_ext graph_notebook.magics does, using
+python -X importtime in a new process for every run. IPython and ipywidgets are imported first, as a notebook kernel
+has always loaded them already. Exits with an error if the median time is over the budget, so that this can be run as a
+check against dependencies being imported eagerly again.
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+IMPORT_STATEMENT = 'import IPython, ipywidgets; import graph_notebook.magics'
+DEFAULT_BUDGET_MS = 1000
+
+
+def measure_import() -> dict:
+    """
+    Returns the cumulative import time in milliseconds of every module imported with the magics, by module name.
+    """
+    completed = subprocess.run([sys.executable, '-X', 'importtime', '-c', IMPORT_STATEMENT],
+                               capture_output=True, text=True, check=True)
+    module_times = {}
+    for line in completed.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        module_times[name.strip()] = int(cumulative) / 1000
+    return module_times
+
+
+def measure_baseline_modules() -> set:
+    completed = subprocess.run([sys.executable, '-c', 'import sys, IPython, ipywidgets; print(*sys.modules)'],
+                               capture_output=True, text=True, check=True)
+    return set(completed.stdout.split())
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--top', type=int, default=15, help='number of the slowest dependencies to list')
+    parser.add_argument('--budget-ms', type=float, default=DEFAULT_BUDGET_MS)
+    args = parser.parse_args()
+
+    runs = [measure_import() for _ in range(args.runs)]
+    totals = [run['graph_notebook.magics'] for run in runs]
+    median_total = statistics.median(totals)
+
+    # the slowest top level dependencies of the last run, which are not part of graph_notebook
+    last_run = runs[-1]
+    baseline = measure_baseline_modules()
+    dependencies = sorted(((time_ms, name) for name, time_ms in last_run.items()
+                           if '.' not in name and name not in baseline and name != 'graph_notebook'), reverse=True)
+    print(f'{"module":<30}{"ms":>10}')
+    for time_ms, name in dependencies[:args.top]:
+        print(f'{name:<30}{time_ms:>10.1f}')
+    print(f'\nimport graph_notebook.magics: median {median_total:.1f} ms over {args.runs} runs '
+          f'(min {min(totals):.1f}, max {max(totals):.1f}), budget {args.budget_ms:.0f} ms')
+
+    if median_total > args.budget_ms:
+        sys.exit(f'import time of {median_total:.1f} ms is over the budget of {args.budget_ms:.0f} ms')
+
+
+if __name__ == '__main__':
+    main()
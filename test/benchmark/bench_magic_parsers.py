@@ -0,0 +1,47 @@
+"""
+Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: Apache-2.0
+
+Measures the per-cell overhead of parsing the arguments of the magics, for a trivial query such as %%gremlin with
+g.V().limit(1) run in a loop, with the argument parser built on every cell as before, against the parser cached on the
+Graph instance.
+"""
+
+import argparse
+import timeit
+from types import SimpleNamespace
+
+from graph_notebook.magics.graph_magic import Graph
+
+# magic name, parser method, arguments of the parser method, cell line
+MAGIC_LINES = [
+    ('%%gremlin', Graph._gremlin_parser, (), '--silent'),
+    ('%%sparql', Graph._sparql_parser, (), '--silent'),
+    ('%%oc', Graph._opencypher_query_parser, (), '--silent'),
+    ('%load', Graph._load_parser, (('csv', 'opencypher'), 'arn:aws:iam::123456789012:role/loader', 'us-east-1'),
+     '--run'),
+    ('%seed', Graph._seed_parser, (), '--model property_graph --dataset airports --run'),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--iterations', type=int, default=2000)
+    args = parser.parse_args()
+
+    # the parser methods only use the cache of the Graph instance
+    graph = SimpleNamespace(_parsers={})
+
+    print(f'{"magic":<12}{"built us/cell":>16}{"cached us/cell":>16}{"speedup":>10}')
+    for magic, get_parser, parser_args, line in MAGIC_LINES:
+        build_parser = get_parser.__wrapped__
+        built = timeit.timeit(lambda: build_parser(graph, *parser_args).parse_args(line.split()),
+                              number=args.iterations)
+        cached = timeit.timeit(lambda: get_parser(graph, *parser_args).parse_args(line.split()),
+                               number=args.iterations)
+        print(f'{magic:<12}{built / args.iterations * 1e6:>16.1f}{cached / args.iterations * 1e6:>16.1f}'
+              f'{built / cached:>9.1f}x')
+
+
+if __name__ == '__main__':
+    main()
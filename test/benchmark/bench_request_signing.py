@@ -0,0 +1,54 @@
+"""
+Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: Apache-2.0
+
+Measures the per-request overhead of preparing and SigV4-signing an HTTP request in Client._prepare_request, against
+the previous path that signed a separate AWSRequest and then prepared a second requests.Request.
+"""
+
+import argparse
+import timeit
+
+import requests
+from botocore.auth import SigV4Auth
+from botocore.awsrequest import AWSRequest
+from botocore.session import Session
+
+from graph_notebook.neptune.client import ClientBuilder
+
+HOST = 'my-cluster.cluster-abc123.us-east-1.neptune.amazonaws.com'
+URL = f'https://{HOST}:8182/openCypher'
+DATA = {'query': 'MATCH (n) RETURN n LIMIT 1'}
+
+
+def legacy_prepare_request(session, method, url, data, region, service):
+    request = requests.Request(method=method, url=url, data=data)
+    aws_request = AWSRequest(method=method, url=url, data=data)
+    frozen_creds = session.get_credentials().get_frozen_credentials()
+    SigV4Auth(frozen_creds, service, region).add_auth(aws_request)
+    request.headers = dict(aws_request.prepare().headers)
+    return request.prepare()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--iterations', type=int, default=10000)
+    args = parser.parse_args()
+
+    session = Session()
+    session.set_credentials('AKIDEXAMPLE', 'wJalrXUtnFEMI/K7MDENG+bPxRfiCYEXAMPLEKEY', 'session-token')
+    client = ClientBuilder().with_host(HOST).with_region('us-east-1').with_iam(session).build()
+
+    legacy = timeit.timeit(lambda: legacy_prepare_request(session, 'POST', URL, DATA, 'us-east-1', 'neptune-db'),
+                           number=args.iterations)
+    current = timeit.timeit(lambda: client._prepare_request('POST', URL, data=DATA), number=args.iterations)
+    client.close()
+
+    print(f'{"path":<12}{"us/request":>12}')
+    print(f'{"legacy":<12}{legacy / args.iterations * 1e6:>12.1f}')
+    print(f'{"current":<12}{current / args.iterations * 1e6:>12.1f}')
+    print(f'speedup: {legacy / current:.2f}x')
+
+
+if __name__ == '__main__':
+    main()
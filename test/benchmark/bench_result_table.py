@@ -0,0 +1,87 @@
+"""
+Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: Apache-2.0
+
+Measures the time to build the %%gremlin and %%oc results tables with the columnar builder, against the previous
+path that built, discarded and rebuilt DataFrames and HTML-escaped every cell through DataFrame.map.
+"""
+
+import argparse
+import time
+
+import pandas as pd
+
+from graph_notebook.visualization.result_table import DT_HTML_CHAR_MAP, build_gremlin_results_df, build_results_df
+
+
+def legacy_encode_html_chars(result):
+    fixed_result = str(result)
+    for k, v in iter(DT_HTML_CHAR_MAP.items()):
+        fixed_result = fixed_result.replace(k, v)
+    return fixed_result
+
+
+def legacy_gremlin_results_df(query_res):
+    results_df = pd.DataFrame(query_res).convert_dtypes()
+    if not results_df.index.empty:
+        query_res_reformat = [[legacy_encode_html_chars(result)] for result in query_res]
+        query_res_reformat.append([{'__DUMMY_KEY__': ['DUMMY_VALUE']}])
+        results_df = pd.DataFrame(query_res_reformat)
+        results_df.drop(results_df.index[-1], inplace=True)
+    results_df.insert(0, "#", range(1, len(results_df) + 1))
+    results_df.rename({results_df.columns[1]: 'Result'}, axis='columns', inplace=True)
+    results_df.set_index('#', inplace=True)
+    results_df.columns.name = results_df.index.name
+    results_df.index.name = None
+    return results_df
+
+
+def legacy_results_df(rows, columns):
+    results_df = pd.DataFrame(rows).convert_dtypes()
+    results_df = results_df.astype(str)
+    results_df = results_df.map(lambda x: legacy_encode_html_chars(x))
+    results_df.insert(0, "#", range(1, len(results_df) + 1))
+    for col_index, col_name in enumerate(columns):
+        results_df.rename({results_df.columns[col_index + 1]: col_name}, axis='columns', inplace=True)
+    return results_df
+
+
+def gremlin_results(count):
+    return [{'code': f'A{i}', 'desc': f'Airport <{i}> & "terminal"', 'runways': i % 5} for i in range(count)]
+
+
+def opencypher_rows(count):
+    return [[f'A{i}', f"Airport '{i}'", i % 5, float(i), None if i % 7 else 'x'] for i in range(count)]
+
+
+def best_of(repeat, fn, *fn_args):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(*fn_args)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 100000, 1000000])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    columns = ['code', 'desc', 'runways', 'dist', 'tag']
+    print(f'{"rows":>10}{"table":>10}{"legacy s":>12}{"current s":>12}{"speedup":>10}')
+    for size in args.sizes:
+        query_res = gremlin_results(size)
+        legacy = best_of(args.repeat, legacy_gremlin_results_df, query_res)
+        current = best_of(args.repeat, build_gremlin_results_df, query_res)
+        print(f'{size:>10}{"gremlin":>10}{legacy:>12.3f}{current:>12.3f}{legacy / current:>9.1f}x')
+
+        rows = opencypher_rows(size)
+        legacy = best_of(args.repeat, legacy_results_df, rows, columns)
+        current = best_of(args.repeat, build_results_df, rows, columns)
+        print(f'{size:>10}{"oc":>10}{legacy:>12.3f}{current:>12.3f}{legacy / current:>9.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+"""
+Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: Apache-2.0
+
+Measures the time to count the lines of the bundled %seed sample data sets for the progress bar and to read their
+first line, and the peak memory allocated while iterating over all of their lines, for SeedFile against the previous
+approach of reading each file into a string and splitting it into a list of lines.
+"""
+
+import argparse
+import time
+import tracemalloc
+
+from graph_notebook.seed.load_query import get_data_sets, get_queries
+
+
+def sample_seed_files():
+    return [query for language in ['gremlin', 'opencypher', 'sparql'] for data_set in get_data_sets(language)
+            for query in get_queries(language, data_set, 'samples')]
+
+
+def legacy_seed(seed_files):
+    # the whole content of every file was read before seeding started
+    contents = [seed_file.read() for seed_file in seed_files]
+    total_lines = sum(len(content.splitlines()) for content in contents)
+    first_line = time.perf_counter()
+    for content in contents:
+        for _ in content.splitlines():
+            pass
+    return total_lines, first_line
+
+
+def lazy_seed(seed_files):
+    total_lines = sum(seed_file.line_count for seed_file in seed_files)
+    first_line = time.perf_counter()
+    for seed_file in seed_files:
+        for _ in seed_file:
+            pass
+    return total_lines, first_line
+
+
+def measure(seed, seed_files, trace_memory=False):
+    for seed_file in seed_files:
+        seed_file._line_count = None
+    if trace_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    total_lines, first_line = seed(seed_files)
+    end = time.perf_counter()
+    peak = 0
+    if trace_memory:
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return total_lines, first_line - start, end - start, peak
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--runs', type=int, default=3)
+    args = parser.parse_args()
+
+    seed_files = sample_seed_files()
+    print(f'{len(seed_files)} sample seed files')
+    print(f'{"approach":<10}{"lines":>10}{"first line ms":>16}{"total ms":>12}{"peak MB":>10}')
+    for name, seed in [('legacy', legacy_seed), ('lazy', lazy_seed)]:
+        runs = [measure(seed, seed_files) for _ in range(args.runs)]
+        total_lines, first_line, total, _ = min(runs, key=lambda run: run[2])
+        # memory is traced in a separate run, as tracing slows down the allocations being timed
+        peak = measure(seed, seed_files, trace_memory=True)[3]
+        print(f'{name:<10}{total_lines:>10}{first_line * 1000:>16.1f}{total * 1000:>12.1f}{peak / 2 ** 20:>10.1f}')
+
+
+if __name__ == '__main__':
+    main()
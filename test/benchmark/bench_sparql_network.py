@@ -0,0 +1,59 @@
+"""
+Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: Apache-2.0
+
+Measures the time SPARQLNetwork.add_results takes on an spo result, with and without the cache of URI parts.
+Subjects and predicates repeat across the triples, as they do in the results of CONSTRUCT and SELECT ?s ?p ?o queries.
+"""
+
+import argparse
+import time
+
+from graph_notebook.network.sparql.SPARQLNetwork import SPARQLNetwork
+
+NAMESPACE = 'http://kelvinlawrence.net/air-routes/'
+
+
+def spo_results(triple_count: int) -> dict:
+    predicates = [f'{NAMESPACE}objectProperty/{name}' for name in ['route', 'contains', 'near']] + \
+                 [f'{NAMESPACE}datatypeProperty/{name}' for name in ['code', 'city', 'runways', 'elev', 'desc']]
+    subject_count = max(1, triple_count // 10)
+    bindings = []
+    for i in range(triple_count):
+        predicate = predicates[i % len(predicates)]
+        if 'objectProperty' in predicate:
+            obj = {'type': 'uri', 'value': f'{NAMESPACE}resource/{(i * 7) % subject_count}'}
+        else:
+            obj = {'type': 'literal', 'value': f'value {i}'}
+        bindings.append({
+            's': {'type': 'uri', 'value': f'{NAMESPACE}resource/{i % subject_count}'},
+            'p': {'type': 'uri', 'value': predicate},
+            'o': obj
+        })
+    return {'head': {'vars': ['s', 'p', 'o']}, 'results': {'bindings': bindings}}
+
+
+def measure(triple_count: int, cached: bool) -> float:
+    results = spo_results(triple_count)
+    network = SPARQLNetwork()
+    if not cached:
+        network.uri_parts = network._extract_uri_parts
+    start = time.perf_counter()
+    network.add_results(results)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 100000, 1000000])
+    args = parser.parse_args()
+
+    print(f'{"triples":>10}{"uncached s":>12}{"cached s":>10}{"speedup":>10}')
+    for size in args.sizes:
+        uncached = measure(size, cached=False)
+        cached = measure(size, cached=True)
+        print(f'{size:>10}{uncached:>12.2f}{cached:>10.2f}{uncached / cached:>9.2f}x')
+
+
+if __name__ == '__main__':
+    main()
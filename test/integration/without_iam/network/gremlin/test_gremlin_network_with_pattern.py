@@ -3,7 +3,7 @@ Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 SPDX-License-Identifier: Apache-2.0
 """
 
-from graph_notebook.network.gremlin.GremlinNetwork import GremlinNetwork, PathPattern
+from graph_notebook.network.gremlin.GremlinNetwork import GremlinNetwork, PathPattern, generate_id_from_dict
 
 from test.integration import DataDrivenGremlinTest
 
@@ -58,5 +58,5 @@ class TestGremlinNetwork(DataDrivenGremlinTest):
         gn = GremlinNetwork()
         pattern = [PathPattern.V, PathPattern.OUT_V]
         gn.add_results_with_pattern(results, pattern)
-        node = gn.graph.nodes.get('graph_notebook-2f363b2fa995d0567e638a240efd0a26')
+        node = gn.graph.nodes.get(generate_id_from_dict(results[0][0]))
         self.assertEqual(["Jamaica"], node['properties']['desc'])
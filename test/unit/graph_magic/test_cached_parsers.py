@@ -0,0 +1,40 @@
+"""
+Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: Apache-2.0
+"""
+
+from test.unit.graph_magic.GraphNotebookTest import GraphNotebookTest
+
+
+class TestCachedParsers(GraphNotebookTest):
+    def setUp(self) -> None:
+        self.graph = self.ip.magics_manager.registry['Graph']
+        self.graph._parsers.clear()
+
+    def test_parser_is_built_once(self):
+        self.ip.run_line_magic('graph_notebook_config', '--silent')
+        parser = self.graph._graph_notebook_config_parser()
+        self.ip.run_line_magic('graph_notebook_config', '--silent')
+        self.assertIs(parser, self.graph._graph_notebook_config_parser())
+        self.assertEqual(1, len(self.graph._parsers))
+
+    def test_parsers_are_cached_by_arguments(self):
+        east = self.graph._load_parser(('csv',), 'arn:loader', 'us-east-1')
+        west = self.graph._load_parser(('csv',), 'arn:loader', 'us-west-2')
+        self.assertIsNot(east, west)
+        self.assertIs(east, self.graph._load_parser(('csv',), 'arn:loader', 'us-east-1'))
+        self.assertEqual('us-east-1', east.parse_args([]).region)
+        self.assertEqual('us-west-2', west.parse_args([]).region)
+
+    def test_cached_parser_defaults_are_not_shared(self):
+        parser = self.graph._load_parser(('csv',), 'arn:loader', 'us-east-1')
+        self.assertEqual(['a'], parser.parse_args(['-d', 'a']).dependencies)
+        self.assertEqual([], parser.parse_args([]).dependencies)
+
+    def test_query_parsers(self):
+        gremlin_args = self.graph._gremlin_parser().parse_args(['profile', '--max-results', '5'])
+        self.assertEqual(('profile', 5), (gremlin_args.query_mode, gremlin_args.max_results))
+        sparql_args = self.graph._sparql_parser().parse_args(['--limit-rows', '10'])
+        self.assertEqual(10, sparql_args.limit_rows)
+        oc_args = self.graph._opencypher_query_parser().parse_args(['explain', '--silent'])
+        self.assertEqual(('explain', True), (oc_args.mode, oc_args.silent))
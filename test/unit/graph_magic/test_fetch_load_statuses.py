@@ -0,0 +1,57 @@
+"""
+Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import time
+import unittest
+from unittest.mock import MagicMock
+
+from graph_notebook.magics.graph_magic import fetch_load_statuses
+
+
+def load_status_payload(load_id):
+    return {'payload': {'overallStatus': {'status': 'LOAD_COMPLETED', 'fullUri': f's3://bucket/{load_id}'}}}
+
+
+class FakeLoaderClient(object):
+    def __init__(self):
+        self.calls = []
+
+    def load_status(self, load_id):
+        self.calls.append(load_id)
+        res = MagicMock()
+        res.json.return_value = load_status_payload(load_id)
+        return res
+
+
+class TestFetchLoadStatuses(unittest.TestCase):
+    def test_fetches_every_load_id(self):
+        client = FakeLoaderClient()
+        ids = [f'load-{i}' for i in range(20)]
+        results = list(fetch_load_statuses(client, ids, max_workers=4))
+        self.assertEqual(sorted(ids), sorted(client.calls))
+        for index, load_id, status in results:
+            self.assertEqual(ids[index], load_id)
+            self.assertEqual(load_status_payload(load_id), status)
+
+    def test_cache_serves_repeated_calls(self):
+        client = FakeLoaderClient()
+        cache = {}
+        ids = ['load-1', 'load-2']
+        list(fetch_load_statuses(client, ids, cache=cache))
+        list(fetch_load_statuses(client, ids, cache=cache))
+        self.assertEqual(2, len(client.calls))
+
+    def test_expired_cache_entries_are_refetched(self):
+        client = FakeLoaderClient()
+        cache = {'load-1': (time.monotonic() - 60, load_status_payload('stale'))}
+        results = list(fetch_load_statuses(client, ['load-1'], cache=cache, cache_ttl=30))
+        self.assertEqual(['load-1'], client.calls)
+        self.assertEqual(load_status_payload('load-1'), results[0][2])
+
+    def test_http_errors_are_raised(self):
+        client = MagicMock()
+        client.load_status.return_value.raise_for_status.side_effect = RuntimeError('500')
+        with self.assertRaises(RuntimeError):
+            list(fetch_load_statuses(client, ['load-1']))
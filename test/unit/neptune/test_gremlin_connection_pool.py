@@ -0,0 +1,71 @@
+"""
+Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from gremlin_python.driver.protocol import GremlinServerError
+
+from graph_notebook.neptune.client import ClientBuilder
+
+
+def new_driver_client(*args, **kwargs):
+    driver_client = MagicMock()
+    driver_client.is_closed.return_value = False
+    return driver_client
+
+
+class TestGremlinConnectionPool(unittest.TestCase):
+    def setUp(self):
+        patcher = patch('graph_notebook.neptune.client.client.Client', side_effect=new_driver_client)
+        self.driver_client_cls = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.client = ClientBuilder().with_host('localhost').with_port(8182).with_tls(False).build()
+        self.addCleanup(self.client.close)
+
+    def test_connection_reused_across_queries(self):
+        self.client.gremlin_query('g.V().limit(1)')
+        self.client.gremlin_query('g.E().limit(1)')
+        self.assertEqual(1, self.driver_client_cls.call_count)
+
+    def test_connections_keyed_by_max_content_length(self):
+        self.client.gremlin_query('g.V()', transport_args={'max_content_length': 1024})
+        self.client.gremlin_query('g.V()', transport_args={'max_content_length': 2048})
+        self.client.gremlin_query('g.V()', transport_args={'max_content_length': 1024})
+        self.assertEqual(2, self.driver_client_cls.call_count)
+
+    def test_closed_connection_is_recycled(self):
+        with self.client.pooled_gremlin_connection() as first:
+            pass
+        first.is_closed.return_value = True
+        with self.client.pooled_gremlin_connection() as second:
+            pass
+        self.assertIsNot(first, second)
+        first.close.assert_called_once()
+
+    def test_transport_error_drops_connection(self):
+        with self.assertRaises(ConnectionResetError):
+            with self.client.pooled_gremlin_connection() as first:
+                raise ConnectionResetError()
+        first.close.assert_called_once()
+        with self.client.pooled_gremlin_connection() as second:
+            pass
+        self.assertIsNot(first, second)
+
+    def test_server_error_keeps_connection(self):
+        with self.assertRaises(GremlinServerError):
+            with self.client.pooled_gremlin_connection() as first:
+                raise GremlinServerError({'code': 597, 'message': 'bad query', 'attributes': {}})
+        with self.client.pooled_gremlin_connection() as second:
+            pass
+        self.assertIs(first, second)
+        first.close.assert_not_called()
+
+    def test_close_tears_down_pool(self):
+        with self.client.pooled_gremlin_connection() as conn:
+            pass
+        self.client.close()
+        conn.close.assert_called_once()
+        self.assertEqual({}, self.client._gremlin_connections)
@@ -0,0 +1,67 @@
+"""
+Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import unittest
+from concurrent.futures import Future
+from unittest.mock import MagicMock, patch
+
+from graph_notebook.neptune.client import ClientBuilder
+
+
+class FakeResultSet(object):
+    def __init__(self, batches):
+        self.batches = batches
+        self.request_id = 'c1a4e7f2-0000-0000-0000-000000000000'
+        self.done = Future()
+        self.read = 0
+
+    def __iter__(self):
+        for batch in self.batches:
+            self.read += 1
+            yield batch
+        self.done.set_result(None)
+
+
+class TestGremlinQueryStream(unittest.TestCase):
+    def setUp(self):
+        self.driver_client = MagicMock()
+        self.driver_client.is_closed.return_value = False
+        patcher = patch('graph_notebook.neptune.client.client.Client', return_value=self.driver_client)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def build_client(self, host='localhost'):
+        neptune_client = ClientBuilder().with_host(host).with_port(8182).with_tls(False).build()
+        self.addCleanup(neptune_client.close)
+        return neptune_client
+
+    def test_yields_server_batches(self):
+        result_set = FakeResultSet([[1, 2], [3, 4], [5]])
+        self.driver_client.submit.return_value = result_set
+        batches = list(self.build_client().gremlin_query_stream('g.V()'))
+        self.assertEqual([[1, 2], [3, 4], [5]], batches)
+
+    def test_max_results_stops_reading(self):
+        result_set = FakeResultSet([[1, 2], [3, 4], [5]])
+        self.driver_client.submit.return_value = result_set
+        neptune_client = self.build_client()
+        with patch.object(neptune_client, 'gremlin_cancel') as gremlin_cancel:
+            batches = list(neptune_client.gremlin_query_stream('g.V()', max_results=3))
+        self.assertEqual([[1, 2], [3]], batches)
+        self.assertEqual(2, result_set.read)
+        gremlin_cancel.assert_not_called()
+
+    def test_max_results_cancels_neptune_traversal(self):
+        result_set = FakeResultSet([[1, 2], [3, 4], [5]])
+        self.driver_client.submit.return_value = result_set
+        neptune_client = self.build_client('db.cluster-abc.us-east-1.neptune.amazonaws.com')
+        with patch.object(neptune_client, 'gremlin_cancel') as gremlin_cancel:
+            list(neptune_client.gremlin_query_stream('g.V()', max_results=2))
+        gremlin_cancel.assert_called_once_with(result_set.request_id)
+
+    def test_batch_size_is_sent_as_request_option(self):
+        self.driver_client.submit.return_value = FakeResultSet([])
+        list(self.build_client().gremlin_query_stream('g.V()', batch_size=16))
+        self.driver_client.submit.assert_called_once_with('g.V()', None, {'batchSize': 16})
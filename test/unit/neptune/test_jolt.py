@@ -0,0 +1,76 @@
+"""
+Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import json
+import unittest
+
+from graph_notebook.neptune.jolt import JoltResultsReader, decode_jolt_value, read_jolt_results
+from graph_notebook.network.opencypher.OCNetwork import OCNetwork
+
+ALICE = {'()': [1, ['Person'], {'name': 'Alice Smith', 'age': {'Z': '42'}}]}
+BOB = {'()': [2, ['Person'], {'name': 'Bob Jones'}]}
+KNOWS = {'->': [7, 1, 'KNOWS', 2, {'since': {'Z': '2019'}}]}
+
+
+def jolt_stream(events: list, chunk_size: int):
+    data = b''.join(b'\x1e' + json.dumps(event, ensure_ascii=False).encode('utf-8') + b'\n' for event in events)
+    for i in range(0, len(data), chunk_size):
+        yield data[i:i + chunk_size]
+
+
+class TestJolt(unittest.TestCase):
+    def test_decode_scalars(self):
+        self.assertEqual(42, decode_jolt_value({'Z': '42'}))
+        self.assertEqual(42, decode_jolt_value(42))
+        self.assertEqual(1.5, decode_jolt_value({'R': '1.5'}))
+        self.assertEqual('a b c', decode_jolt_value({'U': 'a b c'}))
+        self.assertEqual('a b c', decode_jolt_value('a b c'))
+        self.assertIs(True, decode_jolt_value({'?': 'true'}))
+        self.assertIs(False, decode_jolt_value(False))
+        self.assertEqual(b'\x0a\xff', decode_jolt_value({'#': '0AFF'}))
+        self.assertEqual('2026-10-18', decode_jolt_value({'T': '2026-10-18'}))
+        self.assertEqual('SRID=4326;POINT(1 2)', decode_jolt_value({'@': 'SRID=4326;POINT(1 2)'}))
+        self.assertIsNone(decode_jolt_value(None))
+
+    def test_decode_collections(self):
+        self.assertEqual([1, 'x', [2.0]], decode_jolt_value({'[]': [{'Z': '1'}, {'U': 'x'}, {'[]': [{'R': '2'}]}]}))
+        self.assertEqual({'a': 1, 'b': {'c': True}},
+                         decode_jolt_value({'{}': {'a': {'Z': '1'}, 'b': {'{}': {'c': {'?': 'true'}}}}}))
+
+    def test_decode_entities(self):
+        self.assertEqual({'~id': 1, '~entityType': 'node', '~labels': ['Person'],
+                          '~properties': {'name': 'Alice Smith', 'age': 42}}, decode_jolt_value(ALICE))
+        self.assertEqual({'~id': 7, '~entityType': 'relationship', '~start': 1, '~end': 2, '~type': 'KNOWS',
+                          '~properties': {'since': 2019}}, decode_jolt_value(KNOWS))
+        reversed_rel = decode_jolt_value({'<-': [7, 2, 'KNOWS', 1, {}]})
+        self.assertEqual((1, 2), (reversed_rel['~start'], reversed_rel['~end']))
+        path = decode_jolt_value({'..': [ALICE, KNOWS, BOB]})
+        self.assertEqual(['node', 'relationship', 'node'], [element['~entityType'] for element in path])
+
+    def test_reads_records_across_chunks(self):
+        events = [{'header': {'fields': ['n', 'name']}}] + \
+                 [{'data': [ALICE, {'U': f'Zürich «{i}» 空港'}]} for i in range(10)] + \
+                 [{'summary': {}}, {'info': {}}]
+        for chunk_size in [1, 3, 16, 1 << 20]:
+            reader = JoltResultsReader(jolt_stream(events, chunk_size))
+            records = list(reader.iter_records())
+            self.assertEqual(10, len(records))
+            self.assertEqual(['n', 'name'], reader.fields)
+            self.assertEqual('Alice Smith', records[0]['n']['~properties']['name'])
+            self.assertEqual('Zürich «9» 空港', records[9]['name'])
+
+    def test_error_event(self):
+        events = [{'error': {'errors': [{'code': 'Neo.ClientError.Statement.SyntaxError', 'message': 'Invalid'}]}}]
+        with self.assertRaises(ValueError) as context:
+            read_jolt_results(jolt_stream(events, 8))
+        self.assertIn('Neo.ClientError.Statement.SyntaxError', str(context.exception))
+
+    def test_results_are_drawn_by_ocnetwork(self):
+        events = [{'header': {'fields': ['p']}}, {'data': [{'..': [ALICE, KNOWS, BOB]}]}, {'summary': {}}]
+        results = read_jolt_results(jolt_stream(events, 16))
+        network = OCNetwork()
+        network.add_results(results)
+        self.assertEqual(2, len(network.graph.nodes))
+        self.assertEqual(1, len(network.graph.edges))
@@ -0,0 +1,52 @@
+"""
+Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from botocore.session import Session
+
+from graph_notebook.neptune.client import ClientBuilder
+
+NEPTUNE_HOST = 'my-cluster.cluster-abc123.us-east-1.neptune.amazonaws.com'
+
+
+class TestOpenCypherDriverCache(unittest.TestCase):
+    def setUp(self):
+        patcher = patch('graph_notebook.neptune.client.neo4j.GraphDatabase.driver',
+                        side_effect=lambda *a, **k: MagicMock())
+        self.driver_factory = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def build_iam_client(self):
+        session = Session()
+        session.set_credentials('AKIDEXAMPLE', 'secret')
+        client = ClientBuilder().with_host(NEPTUNE_HOST).with_region('us-east-1').with_iam(session).build()
+        status_res = MagicMock()
+        status_res.json.return_value = {'dbEngineVersion': '1.2.1.0.R2'}
+        client.status = MagicMock(return_value=status_res)
+        return client
+
+    def test_driver_reused_across_bolt_queries(self):
+        client = ClientBuilder().with_host('localhost').with_tls(False).build()
+        client.opencyper_bolt('RETURN 1')
+        client.opencyper_bolt('RETURN 2')
+        self.assertEqual(1, self.driver_factory.call_count)
+
+    def test_close_tears_down_driver(self):
+        client = ClientBuilder().with_host('localhost').with_tls(False).build()
+        client.opencyper_bolt('RETURN 1')
+        driver = client._opencypher_driver
+        client.close()
+        driver.close.assert_called_once()
+        self.assertIsNone(client._opencypher_driver)
+
+    def test_engine_version_probed_once(self):
+        client = self.build_iam_client()
+        client.get_opencypher_driver()
+        client.get_opencypher_driver()
+        client.status.assert_called_once()
+        url = self.driver_factory.call_args[0][0]
+        self.assertEqual(f'bolt://{NEPTUNE_HOST}:8182/opencypher', url)
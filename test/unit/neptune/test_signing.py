@@ -0,0 +1,66 @@
+"""
+Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import datetime
+import unittest
+from unittest.mock import MagicMock
+
+import requests
+from botocore.auth import SigV4Auth
+from botocore.awsrequest import AWSRequest
+from botocore.credentials import Credentials
+
+from graph_notebook.neptune.signing import CachingSigV4Auth, RefreshingCredentialProvider, sign_prepared_request
+
+CREDENTIALS = Credentials('AKIDEXAMPLE', 'wJalrXUtnFEMI/K7MDENG+bPxRfiCYEXAMPLEKEY', 'token')
+
+
+class TestCachingSigV4Auth(unittest.TestCase):
+    def test_signature_matches_botocore(self):
+        request = AWSRequest(method='GET', url='https://localhost:8182/status')
+        request.context['timestamp'] = '20260101T000000Z'
+        expected = SigV4Auth(CREDENTIALS, 'neptune-db', 'us-east-1').signature('string-to-sign', request)
+        cached_auth = CachingSigV4Auth(CREDENTIALS, 'neptune-db', 'us-east-1')
+        self.assertEqual(expected, cached_auth.signature('string-to-sign', request))
+        self.assertEqual(expected, cached_auth.signature('string-to-sign', request))
+
+    def test_sign_prepared_request(self):
+        prepared = requests.Request(method='POST', url='https://localhost:8182/openCypher',
+                                    data={'query': 'RETURN 1'}).prepare()
+        sign_prepared_request(prepared, CREDENTIALS.get_frozen_credentials(), 'neptune-db', 'us-east-1')
+        self.assertTrue(prepared.headers['Authorization'].startswith('AWS4-HMAC-SHA256 Credential=AKIDEXAMPLE/'))
+        self.assertIn('X-Amz-Date', prepared.headers)
+        self.assertEqual('token', prepared.headers['X-Amz-Security-Token'])
+        self.assertEqual('query=RETURN+1', prepared.body)
+
+
+class TestRefreshingCredentialProvider(unittest.TestCase):
+    def test_static_credentials_fetched_once(self):
+        session = MagicMock()
+        session.get_credentials.return_value = CREDENTIALS
+        provider = RefreshingCredentialProvider(session)
+        provider.get_frozen_credentials()
+        provider.get_frozen_credentials()
+        session.get_credentials.assert_called_once()
+        self.assertIsNone(provider._timer)
+
+    def test_expiring_credentials_schedule_background_refresh(self):
+        credentials = MagicMock()
+        credentials._expiry_time = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(hours=1)
+        session = MagicMock()
+        session.get_credentials.return_value = credentials
+        provider = RefreshingCredentialProvider(session)
+        self.addCleanup(provider.close)
+        provider.get_frozen_credentials()
+        provider.get_frozen_credentials()
+        credentials.get_frozen_credentials.assert_called_once()
+        self.assertIsNotNone(provider._timer)
+
+    def test_missing_credentials_raise_attribute_error(self):
+        session = MagicMock()
+        session.get_credentials.return_value = None
+        provider = RefreshingCredentialProvider(session)
+        with self.assertRaises(AttributeError):
+            provider.get_frozen_credentials()
@@ -0,0 +1,78 @@
+"""
+Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import json
+import unittest
+
+from graph_notebook.neptune.sparql_results import SPARQLResultsReader
+
+SELECT_RESULTS = {
+    'head': {'vars': ['s', 'p', 'o']},
+    'results': {
+        'bindings': [
+            {
+                's': {'type': 'uri', 'value': f'http://kelvinlawrence.net/air-routes/resource/{i}'},
+                'p': {'type': 'uri', 'value': 'http://www.w3.org/2000/01/rdf-schema#label'},
+                'o': {'type': 'literal', 'value': f'Zürich «{i}» 空港', 'xml:lang': 'de'}
+            } for i in range(20)
+        ]
+    }
+}
+
+
+def chunked(document, chunk_size: int):
+    data = (document if isinstance(document, str) else json.dumps(document, ensure_ascii=False)).encode('utf-8')
+    for i in range(0, len(data), chunk_size):
+        yield data[i:i + chunk_size]
+
+
+class TestSPARQLResultsReader(unittest.TestCase):
+    def test_limit_rows_stops_reading(self):
+        for chunk_size in [1, 3, 64, 1 << 20]:
+            reader = SPARQLResultsReader(chunked(SELECT_RESULTS, chunk_size), limit_rows=5)
+            results = reader.read()
+            self.assertEqual({'head': SELECT_RESULTS['head'],
+                              'results': {'bindings': SELECT_RESULTS['results']['bindings'][:5]}}, results)
+            self.assertTrue(reader.truncated)
+        reader = SPARQLResultsReader(chunked(SELECT_RESULTS, 64), limit_rows=5)
+        reader.read()
+        self.assertLess(reader.bytes_read, len(json.dumps(SELECT_RESULTS, ensure_ascii=False).encode('utf-8')) / 2)
+
+    def test_limit_rows_equal_to_results_is_not_truncated(self):
+        for chunk_size in [1, 16, 1 << 20]:
+            reader = SPARQLResultsReader(chunked(SELECT_RESULTS, chunk_size), limit_rows=20)
+            self.assertEqual(SELECT_RESULTS, reader.read())
+            self.assertFalse(reader.truncated)
+
+    def test_keeps_keys_after_bindings(self):
+        results = {'head': {'vars': ['s'], 'link': []},
+                   'results': {'bindings': [{'s': {'type': 'literal', 'value': ']'}}], 'distinct': False}}
+        reader = SPARQLResultsReader(chunked(results, 5), limit_rows=10)
+        self.assertEqual(results, reader.read())
+
+    def test_ask_results(self):
+        results = {'head': {}, 'boolean': True}
+        reader = SPARQLResultsReader(chunked(results, 4), limit_rows=10)
+        self.assertEqual(results, reader.read())
+        self.assertFalse(reader.truncated)
+
+    def test_head_after_bindings(self):
+        document = '{"results": {"bindings": [{"s": {"type": "literal", "value": "a"}}, ' \
+                   '{"s": {"type": "literal", "value": "b"}}]}, "head": {"vars": ["s"]}}'
+        reader = SPARQLResultsReader(chunked(document, 8), limit_rows=1)
+        expected = json.loads(document)
+        expected['results']['bindings'] = expected['results']['bindings'][:1]
+        self.assertEqual(expected, reader.read())
+        self.assertTrue(reader.truncated)
+
+    def test_invalid_json_is_returned_as_text(self):
+        reader = SPARQLResultsReader(chunked('not json', 3), limit_rows=10)
+        self.assertEqual('not json', reader.read())
+
+    def test_unterminated_bindings(self):
+        document = json.dumps(SELECT_RESULTS)[:-40]
+        reader = SPARQLResultsReader(chunked(document, 32), limit_rows=100)
+        with self.assertRaises(json.JSONDecodeError):
+            reader.read()
@@ -5,9 +5,10 @@ SPDX-License-Identifier: Apache-2.0
 
 import unittest
 
+from gremlin_python.process.traversal import T, Direction
 from gremlin_python.structure.graph import Path
 
-from graph_notebook.network.gremlin.GremlinNetwork import GremlinNetwork
+from graph_notebook.network.gremlin.GremlinNetwork import GremlinNetwork, is_elementmap, WS_ID_KEYS
 
 
 class TestAddResults(unittest.TestCase):
@@ -34,3 +35,27 @@ class TestAddResults(unittest.TestCase):
         gn = GremlinNetwork()
         gn.add_results([p])
         self.assertEqual(len(p), len(gn.graph.nodes))
+
+    def test_add_mixed_results(self):
+        e_map = {T.id: 'c', T.label: 'airport', 'code': 'C'}
+        gn = GremlinNetwork()
+        gn.add_results([Path([], ['a', 'b']), e_map, Path([], ['b', e_map])])
+        self.assertEqual(['a', 'b', 'c'], sorted(gn.graph.nodes))
+        self.assertEqual(2, len(gn.graph.edges))
+
+    def test_add_results_rejects_other_types(self):
+        gn = GremlinNetwork()
+        with self.assertRaises(ValueError):
+            gn.add_results([Path([], ['a', 'b']), 'c'])
+
+    def test_is_elementmap(self):
+        reserved_keys = WS_ID_KEYS | {T.label}
+        self.assertTrue(is_elementmap({T.id: 'a', T.label: 'airport', 'code': 'A'}, WS_ID_KEYS, T.label,
+                                      reserved_keys))
+        self.assertTrue(is_elementmap({T.id: 'a', T.label: 'airport', 'dist': 5}, WS_ID_KEYS, T.label,
+                                      reserved_keys))
+        self.assertTrue(is_elementmap({T.id: 'e', T.label: 'route', Direction.OUT: {T.id: 'a'}}, WS_ID_KEYS, T.label,
+                                      reserved_keys))
+        self.assertFalse(is_elementmap({T.id: 'a', T.label: 'airport', 'code': ['A']}, WS_ID_KEYS, T.label,
+                                       reserved_keys))
+        self.assertFalse(is_elementmap({T.id: 'a', 'code': 'A'}, WS_ID_KEYS, T.label, reserved_keys))
@@ -5,6 +5,8 @@ SPDX-License-Identifier: Apache-2.0
 
 import unittest
 
+from gremlin_python.process.traversal import T
+
 from graph_notebook.network.gremlin.GremlinNetwork import generate_id_from_dict
 
 
@@ -16,3 +18,10 @@ class TestGenerateIDFromDict(unittest.TestCase):
         data_copy = {'foo': 'val1', 'bar': 123, 'baz': ['a', 1]}
         generated_id_again = generate_id_from_dict(data_copy)
         self.assertEqual(generated_id, generated_id_again)
+
+    def test_generate_id_from_dict_does_not_modify_data(self):
+        data = {T.label: 'airport', 'code': ['SEA'], 'city': {T.id: '1', T.label: 'city'}}
+        generated_id = generate_id_from_dict(data)
+        self.assertEqual({T.label: 'airport', 'code': ['SEA'], 'city': {T.id: '1', T.label: 'city'}}, data)
+        self.assertTrue(generated_id.startswith('graph_notebook-'))
+        self.assertNotEqual(generated_id, generate_id_from_dict({T.label: 'airport', 'code': ['BOS']}))
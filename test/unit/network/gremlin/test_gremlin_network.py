@@ -9,7 +9,7 @@ from uuid import uuid4
 from gremlin_python.structure.graph import Path, Edge, Vertex
 from gremlin_python.process.traversal import T, Direction
 from graph_notebook.network.EventfulNetwork import EVENT_ADD_NODE
-from graph_notebook.network.gremlin.GremlinNetwork import GremlinNetwork, PathPattern
+from graph_notebook.network.gremlin.GremlinNetwork import GremlinNetwork, PathPattern, generate_id_from_dict
 
 
 class TestGremlinNetwork(unittest.TestCase):
@@ -1978,7 +1978,7 @@ class TestGremlinNetwork(unittest.TestCase):
 
         gn = GremlinNetwork(group_by_property='code')
         gn.add_vertex(vertex)
-        node = gn.graph.nodes.get('graph_notebook-ed8fddedf251d3d5745dccfd53edf51d')
+        node = gn.graph.nodes.get(generate_id_from_dict(vertex))
         self.assertEqual(node['group'], 'SEA')
 
     def test_group_notokens_without_groupby(self):
@@ -1990,7 +1990,7 @@ class TestGremlinNetwork(unittest.TestCase):
 
         gn = GremlinNetwork()
         gn.add_vertex(vertex)
-        node = gn.graph.nodes.get('graph_notebook-ed8fddedf251d3d5745dccfd53edf51d')
+        node = gn.graph.nodes.get(generate_id_from_dict(vertex))
         self.assertEqual(node['group'], 'DEFAULT_GROUP')
 
     def test_group_with_groupby_depth_default(self):
@@ -3134,6 +3134,16 @@ class TestGremlinNetwork(unittest.TestCase):
         self.assertNotEqual(node['group'], 'TAG::TAG_ANIMAL_CONTROL')
         self.assertEqual(node['group'], 'TAG')
 
+    def test_options_changed_after_init_apply_to_next_results(self):
+        vertex = {T.id: '1', T.label: 'airport', 'code': ['SEA'], 'names': ['Seattle', 'Sea-Tac']}
+        gn = GremlinNetwork()
+        gn.group_by_property = {'airport': 'code'}
+        gn.display_property = ('names', 1)
+        gn.add_results([Path([], [vertex])])
+        node = gn.graph.nodes.get('1')
+        self.assertEqual("['SEA']", node['group'])
+        self.assertEqual('Sea-Tac', node['label'])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -4012,6 +4012,12 @@ class TestOpenCypherNetwork(unittest.TestCase):
         self.assertEqual(edge_route['label'], 'commercial')
         self.assertEqual(edge_route['title'], 792)
 
+    def test_group_by_dict_without_labels(self):
+        node = {'~id': '1', '~entityType': 'node', '~labels': [], '~properties': {'code': 'SEA'}}
+        gn = OCNetwork(group_by_property='{"airport":"code"}')
+        gn.parse_node(node)
+        self.assertEqual('DEFAULT_GROUP', gn.graph.nodes.get('1')['group'])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -818,6 +818,18 @@ class TestSPARQLNetwork(unittest.TestCase):
         self.assertEqual('http://kelvinlawrence.net/air-routes/objectProperty/route', edge['label'])
         self.assertEqual('uri', edge['title'])
 
+    def test_uri_parts_cache(self):
+        sparql_network = SPARQLNetwork()
+        uri = 'http://kelvinlawrence.net/air-routes/resource/24'
+        parts = sparql_network.uri_parts(uri)
+        self.assertEqual(('resource', '24', 'resource:24', 'resourc...'), parts)
+        self.assertIs(parts, sparql_network.uri_parts(uri))
+
+        # prefixes declared by a query replace the ones extracted so far
+        sparql_network.extract_prefix_declarations_from_query(
+            'PREFIX res: <http://kelvinlawrence.net/air-routes/resource/>')
+        self.assertEqual('res:24', sparql_network.uri_parts(uri).title)
+
 
 if __name__ == '__main__':
     unittest.main()
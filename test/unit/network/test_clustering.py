@@ -0,0 +1,139 @@
+"""
+Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import unittest
+
+from networkx import MultiDiGraph
+
+from graph_notebook.network.EventfulNetwork import EventfulNetwork, EVENT_REMOVE_NODE
+from graph_notebook.network.clustering import NetworkClusters, CLUSTER_ID_PREFIX, CLUSTER_EDGE_KEY
+from graph_notebook.widgets import Force
+
+AIRPORTS = f'{CLUSTER_ID_PREFIX}airport'
+COUNTRIES = f'{CLUSTER_ID_PREFIX}country'
+
+
+def airport_graph() -> MultiDiGraph:
+    graph = MultiDiGraph()
+    for code in ['SEA', 'AUS', 'JFK']:
+        graph.add_node(code, label=code, group='airport')
+    graph.add_node('US', label='US', group='country')
+    graph.add_edge('SEA', 'AUS', 'r1', label='route')
+    graph.add_edge('AUS', 'JFK', 'r2', label='route')
+    for code in ['SEA', 'AUS', 'JFK']:
+        graph.add_edge(code, 'US', f'c{code}', label='contains')
+    return graph
+
+
+class TestNetworkClusters(unittest.TestCase):
+    def test_build_network(self):
+        network = NetworkClusters(airport_graph(), 2).build_network()
+        self.assertEqual({AIRPORTS, COUNTRIES}, set(network.graph.nodes))
+        self.assertEqual('airport (3)', network.graph.nodes[AIRPORTS]['label'])
+        self.assertTrue(network.graph.nodes[AIRPORTS]['cluster'])
+        edges = list(network.graph.edges(keys=True, data=True))
+        self.assertEqual(1, len(edges))
+        self.assertEqual((AIRPORTS, COUNTRIES, CLUSTER_EDGE_KEY), edges[0][:3])
+        self.assertEqual('3', edges[0][3]['label'])
+
+    def test_too_many_groups(self):
+        graph = airport_graph()
+        graph.add_node('Seattle', group='city')
+        network = NetworkClusters(graph, 2).build_network()
+        self.assertEqual({AIRPORTS, f'{CLUSTER_ID_PREFIX}Other'}, set(network.graph.nodes))
+
+    def test_single_group_uses_communities(self):
+        graph = MultiDiGraph()
+        for a, b in [('a', 'b'), ('b', 'c'), ('c', 'a'), ('x', 'y'), ('y', 'z'), ('z', 'x'), ('c', 'x')]:
+            graph.add_edge(a, b, 'e')
+        clusters = NetworkClusters(graph, 3)
+        self.assertEqual(2, len(clusters.members))
+        self.assertEqual(clusters.node_cluster['a'], clusters.node_cluster['b'])
+        self.assertNotEqual(clusters.node_cluster['a'], clusters.node_cluster['z'])
+
+    def test_expand(self):
+        clusters = NetworkClusters(airport_graph(), 4)
+        network = clusters.build_network()
+        events = []
+        network.register_universal_callback(lambda n, event_name, data: events.append(event_name))
+
+        self.assertTrue(clusters.expand(AIRPORTS, network))
+        self.assertEqual({'SEA', 'AUS', 'JFK', COUNTRIES}, set(network.graph.nodes))
+        self.assertTrue(network.graph.has_edge('SEA', 'AUS', 'r1'))
+        self.assertEqual('route', network.graph.edges['SEA', 'AUS', 'r1']['label'])
+        self.assertEqual('1', network.graph.edges['SEA', COUNTRIES, CLUSTER_EDGE_KEY]['label'])
+        self.assertEqual(EVENT_REMOVE_NODE, events[0])
+        self.assertFalse(clusters.expand(AIRPORTS, network))
+
+        self.assertTrue(clusters.expand(COUNTRIES, network))
+        self.assertEqual({'SEA', 'AUS', 'JFK', 'US'}, set(network.graph.nodes))
+        self.assertEqual(5, network.graph.number_of_edges())
+        self.assertTrue(network.graph.has_edge('JFK', 'US', 'cJFK'))
+
+    def test_expand_places_members_around_cluster(self):
+        clusters = NetworkClusters(airport_graph(), 4)
+        network = clusters.build_network()
+        network.graph.nodes[AIRPORTS].update({'x': 10.0, 'y': 20.0})
+        clusters.expand(AIRPORTS, network)
+        self.assertEqual((10.0, 20.0), (network.graph.nodes['SEA']['x'], network.graph.nodes['SEA']['y']))
+        self.assertIn('x', network.graph.nodes['JFK'])
+
+    def test_expand_keeps_within_max_nodes(self):
+        clusters = NetworkClusters(airport_graph(), 3)
+        network = clusters.build_network()
+        self.assertTrue(clusters.expand(AIRPORTS, network))
+        remaining = f'{AIRPORTS}/2'
+        # AUS has the most edges, the other airports stay collapsed
+        self.assertEqual({'AUS', remaining, COUNTRIES}, set(network.graph.nodes))
+        self.assertEqual('airport (2)', network.graph.nodes[remaining]['label'])
+        self.assertEqual('2', network.graph.edges[remaining, COUNTRIES, CLUSTER_EDGE_KEY]['label'])
+        self.assertTrue(network.graph.has_edge(remaining, 'AUS', CLUSTER_EDGE_KEY))
+        self.assertTrue(network.graph.has_edge('AUS', remaining, CLUSTER_EDGE_KEY))
+
+        # there is no room left for a member and a cluster of the others
+        self.assertFalse(clusters.expand(remaining, network))
+        self.assertEqual({'AUS', remaining, COUNTRIES}, set(network.graph.nodes))
+        self.assertIn('Cannot be expanded', network.graph.nodes[remaining]['title'])
+        # a cluster of one node still fits
+        self.assertTrue(clusters.expand(COUNTRIES, network))
+        self.assertEqual({'AUS', remaining, 'US'}, set(network.graph.nodes))
+
+    def test_repeated_expands_stay_within_max_nodes(self):
+        graph = MultiDiGraph()
+        for group in ['a', 'b', 'c']:
+            for i in range(10):
+                graph.add_node(f'{group}{i}', group=group)
+                graph.add_edge(f'{group}{i}', f'{group}{(i + 1) % 10}', f'{group}{i}')
+        for max_nodes in [3, 5, 8]:
+            clusters = NetworkClusters(graph, max_nodes)
+            network = clusters.build_network()
+            expanded = True
+            while expanded:
+                expanded = False
+                for node in list(network.graph.nodes):
+                    if node in clusters.members and clusters.expand(node, network):
+                        expanded = True
+                    self.assertLessEqual(network.graph.number_of_nodes(), max_nodes)
+            self.assertEqual(max_nodes, network.graph.number_of_nodes())
+
+    def test_force_expand_cluster_message(self):
+        clusters = NetworkClusters(airport_graph(), 4)
+        force = Force(network=clusters.build_network(), clusters=clusters)
+        sent = []
+        force.send = sent.append
+        force._handle_custom_msg(force, {'method': 'view_ready'}, [])
+        force._handle_custom_msg(force, {'method': 'expand_cluster', 'data': {'cluster_id': AIRPORTS}}, [])
+        self.assertEqual(1, len(sent))
+        methods = [event['method'] for event in sent[0]['data']]
+        self.assertEqual('remove_node', methods[0])
+        self.assertEqual(3, methods.count('add_node'))
+
+    def test_remove_node(self):
+        network = EventfulNetwork()
+        network.add_edge('a', 'b', 'e', 'link')
+        network.remove_node('a')
+        network.remove_node('missing')
+        self.assertEqual(['b'], list(network.graph.nodes))
+        self.assertEqual(0, network.graph.number_of_edges())
@@ -0,0 +1,57 @@
+"""
+Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import unittest
+
+import numpy as np
+from networkx import MultiDiGraph
+
+from graph_notebook.network.layout import apply_precomputed_layout, exact_repulsion, force_directed_layout, \
+    grid_repulsion
+
+
+def ring_graph(node_count: int) -> MultiDiGraph:
+    graph = MultiDiGraph()
+    for i in range(node_count):
+        graph.add_edge(f'n{i}', f'n{(i + 1) % node_count}', 'next')
+    return graph
+
+
+class TestLayout(unittest.TestCase):
+    def test_empty_and_single_node(self):
+        self.assertEqual({}, force_directed_layout(MultiDiGraph()))
+        graph = MultiDiGraph()
+        graph.add_node('a')
+        self.assertEqual({'a': (0.0, 0.0)}, force_directed_layout(graph))
+
+    def test_layout_is_deterministic(self):
+        graph = ring_graph(20)
+        self.assertEqual(force_directed_layout(graph), force_directed_layout(graph))
+
+    def test_connected_nodes_are_closer(self):
+        graph = ring_graph(30)
+        positions = force_directed_layout(graph)
+        points = np.array([positions[f'n{i}'] for i in range(30)])
+        neighbor_distance = np.linalg.norm(points - np.roll(points, 1, axis=0), axis=1).mean()
+        opposite_distance = np.linalg.norm(points - np.roll(points, 15, axis=0), axis=1).mean()
+        self.assertLess(neighbor_distance * 3, opposite_distance)
+        np.testing.assert_allclose([0, 0], points.mean(axis=0), atol=1e-6)
+
+    def test_grid_repulsion_approximates_exact(self):
+        positions = np.random.default_rng(0).random((500, 2))
+        k = np.sqrt(1 / 500)
+        exact = exact_repulsion(positions, k)
+        approximate = grid_repulsion(positions, k, 64)
+        for axis in range(2):
+            self.assertGreater(np.corrcoef(exact[:, axis], approximate[:, axis])[0, 1], 0.95)
+
+    def test_apply_precomputed_layout(self):
+        graph = ring_graph(5)
+        graph.nodes['n0']['label'] = 'first'
+        apply_precomputed_layout(graph)
+        for _, data in graph.nodes(data=True):
+            self.assertIsInstance(data['x'], float)
+            self.assertIsInstance(data['y'], float)
+        self.assertEqual('first', graph.nodes['n0']['label'])
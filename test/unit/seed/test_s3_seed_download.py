@@ -0,0 +1,123 @@
+"""
+Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import io
+import os
+import tarfile
+import tempfile
+import threading
+import unittest
+import zipfile
+
+from graph_notebook.seed.load_query import SeedFile, download_and_extract_archive_from_s3, file_to_query, \
+    iter_s3_object, remove_seed_files
+
+NODES = 'g.addV("node").property(id,"0")\ng.addV("node").property(id,"1")\n'
+EDGES = 'g.addE("edge").property(id,"0").from(V("0")).to(V("1"))'
+
+
+class LocalS3Client(object):
+    """
+    Stands in for a boto3 S3 client, serving the objects of a dict by key.
+    """
+
+    def __init__(self, objects: dict):
+        self.objects = objects
+        self.ranges = []
+        self.lock = threading.Lock()
+
+    def head_object(self, Bucket, Key):
+        return {'ContentLength': len(self.objects[Key])}
+
+    def get_object(self, Bucket, Key, Range):
+        start, end = Range[len('bytes='):].split('-')
+        with self.lock:
+            self.ranges.append((int(start), int(end)))
+        return {'Body': io.BytesIO(self.objects[Key][int(start):int(end) + 1])}
+
+    def get_paginator(self, operation):
+        client = self
+
+        class Paginator(object):
+            def paginate(self, Bucket, Prefix):
+                yield {'Contents': [{'Key': key} for key in client.objects if key.startswith(Prefix)]}
+
+        return Paginator()
+
+
+def make_tar(members: dict, mode='w:gz') -> bytes:
+    archive = io.BytesIO()
+    with tarfile.open(fileobj=archive, mode=mode) as tar:
+        for name, content in members.items():
+            info = tarfile.TarInfo(name=name)
+            info.size = len(content)
+            tar.addfile(info, io.BytesIO(content))
+    return archive.getvalue()
+
+
+class TestS3SeedDownload(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.extract_dir = self.temp_dir.name
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def test_parts_are_downloaded_in_ranges_and_yielded_in_order(self):
+        data = os.urandom(100000)
+        client = LocalS3Client({'data.bin': data})
+        parts = list(iter_s3_object(client, 'bucket', 'data.bin', part_size=4096, concurrency=4))
+        self.assertEqual(data, b''.join(parts))
+        self.assertEqual(25, len(client.ranges))
+        self.assertIn((98304, 99999), client.ranges)
+        self.assertEqual([], list(iter_s3_object(LocalS3Client({'empty': b''}), 'bucket', 'empty')))
+
+    def test_tar_archive_is_extracted_as_it_is_downloaded(self):
+        for name, mode in [('seed.tar.gz', 'w:gz'), ('seed.tar', 'w')]:
+            archive = make_tar({'1_edges.txt': EDGES.encode(), '0_nodes.txt': NODES.encode()}, mode)
+            client = LocalS3Client({f'data/{name}': archive})
+            data_dir = download_and_extract_archive_from_s3('bucket', f'data/{name}', self.extract_dir, client)
+            self.assertEqual(os.path.join(self.extract_dir, 'seed'), data_dir)
+            self.assertEqual(['0_nodes.txt', '1_edges.txt'], sorted(os.listdir(data_dir)))
+            # the archive itself is never written to disk
+            self.assertEqual(['seed'], os.listdir(self.extract_dir))
+            nodes = file_to_query('0_nodes.txt', data_dir)
+            self.assertEqual(NODES.splitlines(), list(nodes))
+            self.assertEqual(2, nodes.line_count)
+
+    def test_unsafe_tar_member_is_not_extracted(self):
+        archive = make_tar({'../traversal.txt': b'PWNED'})
+        client = LocalS3Client({'seed.tar.gz': archive})
+        with self.assertRaises(ValueError) as ctx:
+            download_and_extract_archive_from_s3('bucket', 'seed.tar.gz', self.extract_dir, client)
+        self.assertIn('../traversal.txt', str(ctx.exception))
+        self.assertFalse(os.path.exists(self.extract_dir))
+
+    def test_zip_archive_and_prefix(self):
+        archive = io.BytesIO()
+        with zipfile.ZipFile(archive, 'w') as zf:
+            zf.writestr('0_nodes.txt', NODES)
+        client = LocalS3Client({'seed.zip': archive.getvalue()})
+        data_dir = download_and_extract_archive_from_s3('bucket', 'seed.zip', self.extract_dir, client)
+        self.assertEqual(['0_nodes.txt'], os.listdir(data_dir))
+        self.assertEqual(['seed'], os.listdir(self.extract_dir))
+
+        client = LocalS3Client({'dir/0_nodes.txt': NODES.encode(), 'dir/1_edges.txt': EDGES.encode(), 'dir/': b''})
+        prefix_dir = os.path.join(self.extract_dir, 'prefix')
+        os.makedirs(prefix_dir)
+        self.assertEqual(prefix_dir, download_and_extract_archive_from_s3('bucket', 'dir/', prefix_dir, client))
+        self.assertEqual(['0_nodes.txt', '1_edges.txt'], sorted(os.listdir(prefix_dir)))
+
+    def test_seed_file(self):
+        path = os.path.join(self.extract_dir, 'queries.txt')
+        with open(path, 'w', newline='') as file:
+            file.write('a\r\nb\n\nc')
+        seed_file = SeedFile('queries.txt', path, temp_dir=self.extract_dir)
+        self.assertEqual(['a', 'b', '', 'c'], list(seed_file))
+        self.assertEqual(4, seed_file.line_count)
+        self.assertEqual('queries.txt', seed_file['name'])
+        self.assertEqual('a\nb\n\nc', seed_file['content'])
+        remove_seed_files([seed_file])
+        self.assertFalse(os.path.exists(self.extract_dir))
@@ -0,0 +1,61 @@
+"""
+Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from graph_notebook.seed.load_query import SeedFile, get_data_sets, get_queries
+
+
+class TestSeedFile(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def seed_file(self, content: bytes) -> SeedFile:
+        path = os.path.join(self.temp_dir.name, 'queries.txt')
+        with open(path, 'wb') as file:
+            file.write(content)
+        return SeedFile('queries.txt', path)
+
+    def test_lines_and_line_count(self):
+        for content in [b'', b'\n', b'a', b'a\n', b'a\r\nb\n\nc', b'a\n\n', 'Zürich «1» 空港\n'.encode('utf-8')]:
+            seed_file = self.seed_file(content)
+            self.assertEqual(content.decode('utf-8').splitlines(), list(seed_file))
+            self.assertEqual(len(content.decode('utf-8').splitlines()), seed_file.line_count)
+
+    def test_sample_data_sets_match_splitlines(self):
+        for language in ['gremlin', 'opencypher', 'sparql']:
+            for data_set in get_data_sets(language):
+                for query in get_queries(language, data_set, 'samples'):
+                    content = query['content']
+                    self.assertEqual(len(content.splitlines()), query.line_count, query.path)
+                    self.assertEqual(content.splitlines(), list(query), query.path)
+
+    def test_check_decodes_across_buffer_boundaries(self):
+        seed_file = self.seed_file('aé\nb'.encode('utf-8'))
+        with mock.patch('graph_notebook.seed.load_query.SEED_FILE_BUFFER_SIZE', 2):
+            seed_file.check()
+            self.assertEqual(2, seed_file.line_count)
+        seed_file = self.seed_file(b'a\n\xff\n')
+        with self.assertRaises(UnicodeDecodeError):
+            seed_file.check()
+
+    def test_file_that_is_not_utf8_is_skipped(self):
+        with open(os.path.join(self.temp_dir.name, 'a.txt'), 'wb') as file:
+            file.write(b'g.addV("a")\n')
+        with open(os.path.join(self.temp_dir.name, 'b.bin'), 'wb') as file:
+            file.write(b'g.addV("b")\n\x89PNG\xff\n')
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            queries = get_queries('gremlin', self.temp_dir.name, 'custom')
+        self.assertEqual(['a.txt'], [query['name'] for query in queries])
+        self.assertIn('Unable to read queries from file [b.bin]', output.getvalue())
@@ -0,0 +1,115 @@
+"""
+Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import threading
+import unittest
+
+from graph_notebook.seed.seed_runner import SeedRunner, classify_gremlin_line, gremlin_batch_key, \
+    combine_gremlin_lines, classify_opencypher_line, opencypher_batch_key, combine_opencypher_lines, \
+    LINE_KIND_VERTEX, LINE_KIND_EDGE, LINE_KIND_OTHER
+
+GREMLIN_LINES = [
+    'g.addV("node").property(id,"0")',
+    'g.addV("node").property(id,"1")',
+    '',
+    'g.addE("edge").property(id,"0").from(V("0")).to(V("1"))',
+    'g.V("0").property("visited", true)',
+]
+
+
+class RecordingExecutor(object):
+    def __init__(self, fail_on=()):
+        self.fail_on = fail_on
+        self.queries = []
+        self.lock = threading.Lock()
+
+    def __call__(self, query):
+        with self.lock:
+            self.queries.append(query)
+        for marker in self.fail_on:
+            if marker in query:
+                raise ValueError(f'failed on {marker}')
+
+
+class TestSeedLineClassification(unittest.TestCase):
+    def test_gremlin_line_kinds(self):
+        self.assertEqual(LINE_KIND_VERTEX, classify_gremlin_line(GREMLIN_LINES[0]))
+        self.assertEqual(LINE_KIND_EDGE, classify_gremlin_line(GREMLIN_LINES[3]))
+        self.assertEqual(LINE_KIND_OTHER, classify_gremlin_line(GREMLIN_LINES[4]))
+        self.assertEqual(LINE_KIND_OTHER, classify_gremlin_line('g.addV("a").addE("r").to(V("1"))'))
+
+    def test_combine_gremlin_lines(self):
+        combined = combine_gremlin_lines(['g.addV("a");', 'g.addV("b").next()', 'g.addV("c")'])
+        self.assertEqual('g.addV("a").next();\ng.addV("b").next();\ng.addV("c").next()', combined)
+
+    def test_opencypher_line_kinds(self):
+        self.assertEqual(LINE_KIND_VERTEX, classify_opencypher_line("CREATE (a:airport {code:'ATL'})"))
+        self.assertEqual(LINE_KIND_EDGE, classify_opencypher_line(
+            "MATCH (a {code:'ATL'}), (b {code:'SEA'}) CREATE (a)-[:route]->(b)"))
+        self.assertEqual(LINE_KIND_OTHER, classify_opencypher_line("MATCH (n) DETACH DELETE n"))
+
+    def test_opencypher_unwind_batch(self):
+        lines = ["CREATE (a1:airport {code:'ATL', desc:'a {b}'})", "CREATE (a2:airport {code:'SEA'});"]
+        self.assertEqual((LINE_KIND_VERTEX, 'airport'), opencypher_batch_key(lines[0]))
+        self.assertEqual("UNWIND [{code:'ATL', desc:'a {b}'}, {code:'SEA'}] AS props "
+                         "CREATE (n:airport) SET n += props", combine_opencypher_lines(lines))
+
+    def test_opencypher_unbatchable_lines(self):
+        self.assertIsNone(opencypher_batch_key("CREATE (a:airport {`~id`:'1'})"))
+        self.assertIsNone(opencypher_batch_key("CREATE (a:airport {code:'ATL'}), (b:airport {code:'SEA'})"))
+        self.assertIsNone(opencypher_batch_key("CREATE (a:airport {code:'ATL'}) RETURN a"))
+
+
+class TestSeedRunner(unittest.TestCase):
+    def test_sequential_run_matches_file_order(self):
+        executor = RecordingExecutor()
+        progress = []
+        runner = SeedRunner(executor, classify=classify_gremlin_line, on_progress=progress.append)
+        self.assertTrue(runner.run_file('seed.txt', GREMLIN_LINES))
+        self.assertEqual([line for line in GREMLIN_LINES if line], executor.queries)
+        self.assertEqual(len(GREMLIN_LINES), sum(progress))
+
+    def test_batches_adjacent_lines(self):
+        executor = RecordingExecutor()
+        runner = SeedRunner(executor, classify=classify_gremlin_line, batch_key=gremlin_batch_key,
+                            combine=combine_gremlin_lines, batch_size=10)
+        runner.run_file('seed.txt', GREMLIN_LINES)
+        self.assertEqual(3, len(executor.queries))
+        self.assertEqual(combine_gremlin_lines(GREMLIN_LINES[:2]), executor.queries[0])
+
+    def test_concurrent_run_keeps_phases_ordered(self):
+        executor = RecordingExecutor()
+        lines = [f'g.addV("node").property(id,"{i}")' for i in range(20)] + GREMLIN_LINES[3:]
+        runner = SeedRunner(executor, classify=classify_gremlin_line, concurrency=4)
+        runner.run_file('seed.txt', lines)
+        self.assertEqual(sorted(lines[:20]), sorted(executor.queries[:20]))
+        self.assertEqual(lines[20:], executor.queries[20:])
+
+    def test_stops_on_first_error(self):
+        executor = RecordingExecutor(fail_on=['id,"1"'])
+        runner = SeedRunner(executor, classify=classify_gremlin_line)
+        self.assertFalse(runner.run_file('seed.txt', GREMLIN_LINES))
+        self.assertEqual(1, len(runner.errors))
+        self.assertEqual(1, runner.errors[0].line_index)
+        self.assertEqual(2, len(executor.queries))
+
+    def test_failed_batch_reports_errors_per_line(self):
+        executor = RecordingExecutor(fail_on=['id,"1"'])
+        runner = SeedRunner(executor, classify=classify_gremlin_line, batch_key=gremlin_batch_key,
+                            combine=combine_gremlin_lines, batch_size=10, ignore_errors=True, atomic_batches=True)
+        self.assertTrue(runner.run_file('seed.txt', GREMLIN_LINES))
+        self.assertEqual([1], [error.line_index for error in runner.errors])
+        self.assertIn(GREMLIN_LINES[4], executor.queries)
+
+    def test_failed_batch_is_not_rerun_without_rollback(self):
+        executor = RecordingExecutor(fail_on=['id,"1"'])
+        runner = SeedRunner(executor, classify=classify_gremlin_line, batch_key=gremlin_batch_key,
+                            combine=combine_gremlin_lines, batch_size=10, ignore_errors=True)
+        self.assertTrue(runner.run_file('seed.txt', GREMLIN_LINES))
+        self.assertEqual([(0, combine_gremlin_lines(GREMLIN_LINES[:2]))],
+                         [(error.line_index, error.query) for error in runner.errors])
+        # the first line of the batch may already have been applied, so it is not run again on its own
+        self.assertNotIn(GREMLIN_LINES[0], executor.queries)
+        self.assertIn(GREMLIN_LINES[4], executor.queries)
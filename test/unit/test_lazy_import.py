@@ -0,0 +1,42 @@
+"""
+Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import json
+import subprocess
+import sys
+import unittest
+
+from graph_notebook.lazy_import import LazyModule, lazy_import
+
+# dependencies which only some magics need, and which must not be loaded by %load_ext graph_notebook.magics
+LAZY_DEPENDENCIES = ['pandas', 'itables', 'neo4j', 'plotly.subplots', 'plotly.graph_objs', 'rdflib', 'SPARQLWrapper',
+                     'aiohttp', 'boto3']
+
+
+class TestLazyImport(unittest.TestCase):
+    def test_imported_module_is_returned(self):
+        self.assertIs(json, lazy_import('json'))
+
+    def test_module_is_imported_on_first_use(self):
+        sys.modules.pop('xml.dom.minidom', None)
+        minidom = lazy_import('xml.dom.minidom')
+        self.assertIsInstance(minidom, LazyModule)
+        self.assertNotIn('xml.dom.minidom', sys.modules)
+        document = minidom.parseString('<a/>')
+        self.assertIn('xml.dom.minidom', sys.modules)
+        self.assertEqual('a', document.documentElement.tagName)
+        self.assertIs(sys.modules['xml.dom.minidom'].parseString, minidom.parseString)
+
+    def test_missing_module(self):
+        with self.assertRaises(ModuleNotFoundError):
+            lazy_import('graph_notebook_missing_module')
+        with self.assertRaises(AttributeError):
+            LazyModule('json').missing_attribute
+
+    def test_magics_do_not_import_lazy_dependencies(self):
+        code = 'import sys, json, graph_notebook.magics; print(json.dumps(sorted(sys.modules)))'
+        completed = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+        imported = set(json.loads(completed.stdout.splitlines()[-1]))
+        self.assertEqual([], [name for name in LAZY_DEPENDENCIES if name in imported])
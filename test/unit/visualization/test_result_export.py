@@ -0,0 +1,110 @@
+"""
+Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import csv
+import gzip
+import json
+import os
+import tempfile
+import unittest
+
+from gremlin_python.process.traversal import T
+
+from graph_notebook.visualization.result_export import export_rows, get_streaming_export_format
+
+try:
+    import pyarrow.parquet as pq
+except ImportError:
+    pq = None
+
+COLUMNS = ['code', 'runways', 'props']
+ROWS = [['SEA', 3, {'city': 'Seattle'}], ['AUS', 2, None], ['JFK', 4, ['a', 'b']]]
+
+
+class TestResultExport(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+
+    def export_path(self, file_name):
+        return os.path.join(self.tmp_dir.name, file_name)
+
+    def test_streaming_export_formats(self):
+        self.assertEqual('parquet', get_streaming_export_format('results.parquet'))
+        self.assertEqual('jsonl', get_streaming_export_format('results.JSONL'))
+        self.assertEqual('csv.gz', get_streaming_export_format('results.csv.gz'))
+        self.assertIsNone(get_streaming_export_format('results.csv'))
+
+    def test_export_jsonl(self):
+        export_path = self.export_path('results.jsonl')
+        export_rows(export_path, COLUMNS, iter(ROWS), chunk_size=2)
+        with open(export_path) as export_file:
+            records = [json.loads(line) for line in export_file]
+        self.assertEqual([dict(zip(COLUMNS, row)) for row in ROWS], records)
+
+    def test_export_jsonl_element_maps(self):
+        export_path = self.export_path('results.jsonl')
+        rows = [[{T.id: '1', T.label: 'airport', 'code': ['SEA']}], [{T.id: '2', T.label: 'airport', 'code': ['AUS']}]]
+        export_rows(export_path, ['Result'], iter(rows))
+        with open(export_path) as export_file:
+            records = [json.loads(line) for line in export_file]
+        self.assertEqual([{'Result': {'T.id': '1', 'T.label': 'airport', 'code': ['SEA']}},
+                          {'Result': {'T.id': '2', 'T.label': 'airport', 'code': ['AUS']}}], records)
+        self.assertEqual(['results.jsonl'], os.listdir(self.tmp_dir.name))
+
+    def test_failed_export_leaves_no_file(self):
+        def rows():
+            yield ['SEA', 3, None]
+            raise ValueError('query failed')
+
+        export_path = self.export_path('results.jsonl')
+        with self.assertRaises(ValueError):
+            export_rows(export_path, COLUMNS, rows(), chunk_size=1)
+        self.assertEqual([], os.listdir(self.tmp_dir.name))
+
+    def test_export_csv_gz(self):
+        export_path = self.export_path('results.csv.gz')
+        export_rows(export_path, COLUMNS, iter(ROWS), chunk_size=2)
+        with gzip.open(export_path, 'rt', newline='') as export_file:
+            records = list(csv.reader(export_file))
+        self.assertEqual([COLUMNS,
+                          ['SEA', '3', "{'city': 'Seattle'}"],
+                          ['AUS', '2', ''],
+                          ['JFK', '4', "['a', 'b']"]], records)
+
+    @unittest.skipIf(pq is None, 'pyarrow is not installed')
+    def test_export_parquet(self):
+        export_path = self.export_path('results.parquet')
+        export_rows(export_path, COLUMNS, iter(ROWS), chunk_size=2)
+        table = pq.read_table(export_path)
+        self.assertEqual(COLUMNS, table.column_names)
+        self.assertEqual(['SEA', 'AUS', 'JFK'], table.column('code').to_pylist())
+        self.assertEqual([3, 2, 4], table.column('runways').to_pylist())
+        self.assertEqual(["{'city': 'Seattle'}", None, "['a', 'b']"], table.column('props').to_pylist())
+
+    @unittest.skipIf(pq is None, 'pyarrow is not installed')
+    def test_export_parquet_widens_types_across_chunks(self):
+        export_path = self.export_path('results.parquet')
+        rows = [['SEA', 3, True], ['AUS', 2, None], ['JFK', 4.5, False], ['LAX', 4, 'yes'], ['ANC', None, 1]]
+        export_rows(export_path, COLUMNS, iter(rows), chunk_size=2)
+        table = pq.read_table(export_path)
+        self.assertEqual(['SEA', 'AUS', 'JFK', 'LAX', 'ANC'], table.column('code').to_pylist())
+        self.assertEqual([3.0, 2.0, 4.5, 4.0, None], table.column('runways').to_pylist())
+        self.assertEqual(['True', None, 'False', 'yes', '1'], table.column('props').to_pylist())
+        self.assertEqual(['results.parquet'], os.listdir(self.tmp_dir.name))
+
+    @unittest.skipIf(pq is None, 'pyarrow is not installed')
+    def test_export_parquet_ints_beyond_int64(self):
+        export_path = self.export_path('results.parquet')
+        export_rows(export_path, ['a', 'b'], iter([[1, 1.5], [2, 2.5], [2 ** 70, 3], [-2 ** 63, 4.5]]), chunk_size=2)
+        table = pq.read_table(export_path)
+        self.assertEqual(['1', '2', str(2 ** 70), str(-2 ** 63)], table.column('a').to_pylist())
+        self.assertEqual([1.5, 2.5, 3.0, 4.5], table.column('b').to_pylist())
+        export_rows(export_path, ['a'], iter([[2 ** 64], [1]]))
+        self.assertEqual([str(2 ** 64), '1'], pq.read_table(export_path).column('a').to_pylist())
+
+    def test_unsupported_format(self):
+        with self.assertRaises(ValueError):
+            export_rows(self.export_path('results.xlsx'), COLUMNS, ROWS)
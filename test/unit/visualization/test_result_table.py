@@ -0,0 +1,68 @@
+"""
+Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import unittest
+
+import pandas as pd
+
+from graph_notebook.visualization.result_table import build_gremlin_results_df, build_results_df, \
+    escape_html_values, unescape_html_df
+
+
+class TestResultTable(unittest.TestCase):
+
+    def test_escape_html_values(self):
+        self.assertEqual(['a&amp;b', '&lt;tag&gt;', '&quot;x&#39;', '1', 'None'],
+                         escape_html_values(['a&b', '<tag>', '"x\'', 1, None]))
+
+    def test_gremlin_results_df(self):
+        results_df = build_gremlin_results_df([{'code': 'SEA'}, 'a<b', 3])
+        self.assertEqual(['Result'], list(results_df.columns))
+        self.assertEqual('#', results_df.columns.name)
+        self.assertEqual([1, 2, 3], list(results_df.index))
+        self.assertEqual(["{&#39;code&#39;: &#39;SEA&#39;}", 'a&lt;b', '3'], list(results_df['Result']))
+
+    def test_build_gremlin_results_df_start(self):
+        results_df = build_gremlin_results_df(['c', 'd'], start=3)
+        self.assertEqual([3, 4], results_df.index.tolist())
+
+    def test_empty_gremlin_results_df(self):
+        results_df = build_gremlin_results_df([])
+        self.assertEqual(['Result'], list(results_df.columns))
+        self.assertEqual(0, len(results_df))
+
+    def test_results_df_converts_column_types(self):
+        rows = [[1, 1.0, 'a<b', [1]], [2, 2.0, 'c', {'k': 'v'}]]
+        results_df = build_results_df(rows, ['i', 'f', 's', 'm'])
+        self.assertEqual(['#', 'i', 'f', 's', 'm'], list(results_df.columns))
+        self.assertEqual([1, 2], list(results_df['#']))
+        self.assertEqual(['1', '2'], list(results_df['f']))
+        self.assertEqual(['a&lt;b', 'c'], list(results_df['s']))
+        self.assertEqual(['[1]', "{&#39;k&#39;: &#39;v&#39;}"], list(results_df['m']))
+
+    def test_results_df_without_rows_keeps_columns(self):
+        results_df = build_results_df([], ['s', 'p', 'o'], convert_types=False)
+        self.assertEqual(['#', 's', 'p', 'o'], list(results_df.columns))
+        self.assertEqual(0, len(results_df))
+
+    def test_results_df_from_dict_rows(self):
+        results_df = build_results_df([{'a': 1}, {'a': 2, 'b': 'x'}], ['Result'])
+        self.assertEqual(['#', 'Result', 1], list(results_df.columns))
+        self.assertEqual(['1', '2'], list(results_df['Result']))
+
+    def test_unescape_html_df_round_trip(self):
+        rows = [['a&b', '<x>', 1], ['"q\'', '&amp;', 2]]
+        results_df = build_results_df(rows, ['s', 't', 'i'])
+        decoded_df = unescape_html_df(results_df)
+        self.assertEqual(['a&b', '"q\''], list(decoded_df['s']))
+        self.assertEqual(['<x>', '&amp;'], list(decoded_df['t']))
+        self.assertEqual([1, 2], list(decoded_df['#']))
+        self.assertEqual('a&amp;b', results_df['s'][0])
+
+    def test_unescape_html_df_skips_non_string_cells(self):
+        results_df = pd.DataFrame({'mixed': ['&lt;a&gt;', 3, None, {'k': '&lt;'}], 'n': [1.5, 2.5, 3.5, 4.5]})
+        decoded_df = unescape_html_df(results_df)
+        self.assertEqual(['<a>', 3, None, {'k': '&lt;'}], list(decoded_df['mixed']))
+        self.assertEqual([1.5, 2.5, 3.5, 4.5], list(decoded_df['n']))
@@ -0,0 +1,58 @@
+"""
+Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import unittest
+
+from gremlin_python.process.traversal import T, Direction
+from gremlin_python.structure.graph import Path
+
+from graph_notebook.network.EventfulNetwork import EventfulNetwork
+from graph_notebook.network.gremlin.GremlinNetwork import GremlinNetwork
+from graph_notebook.widgets import Force
+from graph_notebook.widgets.force.compact_network import graph_to_compact_json, compact_json_to_graph_json
+from graph_notebook.visualization.json_safe import convert_to_json_safe
+from graph_notebook.widgets.force.force_widget import graph_to_json
+
+
+class TestCompactNetwork(unittest.TestCase):
+    def assert_round_trip(self, network):
+        compact = graph_to_compact_json(network.graph)
+        self.assertEqual(convert_to_json_safe(network.to_json()), compact_json_to_graph_json(compact))
+
+    def test_gremlin_network(self):
+        sea = {T.id: '1', T.label: 'airport', 'code': 'SEA', 'runways': 3}
+        aus = {T.id: '2', T.label: 'airport', 'code': 'AUS', 'runways': 2}
+        route = {T.id: '10', T.label: 'route', Direction.OUT: {T.id: '1', T.label: 'airport'},
+                 Direction.IN: {T.id: '2', T.label: 'airport'}, 'dist': 1770}
+        network = GremlinNetwork()
+        network.add_results([Path([], [sea, route, aus])])
+        self.assert_round_trip(network)
+
+    def test_values_and_nested_dicts(self):
+        network = EventfulNetwork()
+        network.add_node('a', {'count': 1, 'ratio': 1.0, 'flag': True, 'missing': None,
+                               'tags': ['x', 1, {'nested': T.id}], 'properties': {'empty': {}, T.label: 'vertex'}})
+        network.add_node(1, {'count': True})
+        network.add_edge('a', 1, 'e1', 'link', data={'weight': 0.5})
+        network.add_edge('a', 1, 'e2', 'link')
+        self.assert_round_trip(network)
+
+    def test_value_table(self):
+        network = EventfulNetwork()
+        for i in range(300):
+            network.add_node(f'n{i}', {'group': 'airport', 'label': 'airport'})
+        compact = graph_to_compact_json(network.graph)
+        # one shape shared by every node, and the empty shape of the graph attributes
+        self.assertEqual([[2, 3], []], compact['shapes'])
+        self.assertEqual(1, compact['values'].count('airport'))
+        self.assertEqual(2, compact['buffer_widths']['node_ids'])
+        self.assertEqual(1, compact['buffer_widths']['node_shapes'])
+        self.assertEqual(600, compact['node_values'].nbytes)
+
+    def test_force_payload_format(self):
+        network = EventfulNetwork()
+        network.add_node('a')
+        self.assertIn('graph', graph_to_json(network, Force(network=network)))
+        self.assertEqual('compact', graph_to_json(network, Force(network=network, compact_payload=True))['format'])
@@ -0,0 +1,63 @@
+"""
+Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import unittest
+
+from graph_notebook.network.EventfulNetwork import EventfulNetwork
+from graph_notebook.widgets import Force
+
+
+class TestForceWidgetSync(unittest.TestCase):
+    def setUp(self):
+        self.network = EventfulNetwork()
+        self.network.add_node('SEA', {'label': 'SEA'})
+        self.force = Force(network=self.network, sync_interval_ms=60000, sync_batch_size=3)
+        self.sent = []
+        self.synced_state = []
+        self.force.send = self.sent.append
+        self.force.send_state = self.synced_state.append
+
+    def view_ready(self):
+        self.force._handle_custom_msg(self.force, {'method': 'view_ready'}, [])
+
+    def test_events_before_render_resend_network(self):
+        self.network.add_node('AUS', {'label': 'AUS'})
+        self.view_ready()
+        self.assertEqual([], self.sent)
+        self.assertEqual(['network'], self.synced_state)
+
+    def test_no_snapshot_when_unchanged(self):
+        self.view_ready()
+        self.assertEqual([], self.sent)
+        self.assertEqual([], self.synced_state)
+
+    def test_events_sent_in_batches(self):
+        self.view_ready()
+        self.network.add_node('AUS', {'label': 'AUS'})
+        self.network.add_node('JFK', {'label': 'JFK'})
+        self.assertEqual([], self.sent)
+
+        self.network.add_edge('AUS', 'JFK', 'route', 'route')
+        self.assertEqual(1, len(self.sent))
+        self.assertEqual('batch', self.sent[0]['method'])
+        self.assertEqual(['add_node', 'add_node', 'add_edge'], [event['method'] for event in self.sent[0]['data']])
+        self.assertEqual('AUS', self.sent[0]['data'][0]['data']['node_id'])
+        self.assertEqual([], self.synced_state)
+
+    def test_flush_events(self):
+        self.view_ready()
+        self.network.add_node_property('SEA', 'runways', 3)
+        self.force.flush_events()
+        self.assertEqual([{'method': 'batch',
+                           'data': [{'method': 'add_node_property',
+                                     'data': {'node_id': 'SEA', 'key': 'runways', 'value': 3}}]}], self.sent)
+        self.force.flush_events()
+        self.assertEqual(1, len(self.sent))
+
+    def test_flush_after_interval(self):
+        self.force.sync_interval_ms = 0
+        self.view_ready()
+        self.network.add_node('AUS', {'label': 'AUS'})
+        self.assertEqual(1, len(self.sent))
@@ -0,0 +1,83 @@
+"""
+Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import unittest
+
+import pandas as pd
+
+from graph_notebook.widgets import PaginatedTable
+
+
+class TestPaginatedTable(unittest.TestCase):
+    def setUp(self):
+        results_df = pd.DataFrame({'code': ['SEA', 'AUS', 'JFK', 'LAX', 'ANC'],
+                                   'runways': ['3', '2', '4', '4', '3'],
+                                   'desc': ['Seattle', 'Austin', 'New York &amp; Co', 'Los Angeles', 'Anchorage']})
+        results_df.insert(0, '#', range(1, 6))
+        self.table = PaginatedTable(results_df, page_size=2, page_size_options=[2, -1], page_size_labels=[2, 'All'])
+
+    def test_traits(self):
+        self.assertEqual(['#', 'code', 'runways', 'desc'], self.table.columns)
+        self.assertEqual(5, self.table.total_rows)
+        self.assertEqual(['2', 'All'], self.table.page_size_labels)
+
+    def test_get_page(self):
+        page = self.table.get_page(page=1, request_id=7)
+        self.assertEqual(7, page['request_id'])
+        self.assertEqual(1, page['page'])
+        self.assertEqual(2, page['start'])
+        self.assertEqual([['3', 'JFK', '4', 'New York &amp; Co'], ['4', 'LAX', '4', 'Los Angeles']], page['rows'])
+        self.assertEqual(5, page['filtered_rows'])
+
+    def test_get_page_past_last_page(self):
+        page = self.table.get_page(page=10)
+        self.assertEqual(2, page['page'])
+        self.assertEqual([['5', 'ANC', '3', 'Anchorage']], page['rows'])
+
+    def test_get_all_rows(self):
+        page = self.table.get_page(page=3, page_size=-1)
+        self.assertEqual(0, page['page'])
+        self.assertEqual(5, len(page['rows']))
+
+    def test_sort(self):
+        page = self.table.get_page(page_size=-1, sort_column=1)
+        self.assertEqual(['ANC', 'AUS', 'JFK', 'LAX', 'SEA'], [row[1] for row in page['rows']])
+        page = self.table.get_page(page_size=-1, sort_column=0, ascending=False)
+        self.assertEqual(['5', '4', '3', '2', '1'], [row[0] for row in page['rows']])
+
+    def test_search(self):
+        page = self.table.get_page(search='an')
+        self.assertEqual(['LAX', 'ANC'], [row[1] for row in page['rows']])
+        self.assertEqual(2, page['filtered_rows'])
+        self.assertEqual(5, page['total_rows'])
+
+    def test_search_escaped_value(self):
+        page = self.table.get_page(search='york & co')
+        self.assertEqual(['JFK'], [row[1] for row in page['rows']])
+
+    def test_search_and_sort(self):
+        page = self.table.get_page(page_size=-1, sort_column=3, ascending=False, search='a')
+        self.assertEqual(['SEA', 'LAX', 'AUS', 'ANC'], [row[1] for row in page['rows']])
+
+    def test_request_page_message(self):
+        sent = []
+        self.table.send = sent.append
+        self.table._handle_custom_msg(self.table, {'method': 'request_page', 'data': {'page': 2, 'request_id': 3}},
+                                      [])
+        self.assertEqual(1, len(sent))
+        self.assertEqual('page', sent[0]['method'])
+        self.assertEqual(3, sent[0]['data']['request_id'])
+        self.assertEqual([['5', 'ANC', '3', 'Anchorage']], sent[0]['data']['rows'])
+
+    def test_append_rows(self):
+        page = self.table.get_page(page_size=-1, sort_column=1, search='a')
+        self.assertEqual(['ANC', 'AUS', 'LAX', 'SEA'], [row[1] for row in page['rows']])
+        batch = pd.DataFrame({'#': [6, 7], 'code': ['BOS', 'ATL'], 'runways': ['6', '5'], 'desc': ['Boston', 'Atlanta']})
+        self.table.append_rows(batch)
+        self.assertEqual(7, self.table.total_rows)
+        page = self.table.get_page(page=3)
+        self.assertEqual([['7', 'ATL', '5', 'Atlanta']], page['rows'])
+        page = self.table.get_page(page_size=-1, sort_column=1, search='a')
+        self.assertEqual(['ANC', 'ATL', 'AUS', 'LAX', 'SEA'], [row[1] for row in page['rows']])